@@ -0,0 +1,61 @@
+"""Hourly provider metrics rollup
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Provider metrics hourly rollup
+    op.create_table(
+        "provider_metrics_hourly",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("hour", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("stt_provider", sa.String(20), nullable=False),
+        sa.Column("tts_provider", sa.String(20), nullable=False),
+        sa.Column("language", sa.String(5), nullable=False),
+        sa.Column("turn_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("correction_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("confidence_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("confidence_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("stt_latency_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("stt_latency_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tts_latency_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("tts_latency_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("stt_latency_buckets", postgresql.JSONB(), server_default="{}"),
+        sa.Column("tts_latency_buckets", postgresql.JSONB(), server_default="{}"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint(
+            "hour", "stt_provider", "tts_provider", "language", name="uq_metrics_hourly_key"
+        ),
+    )
+    op.create_index("idx_provider_metrics_hourly_hour", "provider_metrics_hourly", ["hour"])
+
+    # Rollup watermarks
+    op.create_table(
+        "metrics_rollup_state",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    # The compactor scans turns by time
+    op.create_index("idx_turns_timestamp", "turns", ["timestamp"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_turns_timestamp", table_name="turns")
+    op.drop_table("metrics_rollup_state")
+    op.drop_table("provider_metrics_hourly")
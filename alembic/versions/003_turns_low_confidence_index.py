@@ -0,0 +1,30 @@
+"""Index for the low-confidence conversation filter
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # EXISTS (low-confidence turn in conversation) lookups
+    op.create_index(
+        "idx_turns_conversation_low_confidence",
+        "turns",
+        ["conversation_id"],
+        postgresql_where=sa.text("low_confidence = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_turns_conversation_low_confidence", table_name="turns")
@@ -0,0 +1,34 @@
+"""Composite indexes for keyset pagination of admin lists
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (sort key, id) seeks; the composites supersede the single-column indexes
+    op.create_index("idx_users_created_at_id", "users", ["created_at", "id"])
+    op.create_index("idx_conversations_started_at_id", "conversations", ["started_at", "id"])
+    op.drop_index("idx_conversations_started_at", table_name="conversations")
+    op.create_index("idx_unknown_terms_occurrence_id", "unknown_terms", ["occurrence_count", "id"])
+    op.create_index("idx_audit_logs_created_at_id", "audit_logs", ["created_at", "id"])
+    op.drop_index("idx_audit_logs_created_at", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index("idx_audit_logs_created_at", "audit_logs", ["created_at"])
+    op.drop_index("idx_audit_logs_created_at_id", table_name="audit_logs")
+    op.drop_index("idx_unknown_terms_occurrence_id", table_name="unknown_terms")
+    op.create_index("idx_conversations_started_at", "conversations", ["started_at"])
+    op.drop_index("idx_conversations_started_at_id", table_name="conversations")
+    op.drop_index("idx_users_created_at_id", table_name="users")
@@ -0,0 +1,35 @@
+"""Per-conversation turn number counter
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "conversations",
+        sa.Column("next_turn_number", sa.Integer(), nullable=False, server_default="1"),
+    )
+    # Existing conversations continue after their highest turn number
+    op.execute(
+        """
+        UPDATE conversations SET next_turn_number = 1 + COALESCE(
+            (SELECT MAX(turn_number) FROM turns WHERE turns.conversation_id = conversations.id), 0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("conversations", "next_turn_number")
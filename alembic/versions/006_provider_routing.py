@@ -0,0 +1,38 @@
+"""Provider routing: per-user allowed providers, per-turn serving providers
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("allowed_providers", sa.JSON(), nullable=True))
+    op.add_column("turns", sa.Column("stt_provider", sa.String(20), nullable=True))
+    op.add_column("turns", sa.Column("tts_provider", sa.String(20), nullable=True))
+    # Before routing every turn was served by its conversation's providers
+    op.execute(
+        """
+        UPDATE turns SET
+            stt_provider = (SELECT stt_provider_used FROM conversations WHERE conversations.id = turns.conversation_id),
+            tts_provider = CASE WHEN audio_output_url IS NOT NULL THEN
+                (SELECT tts_provider_used FROM conversations WHERE conversations.id = turns.conversation_id)
+            END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("turns", "tts_provider")
+    op.drop_column("turns", "stt_provider")
+    op.drop_column("users", "allowed_providers")
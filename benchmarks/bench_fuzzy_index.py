@@ -0,0 +1,112 @@
+"""Benchmark fuzzy dictionary lookup: linear scan vs BK-tree vs SymSpell.
+
+Usage:
+    python benchmarks/bench_fuzzy_index.py
+    python benchmarks/bench_fuzzy_index.py --sizes 10000 100000 --kinds bktree symspell
+
+Reports build time and mean lookup time for words one or two edits away from
+a dictionary term, plus misses; --memory adds the tracemalloc build peak.
+
+SymSpell trades memory for lookup speed (roughly 7 KB per term at
+max_distance=2), so the 1M run needs several GB of RAM for that kind.
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.fuzzy_index import build_fuzzy_index
+
+ALPHABET = "абвгдежзийклмнопрстуфхцчшщыьэюя"
+
+
+def make_terms(count: int, rng: random.Random) -> list[str]:
+    terms: set[str] = set()
+    while len(terms) < count:
+        terms.add("".join(rng.choices(ALPHABET, k=rng.randint(4, 12))))
+    return list(terms)
+
+
+def perturb(word: str, edits: int, rng: random.Random) -> str:
+    chars = list(word)
+    for _ in range(edits):
+        op = rng.choice(("sub", "ins", "del")) if len(chars) > 1 else "ins"
+        pos = rng.randrange(len(chars))
+        if op == "sub":
+            chars[pos] = rng.choice(ALPHABET)
+        elif op == "ins":
+            chars.insert(pos, rng.choice(ALPHABET))
+        else:
+            del chars[pos]
+    return "".join(chars)
+
+
+def measure_memory(kind: str, terms: list[str], max_distance: int) -> float:
+    """Peak MB allocated while building an index.
+
+    Kept apart from the timing run: lookups on an index built under
+    tracemalloc are an order of magnitude slower.
+    """
+    tracemalloc.start()
+    index = build_fuzzy_index(kind, terms, max_distance)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    return peak / 2**20
+
+
+def bench(kind: str, terms: list[str], queries: list[str], max_distance: int) -> dict:
+    started = time.perf_counter()
+    index = build_fuzzy_index(kind, terms, max_distance)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    hits = sum(index.search(q, max_distance) is not None for q in queries)
+    lookup_seconds = time.perf_counter() - started
+
+    return {
+        "build_s": build_seconds,
+        "lookup_us": lookup_seconds / len(queries) * 1e6,
+        "hits": hits,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--kinds", nargs="+", default=["linear", "bktree", "symspell"])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--max-distance", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--memory", action="store_true", help="also report build memory (slow)")
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'kind':>9} {'build s':>9} {'mem MB':>9} {'lookup us':>11} {'hits':>6}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        terms = make_terms(size, rng)
+        queries = [
+            perturb(rng.choice(terms), rng.randint(1, args.max_distance), rng)
+            for _ in range(args.queries)
+        ]
+        queries += ["".join(rng.choices(ALPHABET, k=10)) for _ in range(args.queries // 4)]
+
+        for kind in args.kinds:
+            result = bench(kind, terms, queries, args.max_distance)
+            memory = (
+                f"{measure_memory(kind, terms, args.max_distance):>9.1f}" if args.memory
+                else f"{'-':>9}"
+            )
+            print(
+                f"{size:>9} {kind:>9} {result['build_s']:>9.2f} {memory} "
+                f"{result['lookup_us']:>11.1f} {result['hits']:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark event-loop lag while uploading audio concurrently.
+
+Usage:
+    python benchmarks/bench_storage_event_loop.py
+    python benchmarks/bench_storage_event_loop.py --backend s3 --endpoint-url http://localhost:9000
+
+Runs N concurrent uploads through StorageService and, for comparison,
+through the old inline blocking calls (write_bytes / put_object on the
+loop). A ticker coroutine sleeps 5 ms at a time and records how late it
+wakes up; with non-blocking storage that lag should stay flat as the
+number of uploads grows.
+
+The s3 backend needs a MinIO endpoint (--endpoint-url) or, without one,
+moto's server mode (pip install "moto[server]").
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+TICK_SECONDS = 0.005
+
+storage_module = None  # src.services.storage, imported once settings env is set
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append((loop.time() - start - TICK_SECONDS) * 1000)
+
+
+async def blocking_upload(storage, key: str, audio: bytes) -> None:
+    """The pre-change behaviour: blocking I/O inside the coroutine."""
+    if storage.use_local:
+        path = Path(storage_module.LOCAL_STORAGE_DIR) / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(audio)
+    else:
+        storage.client.put_object(Bucket=storage.bucket, Key=key, Body=audio, ContentType="audio/wav")
+
+
+async def run(mode: str, storage, uploads: int, audio: bytes) -> tuple[list[float], float]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(TICK_SECONDS * 4)
+
+    start = time.perf_counter()
+    if mode == "blocking":
+        jobs = [blocking_upload(storage, f"bench/{mode}/{i}.wav", audio) for i in range(uploads)]
+    else:
+        jobs = [storage.upload_research_audio(audio, "bench", f"{mode}-{i}") for i in range(uploads)]
+    await asyncio.gather(*jobs)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await tick
+    return lags, elapsed
+
+
+def report(mode: str, lags: list[float], elapsed: float) -> None:
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{mode:>9}  wall {elapsed * 1000:8.1f} ms  ticks {len(lags):5d}  "
+        f"lag p50 {statistics.median(lags):7.2f} ms  p99 {p99:7.2f} ms  max {lags[-1]:7.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("local", "s3"), default="local")
+    parser.add_argument("--endpoint-url", help="S3/MinIO endpoint for --backend s3")
+    parser.add_argument("--uploads", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--size-kb", type=int, default=320, help="Audio size (320 KB ~ 10 s of 16 kHz WAV)")
+    args = parser.parse_args()
+
+    moto_server = None
+    if args.backend == "s3":
+        endpoint = args.endpoint_url
+        if endpoint is None:
+            from moto.server import ThreadedMotoServer
+
+            logging.getLogger("werkzeug").setLevel(logging.ERROR)
+            moto_server = ThreadedMotoServer(port=0)
+            moto_server.start()
+            host, port = moto_server.get_host_and_port()
+            endpoint = f"http://{host}:{port}"
+        os.environ["S3_ENDPOINT_URL"] = endpoint
+        os.environ.setdefault("S3_ACCESS_KEY", "minioadmin")
+        os.environ.setdefault("S3_SECRET_KEY", "minioadmin")
+    else:
+        # Nothing listens here, so StorageService falls back to local files
+        os.environ["S3_ENDPOINT_URL"] = "http://127.0.0.1:9"
+
+    global storage_module
+    from src.services import storage as storage_module
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_module.LOCAL_STORAGE_DIR = Path(tmp)
+        storage = storage_module.StorageService()
+        if args.backend == "s3":
+            if storage.use_local:
+                try:
+                    storage.client.create_bucket(Bucket=storage.bucket)
+                except Exception as e:
+                    sys.exit(f"Cannot reach S3 at {os.environ['S3_ENDPOINT_URL']}: {e}")
+                storage.use_local = False
+
+        audio = os.urandom(args.size_kb * 1024)
+        print(f"backend={args.backend} size={args.size_kb} KB io_threads={storage.settings.storage_io_threads}")
+        for uploads in args.uploads:
+            print(f"-- {uploads} concurrent uploads")
+            for mode in ("blocking", "async"):
+                report(mode, *asyncio.run(run(mode, storage, uploads, audio)))
+
+    if moto_server is not None:
+        moto_server.stop()
+
+
+if __name__ == "__main__":
+    main()
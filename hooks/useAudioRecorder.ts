@@ -1,10 +1,14 @@
 /**
  * Hook for recording audio using MediaRecorder API.
+ * The recording is uploaded as 16 kHz mono 16-bit PCM WAV, the format the
+ * backend analyses for silence before speech recognition.
  * Validates: Requirements 1.1, 1.2
  */
 
 import { useState, useRef, useCallback } from 'react';
 
+const SAMPLE_RATE = 16000;
+
 interface UseAudioRecorderReturn {
   isRecording: boolean;
   audioBlob: Blob | null;
@@ -13,6 +17,60 @@ interface UseAudioRecorderReturn {
   error: string | null;
 }
 
+/**
+ * Decode a MediaRecorder recording and resample it to 16 kHz mono.
+ */
+async function decodeToMono(recording: Blob): Promise<Float32Array> {
+  const context = new AudioContext();
+  try {
+    const decoded = await context.decodeAudioData(await recording.arrayBuffer());
+    const length = Math.ceil(decoded.duration * SAMPLE_RATE);
+    const offline = new OfflineAudioContext(1, Math.max(1, length), SAMPLE_RATE);
+    const source = offline.createBufferSource();
+    source.buffer = decoded;
+    source.connect(offline.destination);
+    source.start();
+    const rendered = await offline.startRendering();
+    return rendered.getChannelData(0);
+  } finally {
+    await context.close();
+  }
+}
+
+/**
+ * Encode mono samples in [-1, 1] as a 16-bit PCM WAV file.
+ */
+function encodeWav(samples: Float32Array, sampleRate: number): Blob {
+  const buffer = new ArrayBuffer(44 + samples.length * 2);
+  const view = new DataView(buffer);
+  const writeString = (offset: number, value: string) => {
+    for (let i = 0; i < value.length; i++) {
+      view.setUint8(offset + i, value.charCodeAt(i));
+    }
+  };
+
+  writeString(0, 'RIFF');
+  view.setUint32(4, 36 + samples.length * 2, true);
+  writeString(8, 'WAVE');
+  writeString(12, 'fmt ');
+  view.setUint32(16, 16, true); // fmt chunk size
+  view.setUint16(20, 1, true); // PCM
+  view.setUint16(22, 1, true); // mono
+  view.setUint32(24, sampleRate, true);
+  view.setUint32(28, sampleRate * 2, true); // byte rate
+  view.setUint16(32, 2, true); // block align
+  view.setUint16(34, 16, true); // bits per sample
+  writeString(36, 'data');
+  view.setUint32(40, samples.length * 2, true);
+
+  for (let i = 0; i < samples.length; i++) {
+    const sample = Math.max(-1, Math.min(1, samples[i]));
+    view.setInt16(44 + i * 2, sample < 0 ? sample * 0x8000 : sample * 0x7fff, true);
+  }
+
+  return new Blob([buffer], { type: 'audio/wav' });
+}
+
 export function useAudioRecorder(): UseAudioRecorderReturn {
   const [isRecording, setIsRecording] = useState(false);
   const [audioBlob, setAudioBlob] = useState<Blob | null>(null);
@@ -30,13 +88,14 @@ export function useAudioRecorder(): UseAudioRecorderReturn {
         audio: {
           echoCancellation: true,
           noiseSuppression: true,
-          sampleRate: 16000,
+          sampleRate: SAMPLE_RATE,
         } 
       });
 
-      const mediaRecorder = new MediaRecorder(stream, {
-        mimeType: 'audio/webm;codecs=opus',
-      });
+      // Whatever container the browser records is decoded to WAV on stop
+      const mediaRecorder = MediaRecorder.isTypeSupported('audio/webm;codecs=opus')
+        ? new MediaRecorder(stream, { mimeType: 'audio/webm;codecs=opus' })
+        : new MediaRecorder(stream);
 
       mediaRecorder.ondataavailable = (event) => {
         if (event.data.size > 0) {
@@ -56,21 +115,28 @@ export function useAudioRecorder(): UseAudioRecorderReturn {
   const stopRecording = useCallback(async (): Promise<Blob> => {
     return new Promise((resolve, reject) => {
       const mediaRecorder = mediaRecorderRef.current;
-      
+
       if (!mediaRecorder) {
         reject(new Error('No active recording'));
         return;
       }
-
-      mediaRecorder.onstop = () => {
-        const blob = new Blob(chunksRef.current, { type: 'audio/webm' });
-        setAudioBlob(blob);
+      
+      mediaRecorder.onstop = async () => {
         setIsRecording(false);
-        
+
         // Stop all tracks
         mediaRecorder.stream.getTracks().forEach(track => track.stop());
-        
-        resolve(blob);
+
+        try {
+          const recording = new Blob(chunksRef.current, { type: mediaRecorder.mimeType });
+          const blob = encodeWav(await decodeToMono(recording), SAMPLE_RATE);
+          setAudioBlob(blob);
+          resolve(blob);
+        } catch (err) {
+          setError('Не удалось обработать запись');
+          console.error('Error encoding recording:', err);
+          reject(err);
+        }
       };
 
       mediaRecorder.stop();
@@ -88,6 +88,27 @@ export const voiceApi = {
     return response.data;
   },
 
+  // Chunked MP3 of the reply; playback can start before synthesis finishes
+  streamResponse: async (
+    sessionId: string,
+    turnId: string,
+    assistantText: string
+  ): Promise<ReadableStream<Uint8Array>> => {
+    const token = localStorage.getItem('token');
+    const response = await fetch(`${API_URL}/api/voice/respond/${sessionId}/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(token ? { Authorization: `Bearer ${token}` } : {}),
+      },
+      body: JSON.stringify({ turn_id: turnId, assistant_text: assistantText }),
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Streaming response failed: ${response.status}`);
+    }
+    return response.body;
+  },
+
   endSession: async (sessionId: string): Promise<void> => {
     await api.post(`/api/voice/end/${sessionId}`);
   },
@@ -176,6 +197,17 @@ export interface ProviderMetrics {
   avg_stt_latency_ms: number;
   avg_tts_latency_ms: number;
   correction_rate: number;
+  wer: number | null;
+  cer: number | null;
+}
+
+export interface LatencyPercentiles {
+  stage: 'stt' | 'tts';
+  provider: string;
+  count: number;
+  p50: number | null;
+  p95: number | null;
+  p99: number | null;
 }
 
 export interface ConversationFilter {
@@ -184,6 +216,14 @@ export interface ConversationFilter {
   date_from?: string;
   date_to?: string;
   low_confidence?: boolean;
+  limit?: number;
+  cursor?: string;
+}
+
+// Admin lists are keyset-paginated; pass nextCursor back as `cursor`
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
 }
 
 // Admin API
@@ -208,6 +248,11 @@ export const adminApi = {
     return response.data;
   },
 
+  getConversationsPage: async (filter?: ConversationFilter): Promise<Page<Conversation>> => {
+    const response = await api.get('/api/admin/conversations', { params: filter });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
+  },
+
   getConversation: async (id: string): Promise<ConversationDetails> => {
     const response = await api.get(`/api/admin/conversations/${id}`);
     return response.data;
@@ -239,8 +284,13 @@ export const adminApi = {
   },
 
   // Analytics
-  getAnalytics: async (): Promise<{ metrics: ProviderMetrics[]; top_unknown_terms: { term: string; count: number }[] }> => {
-    const response = await api.get('/api/admin/analytics');
+  getAnalytics: async (days = 30): Promise<{ metrics: ProviderMetrics[]; top_unknown_terms: { term: string; count: number }[] }> => {
+    const response = await api.get('/api/admin/analytics', { params: { days } });
+    return response.data;
+  },
+
+  getLatencyPercentiles: async (days = 7): Promise<{ start: string; end: string; relative_error: number; latency: LatencyPercentiles[] }> => {
+    const response = await api.get('/api/admin/analytics/latency', { params: { days } });
     return response.data;
   },
 };
@@ -0,0 +1,359 @@
+"""Process-wide registry of STT/TTS adapters.
+
+Adapters are created once per provider and settings, and share one HTTP
+connection pool per provider, so warm (HTTP/2) connections are reused across
+requests instead of paying a TLS handshake on every turn.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import partial
+from typing import Literal, Optional
+
+import httpx
+
+from src.adapters.resilience import CircuitBreaker, ResilientSTTAdapter, ResilientTTSAdapter, RetryPolicy
+from src.adapters.router import MonitoredSTTAdapter, MonitoredTTSAdapter, ProviderRouter
+from src.adapters.stt.base import STTAdapter
+from src.adapters.stt.caching import CachingSTTAdapter, STTResultCache
+from src.adapters.stt.hedged import HedgedSTTAdapter
+from src.adapters.tts.base import TTSAdapter
+from src.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PoolStats:
+    """Usage counters for a provider HTTP connection pool."""
+
+    max_connections: int
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_requests: int = 0
+    failed_requests: int = 0
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of the connection limit currently in use."""
+        return self.in_flight / self.max_connections if self.max_connections else 0.0
+
+    @property
+    def peak_saturation(self) -> float:
+        """Highest fraction of the connection limit used so far."""
+        return self.peak_in_flight / self.max_connections if self.max_connections else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "total_requests": self.total_requests,
+            "failed_requests": self.failed_requests,
+            "saturation": round(self.saturation, 4),
+            "peak_saturation": round(self.peak_saturation, 4),
+        }
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Response body that reports when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that tracks in-flight requests for PoolStats.
+
+    A request stays in flight until its response body is closed, so
+    streamed bodies count for as long as they hold the connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, stats: PoolStats):
+        self._transport = transport
+        self._stats = stats
+
+    def _release(self) -> None:
+        self._stats.in_flight -= 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stats = self._stats
+        stats.total_requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                stats.failed_requests += 1
+            self._release()
+            raise
+        response.stream = _CountingStream(response.stream, self._release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class AdapterRegistry:
+    """Registry that owns long-lived adapters and their HTTP clients.
+
+    Created in the application lifespan and closed on shutdown.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
+        self._stt: dict[tuple, STTAdapter] = {}
+        self._stt_uncached: dict[tuple, STTAdapter] = {}
+        self._hedged: dict[tuple, HedgedSTTAdapter] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._tts: dict[tuple, TTSAdapter] = {}
+        self._clients: dict[tuple, httpx.AsyncClient] = {}
+        self._pool_stats: dict[str, PoolStats] = {}
+        self.router = ProviderRouter(
+            enabled=self.settings.provider_routing_enabled,
+            window_seconds=self.settings.provider_routing_window_seconds,
+            min_samples=self.settings.provider_routing_min_samples,
+            max_error_rate=self.settings.provider_routing_max_error_rate,
+            max_p90_latency_ms=self.settings.provider_routing_max_p90_latency_ms,
+            rate_limit_cooldown_seconds=self.settings.provider_routing_rate_limit_cooldown_seconds,
+        )
+        self._stt_cache: Optional[STTResultCache] = None
+        if self.settings.stt_cache_enabled:
+            self._stt_cache = STTResultCache(
+                max_entries=self.settings.stt_cache_max_entries,
+                redis_url=self.settings.redis_url if self.settings.stt_cache_redis else None,
+                redis_ttl_seconds=self.settings.stt_cache_redis_ttl_seconds,
+            )
+
+    def _settings_key(self, provider: str) -> tuple:
+        """Settings that affect how an adapter for provider is built."""
+        s = self.settings
+        key: tuple = (
+            s.provider_http_max_connections,
+            s.provider_http_max_keepalive_connections,
+            s.provider_http_keepalive_expiry,
+            s.provider_http2,
+            s.provider_http_timeout_seconds,
+            s.provider_http_connect_timeout_seconds,
+        )
+        if provider == "openai":
+            key += (s.openai_api_key,)
+        elif provider == "google":
+            key += (s.google_api_key,)
+        return key
+
+    def _http_client(self, provider: str) -> httpx.AsyncClient:
+        """Get the shared HTTP client for a provider, creating it on first use."""
+        key = (provider, self._settings_key(provider))
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        s = self.settings
+        limits = httpx.Limits(
+            max_connections=s.provider_http_max_connections,
+            max_keepalive_connections=s.provider_http_max_keepalive_connections,
+            keepalive_expiry=s.provider_http_keepalive_expiry,
+        )
+        http2 = s.provider_http2 and _http2_available()
+        if s.provider_http2 and not http2:
+            logger.warning("h2 is not installed, %s pool falls back to HTTP/1.1", provider)
+
+        stats = self._pool_stats.setdefault(
+            provider, PoolStats(max_connections=s.provider_http_max_connections)
+        )
+        transport = _CountingTransport(
+            httpx.AsyncHTTPTransport(http2=http2, limits=limits), stats
+        )
+        # Default for every call; adapters may pass a tighter per-call timeout
+        timeout = httpx.Timeout(
+            s.provider_http_timeout_seconds, connect=s.provider_http_connect_timeout_seconds
+        )
+        client = httpx.AsyncClient(transport=transport, timeout=timeout)
+        self._clients[key] = client
+        return client
+
+    def get_stt_adapter(
+        self,
+        provider: Literal["openai", "google"],
+        hedged: bool = True,
+        cached: bool = True,
+        allowed: Optional[list[str]] = None,
+    ) -> STTAdapter:
+        """Get the shared STT adapter for provider (behind the result cache).
+        
+        Args:
+            provider: Provider name
+            hedged: Hedge slow requests with the other provider when
+                STT_HEDGING_ENABLED is on; provider comparisons pass False
+                so every result comes from the provider asked
+            cached: Serve repeated audio from the result cache; provider
+                comparisons pass False, since a hit carries the latency of
+                the original request, not of a new one. Implies unhedged.
+            allowed: Providers a hedged request may also be sent to; None
+                for any
+        """
+        key = (provider, self._settings_key(provider))
+        if not cached:
+            self.get_stt_adapter(provider, hedged=False)
+            return self._stt_uncached[key]
+        if hedged and self.settings.stt_hedging_enabled:
+            adapter = self._hedged.get(key)
+            if adapter is None:
+                adapter = HedgedSTTAdapter(
+                    self.get_stt_adapter(provider, hedged=False),
+                    partial(self._hedge_partner, provider),
+                    min_confidence=self.settings.stt_hedge_min_confidence,
+                    quantile=self.settings.stt_hedge_quantile,
+                    initial_delay_ms=self.settings.stt_hedge_initial_delay_ms,
+                )
+                self._hedged[key] = adapter
+            return adapter if allowed is None else adapter.allowing(allowed)
+
+        adapter = self._stt.get(key)
+        if adapter is None:
+            # Cache hits are not provider requests: monitor inside the cache
+            adapter = ResilientSTTAdapter(
+                self._build_stt_adapter(provider),
+                self._retry_policy(self.settings.provider_stt_deadline_seconds, provider),
+                self._breaker(f"stt:{provider}"),
+            )
+            adapter = MonitoredSTTAdapter(adapter, self.router)
+            self._stt_uncached[key] = adapter
+            if self._stt_cache is not None:
+                adapter = CachingSTTAdapter(adapter, self._stt_cache)
+            self._stt[key] = adapter
+        return adapter
+
+    def _hedge_partner(self, provider: str, allowed: Optional[list[str]]) -> Optional[STTAdapter]:
+        """Fastest healthy allowed provider to hedge provider with, if any."""
+        partners = self.router.alternatives("stt", provider, allowed)
+        return self.get_stt_adapter(partners[0], hedged=False) if partners else None
+
+    def get_tts_adapter(self, provider: Literal["openai", "google"]) -> TTSAdapter:
+        """Get the shared TTS adapter for provider."""
+        key = (provider, self._settings_key(provider))
+        adapter = self._tts.get(key)
+        if adapter is None:
+            adapter = ResilientTTSAdapter(
+                self._build_tts_adapter(provider),
+                self._retry_policy(self.settings.provider_tts_deadline_seconds, provider),
+                self._breaker(f"tts:{provider}"),
+            )
+            adapter = MonitoredTTSAdapter(adapter, self.router)
+            self._tts[key] = adapter
+        return adapter
+
+    def _retry_policy(self, deadlines: dict[str, float], provider: str) -> RetryPolicy:
+        s = self.settings
+        return RetryPolicy(
+            deadline_seconds=deadlines.get(provider, 30.0),
+            max_attempts=s.provider_retry_max_attempts,
+            base_delay_seconds=s.provider_retry_base_delay_ms / 1000,
+            max_delay_seconds=s.provider_retry_max_delay_ms / 1000,
+        )
+
+    def _breaker(self, name: str) -> CircuitBreaker:
+        """Get the circuit breaker for "stt:openai" etc.; kept across adapter rebuilds."""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(
+                failure_threshold=self.settings.provider_breaker_failure_threshold,
+                reset_timeout_seconds=self.settings.provider_breaker_reset_seconds,
+            )
+        return breaker
+
+    def _build_stt_adapter(self, provider: str) -> STTAdapter:
+        if provider == "openai":
+            from src.adapters.stt.openai_adapter import OpenAISTTAdapter
+            return OpenAISTTAdapter(
+                api_key=self.settings.openai_api_key or None,
+                http_client=self._http_client(provider),
+            )
+        elif provider == "google":
+            from src.adapters.stt.google_adapter import GoogleSTTAdapter
+            return GoogleSTTAdapter()
+        else:
+            raise ValueError(f"Unknown STT provider: {provider}")
+
+    def _build_tts_adapter(self, provider: str) -> TTSAdapter:
+        if provider == "openai":
+            from src.adapters.tts.openai_adapter import OpenAITTSAdapter
+            return OpenAITTSAdapter(
+                api_key=self.settings.openai_api_key or None,
+                http_client=self._http_client(provider),
+            )
+        elif provider == "google":
+            from src.adapters.tts.google_adapter import GoogleTTSAdapter
+            return GoogleTTSAdapter()
+        else:
+            raise ValueError(f"Unknown TTS provider: {provider}")
+
+    def stats(self) -> dict:
+        """Connection pool usage, STT cache hits, hedging, routing and circuit breakers."""
+        return {
+            "adapters": {
+                "stt": sorted({key[0] for key in self._stt}),
+                "tts": sorted({key[0] for key in self._tts}),
+            },
+            "pools": {name: stats.to_dict() for name, stats in self._pool_stats.items()},
+            "stt_cache": self._stt_cache.stats.to_dict() if self._stt_cache else None,
+            "stt_hedging": {key[0]: adapter.stats.to_dict() for key, adapter in self._hedged.items()},
+            "routing": self.router.stats(),
+            "breakers": {name: breaker.to_dict() for name, breaker in self._breakers.items()},
+        }
+
+    async def aclose(self) -> None:
+        """Close all HTTP clients and drop cached adapters."""
+        for client in self._clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close provider HTTP client: {e}")
+        self._clients.clear()
+        self._stt.clear()
+        self._hedged.clear()
+        self._tts.clear()
+        if self._stt_cache is not None:
+            await self._stt_cache.aclose()
+
+
+_registry: Optional[AdapterRegistry] = None
+
+
+def get_adapter_registry() -> AdapterRegistry:
+    """Get the process-wide adapter registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = AdapterRegistry()
+    return _registry
+
+
+async def close_adapter_registry() -> None:
+    """Close the process-wide adapter registry (application shutdown)."""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
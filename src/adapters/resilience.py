@@ -0,0 +1,298 @@
+"""Deadlines, retries and circuit breaking for provider adapters.
+
+A provider brownout used to pin a request worker for the full client
+timeout on every turn. The Resilient* wrappers bound each call by a
+per-provider deadline, retry transient failures (timeouts, rate limits,
+5xx, connection errors) with jittered exponential backoff inside that
+deadline, and keep a circuit breaker per provider: after consecutive
+failures it opens and calls fail fast with a CircuitOpen error until a
+half-open probe succeeds.
+
+Validates: Requirements 3.4, 3.5, 12.1, 12.2
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal, Optional, TypeVar
+
+from src.adapters.stt.base import (
+    STTAdapter,
+    STTCircuitOpenError,
+    STTError,
+    STTInvalidAudioError,
+    STTRateLimitError,
+    STTResult,
+    STTStreamResult,
+    STTTimeoutError,
+)
+from src.adapters.tts.base import (
+    TTSAdapter,
+    TTSCircuitOpenError,
+    TTSError,
+    TTSRateLimitError,
+    TTSResult,
+    TTSTextTooLongError,
+    TTSTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed provider call may succeed if repeated.
+
+    Timeouts, rate limits, 5xx responses and transport errors are
+    transient; bad input and other 4xx responses are not.
+    """
+    if isinstance(error, (STTTimeoutError, STTRateLimitError, TTSTimeoutError, TTSRateLimitError)):
+        return True
+    if isinstance(error, (STTInvalidAudioError, TTSTextTooLongError, STTCircuitOpenError, TTSCircuitOpenError)):
+        return False
+    if isinstance(error, (STTError, TTSError)):
+        status_code = error.details.get("status_code")
+        return status_code is None or status_code >= 500
+    return isinstance(error, Exception)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout_seconds:
+            self._state = HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go to the provider now.
+
+        While half-open only one probe is let through at a time.
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self) -> None:
+        """Forget an unfinished call (cancelled), freeing the probe slot."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        self._state = CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                self.times_opened += 1
+            self._state = OPEN
+            self._opened_at = self._clock()
+            self._probing = False
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Deadline and backoff for one provider."""
+
+    deadline_seconds: float = 20.0
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.2
+    max_delay_seconds: float = 2.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number attempt (1-based)."""
+        return random.uniform(0, min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)))
+
+
+async def call_with_resilience(
+    call: Callable[[], Awaitable[T]],
+    provider: str,
+    breaker: CircuitBreaker,
+    policy: RetryPolicy,
+    timeout_error: type,
+    open_error: type,
+) -> T:
+    """Run a provider call under the breaker, deadline and retry policy.
+
+    Args:
+        call: Makes one provider request
+        provider: Provider name, for errors
+        breaker: The provider's circuit breaker
+        policy: Deadline and backoff
+        timeout_error: Error raised when the deadline passes (STT or TTS)
+        open_error: Error raised when the breaker rejects the first attempt
+
+    Raises:
+        open_error: If the circuit is open
+        timeout_error: If the deadline passes
+        The last provider error, once retries are exhausted
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + policy.deadline_seconds
+    last_error: Optional[BaseException] = None
+
+    for attempt in range(1, policy.max_attempts + 1):
+        if not breaker.allow():
+            if last_error is not None:
+                raise last_error
+            raise open_error(message="Circuit open, provider unavailable", provider=provider)
+
+        try:
+            async with asyncio.timeout_at(deadline):
+                result = await call()
+        except asyncio.CancelledError:
+            # e.g. the losing side of a hedged request
+            breaker.release()
+            raise
+        except TimeoutError as e:
+            breaker.record_failure()
+            raise timeout_error(
+                message="Deadline exceeded",
+                provider=provider,
+                details={"deadline_seconds": policy.deadline_seconds, "attempts": attempt},
+            ) from e
+        except Exception as e:
+            if not is_retryable(e):
+                # Our request was bad; says nothing about provider health
+                breaker.release()
+                raise
+            breaker.record_failure()
+            last_error = e
+            delay = policy.backoff(attempt)
+            if attempt == policy.max_attempts or loop.time() + delay >= deadline:
+                raise
+            logger.info(f"Retrying {provider} after {e!r} (attempt {attempt}) in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        breaker.record_success()
+        return result
+
+    raise last_error  # max_attempts < 1
+
+
+class ResilientSTTAdapter(STTAdapter):
+    """STT adapter wrapper with deadline, retries and a circuit breaker."""
+
+    def __init__(self, adapter: STTAdapter, policy: RetryPolicy, breaker: CircuitBreaker):
+        self.adapter = adapter
+        self.policy = policy
+        self.breaker = breaker
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        return await call_with_resilience(
+            lambda: self.adapter.transcribe(audio, language=language, hints=hints),
+            self.adapter.get_provider_name(),
+            self.breaker,
+            self.policy,
+            STTTimeoutError,
+            STTCircuitOpenError,
+        )
+
+    async def transcribe_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+        partial_every: int = 10,
+    ) -> AsyncIterator[STTStreamResult]:
+        # A consumed stream can't be retried, but it still goes through the breaker
+        if not self.breaker.allow():
+            raise STTCircuitOpenError(
+                message="Circuit open, provider unavailable",
+                provider=self.adapter.get_provider_name(),
+            )
+        try:
+            async for event in self.adapter.transcribe_stream(
+                chunks, language=language, hints=hints, partial_every=partial_every
+            ):
+                yield event
+        except Exception as e:
+            if is_retryable(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.release()
+            raise
+        except BaseException:
+            # Cancelled, or the consumer stopped iterating early
+            self.breaker.release()
+            raise
+        else:
+            self.breaker.record_success()
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
+
+
+class ResilientTTSAdapter(TTSAdapter):
+    """TTS adapter wrapper with deadline, retries and a circuit breaker."""
+
+    def __init__(self, adapter: TTSAdapter, policy: RetryPolicy, breaker: CircuitBreaker):
+        self.adapter = adapter
+        self.policy = policy
+        self.breaker = breaker
+
+    async def synthesize(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> TTSResult:
+        return await call_with_resilience(
+            lambda: self.adapter.synthesize(text, language=language, voice=voice, speed=speed),
+            self.adapter.get_provider_name(),
+            self.breaker,
+            self.policy,
+            TTSTimeoutError,
+            TTSCircuitOpenError,
+        )
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
@@ -0,0 +1,361 @@
+"""Latency- and error-aware provider routing.
+
+Users pick an STT and a TTS provider, but a provider can brown out
+(timeouts, 429s) for minutes at a time. The router keeps a sliding window
+of latency, error and rate-limit signals per provider, recorded by the
+Monitored* adapter wrappers the registry builds, and sends a user's
+traffic to another allowed provider while theirs is degraded. Decisions
+are logged and the provider that served each turn is stored on it, so
+the comparison analytics stay attributable.
+
+Validates: Requirements 3.4, 3.5, 3.6
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+from typing import Literal, Optional
+
+from src.adapters.resilience import is_retryable
+from src.adapters.stt.base import (
+    STTAdapter,
+    STTCircuitOpenError,
+    STTRateLimitError,
+    STTResult,
+    STTStreamResult,
+    STTTimeoutError,
+)
+from src.adapters.tts.base import (
+    TTSAdapter,
+    TTSCircuitOpenError,
+    TTSRateLimitError,
+    TTSResult,
+    TTSTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = ("openai", "google")
+
+Kind = Literal["stt", "tts"]
+
+
+@dataclass(frozen=True)
+class _Sample:
+    at: float
+    latency_ms: Optional[float]  # None for failed requests
+    rate_limited: bool
+    circuit_open: bool = False
+
+
+@dataclass(frozen=True)
+class ProviderHealth:
+    """Snapshot of one provider's recent requests."""
+
+    requests: int
+    error_rate: float
+    timeouts: int
+    rate_limited: bool
+    circuit_open: bool
+    p90_latency_ms: Optional[float]
+    degraded_reason: Optional[str]
+
+    @property
+    def degraded(self) -> bool:
+        return self.degraded_reason is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "error_rate": round(self.error_rate, 4),
+            "timeouts": self.timeouts,
+            "rate_limited": self.rate_limited,
+            "circuit_open": self.circuit_open,
+            "p90_latency_ms": self.p90_latency_ms,
+            "degraded": self.degraded_reason,
+        }
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Provider chosen for one request, and why."""
+
+    kind: Kind
+    preferred: str
+    provider: str
+    reason: str  # "preferred", "degraded:<why>", "all_degraded"
+
+    @property
+    def rerouted(self) -> bool:
+        return self.provider != self.preferred
+
+
+class ProviderRouter:
+    """Sliding-window provider health and routing decisions."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        window_seconds: float = 300,
+        min_samples: int = 5,
+        max_error_rate: float = 0.3,
+        max_p90_latency_ms: float = 10000,
+        rate_limit_cooldown_seconds: float = 60,
+        max_samples: int = 1000,
+    ):
+        self.enabled = enabled
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.max_p90_latency_ms = max_p90_latency_ms
+        self.rate_limit_cooldown_seconds = rate_limit_cooldown_seconds
+        # Bounds memory under heavy traffic; the window is then the latest max_samples
+        self.max_samples = max_samples
+        self._samples: dict[tuple[str, str], deque[_Sample]] = {}
+        self._timeouts: dict[tuple[str, str], deque[float]] = {}
+        self.reroutes: dict[str, int] = {}
+        # Last (provider, reason) per (kind, preferred), to log only changes
+        self._routes: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def _window(self, kind: str, provider: str, now: float) -> deque[_Sample]:
+        samples = self._samples.setdefault((kind, provider), deque(maxlen=self.max_samples))
+        while samples and now - samples[0].at > self.window_seconds:
+            samples.popleft()
+        return samples
+
+    def record(
+        self,
+        kind: Kind,
+        provider: str,
+        latency_ms: Optional[float],
+        error: Optional[BaseException] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Record the outcome of one provider request."""
+        now = time.monotonic() if now is None else now
+        samples = self._window(kind, provider, now)
+        samples.append(_Sample(
+            at=now,
+            latency_ms=latency_ms if error is None else None,
+            rate_limited=isinstance(error, (STTRateLimitError, TTSRateLimitError)),
+            circuit_open=isinstance(error, (STTCircuitOpenError, TTSCircuitOpenError)),
+        ))
+        if isinstance(error, (STTTimeoutError, TTSTimeoutError)):
+            self._timeouts.setdefault((kind, provider), deque(maxlen=self.max_samples)).append(now)
+
+    def health(self, kind: Kind, provider: str, now: Optional[float] = None) -> ProviderHealth:
+        """Health of provider over the sliding window."""
+        now = time.monotonic() if now is None else now
+        samples = self._window(kind, provider, now)
+        timeouts = self._timeouts.get((kind, provider), deque())
+        while timeouts and now - timeouts[0] > self.window_seconds:
+            timeouts.popleft()
+
+        latencies = sorted(s.latency_ms for s in samples if s.latency_ms is not None)
+        errors = len(samples) - len(latencies)
+        error_rate = errors / len(samples) if samples else 0.0
+        p90 = latencies[max(1, math.ceil(0.9 * len(latencies))) - 1] if latencies else None
+        recent = [s for s in samples if now - s.at <= self.rate_limit_cooldown_seconds]
+        rate_limited = any(s.rate_limited for s in recent)
+        # Latest outcome was a breaker rejection; traffic returns after the
+        # cooldown, by which time the breaker lets a probe through
+        circuit_open = bool(recent) and recent[-1].circuit_open
+
+        reason = None
+        if circuit_open:
+            reason = "circuit_open"
+        elif rate_limited:
+            reason = "rate_limited"
+        elif len(samples) >= self.min_samples:
+            if error_rate > self.max_error_rate:
+                reason = "errors"
+            elif p90 is not None and p90 > self.max_p90_latency_ms:
+                reason = "latency"
+
+        return ProviderHealth(
+            requests=len(samples),
+            error_rate=error_rate,
+            timeouts=len(timeouts),
+            rate_limited=rate_limited,
+            circuit_open=circuit_open,
+            p90_latency_ms=p90,
+            degraded_reason=reason,
+        )
+
+    def choose(
+        self,
+        kind: Kind,
+        preferred: str,
+        allowed: Optional[list[str]] = None,
+        now: Optional[float] = None,
+    ) -> RoutingDecision:
+        """Pick the provider for one request.
+
+        The preferred provider is kept unless it is degraded; then the
+        healthy allowed provider with the lowest p90 latency is used. If
+        every allowed provider is degraded, the preferred one is kept.
+
+        Args:
+            kind: "stt" or "tts"
+            preferred: The user's configured provider
+            allowed: Providers the user may be routed to; None for any
+        """
+        if not self.enabled:
+            return RoutingDecision(kind, preferred, preferred, "preferred")
+
+        health = self.health(kind, preferred, now)
+        if not health.degraded:
+            return self._log(RoutingDecision(kind, preferred, preferred, "preferred"))
+
+        candidates = self.alternatives(kind, preferred, allowed, now)
+        if not candidates:
+            decision = RoutingDecision(kind, preferred, preferred, "all_degraded")
+        else:
+            decision = RoutingDecision(kind, preferred, candidates[0], f"degraded:{health.degraded_reason}")
+            key = f"{kind}:{preferred}->{decision.provider}"
+            self.reroutes[key] = self.reroutes.get(key, 0) + 1
+
+        return self._log(decision)
+
+    def alternatives(
+        self,
+        kind: Kind,
+        provider: str,
+        allowed: Optional[list[str]] = None,
+        now: Optional[float] = None,
+    ) -> list[str]:
+        """Healthy allowed providers other than provider, lowest p90 latency first.
+
+        Args:
+            kind: "stt" or "tts"
+            provider: Provider to find alternatives to
+            allowed: Providers the user may be routed to; None for any
+        """
+        candidates = []
+        for other in allowed or PROVIDERS:
+            if other == provider:
+                continue
+            health = self.health(kind, other, now)
+            if not health.degraded:
+                candidates.append((health.p90_latency_ms or 0.0, other))
+        return [other for _, other in sorted(candidates)]
+
+    def _log(self, decision: RoutingDecision) -> RoutingDecision:
+        """Log a decision at info when it differs from the last one for its route."""
+        route = (decision.kind, decision.preferred)
+        current = (decision.provider, decision.reason)
+        if self._routes.get(route, (decision.preferred, "preferred")) != current:
+            self._routes[route] = current
+            logger.info(
+                "Routing %s from %s to %s (%s)",
+                decision.kind, decision.preferred, decision.provider, decision.reason,
+            )
+        else:
+            logger.debug(
+                "Routing %s from %s to %s (%s)",
+                decision.kind, decision.preferred, decision.provider, decision.reason,
+            )
+        return decision
+
+    def stats(self) -> dict:
+        """Provider health per kind and reroute counts."""
+        return {
+            "enabled": self.enabled,
+            "health": {
+                f"{kind}:{provider}": self.health(kind, provider).to_dict()
+                for kind, provider in sorted(self._samples)
+            },
+            "reroutes": dict(self.reroutes),
+        }
+
+
+def _provider_fault(error: BaseException) -> bool:
+    """Whether a failed request tells us about the provider's health.
+
+    Bad input (invalid audio, text too long, other 4xx) is the caller's
+    fault; counting it would let one client reroute every user.
+    """
+    return is_retryable(error) or isinstance(error, (STTCircuitOpenError, TTSCircuitOpenError))
+
+
+class MonitoredSTTAdapter(STTAdapter):
+    """STT adapter wrapper that reports outcomes to the router.
+
+    Also stamps STTResult.provider, so the provider that served a turn is
+    known however the adapter was reached.
+    """
+
+    def __init__(self, adapter: STTAdapter, router: ProviderRouter):
+        self.adapter = adapter
+        self.router = router
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        name = self.adapter.get_provider_name()
+        start = time.perf_counter()
+        try:
+            result = await self.adapter.transcribe(audio, language=language, hints=hints)
+        except asyncio.CancelledError:
+            # A hedged primary cancelled for being slow: its latency so far
+            # is a lower bound, and dropping it would hide the slowness
+            self.router.record("stt", name, (time.perf_counter() - start) * 1000)
+            raise
+        except Exception as e:
+            if _provider_fault(e):
+                self.router.record("stt", name, None, e)
+            raise
+        self.router.record("stt", name, (time.perf_counter() - start) * 1000)
+        return replace(result, provider=result.provider or name)
+
+    async def transcribe_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+        partial_every: int = 10,
+    ) -> AsyncIterator[STTStreamResult]:
+        name = self.adapter.get_provider_name()
+        async for event in self.adapter.transcribe_stream(
+            chunks, language=language, hints=hints, partial_every=partial_every
+        ):
+            yield replace(event, result=replace(event.result, provider=event.result.provider or name))
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
+
+
+class MonitoredTTSAdapter(TTSAdapter):
+    """TTS adapter wrapper that reports outcomes to the router."""
+
+    def __init__(self, adapter: TTSAdapter, router: ProviderRouter):
+        self.adapter = adapter
+        self.router = router
+
+    async def synthesize(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> TTSResult:
+        name = self.adapter.get_provider_name()
+        start = time.perf_counter()
+        try:
+            result = await self.adapter.synthesize(text, language=language, voice=voice, speed=speed)
+        except Exception as e:
+            if _provider_fault(e):
+                self.router.record("tts", name, None, e)
+            raise
+        self.router.record("tts", name, (time.perf_counter() - start) * 1000)
+        return result
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
@@ -1,9 +1,10 @@
 # STT Adapters
-from src.adapters.stt.base import STTAdapter, STTResult, STTWord
+from src.adapters.stt.base import STTAdapter, STTResult, STTStreamResult, STTWord
 
 __all__ = [
     "STTAdapter",
     "STTResult",
+    "STTStreamResult",
     "STTWord",
 ]
 
@@ -1,7 +1,9 @@
 """Base STT Adapter interface and data classes."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
 from typing import Literal, Optional
 
 
@@ -24,6 +26,16 @@ class STTResult:
     words: list[STTWord] = field(default_factory=list)
     language: str = "ru"
     latency_ms: int = 0
+    cached: bool = False  # served from the STT result cache, no provider call
+    provider: Optional[str] = None  # provider that answered, when hedged
+
+
+@dataclass
+class STTStreamResult:
+    """Partial or final result from streaming transcription."""
+
+    result: STTResult
+    is_final: bool = False
 
 
 class STTAdapter(ABC):
@@ -55,6 +67,81 @@ class STTAdapter(ABC):
         """
         pass
 
+    async def transcribe_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+        partial_every: int = 10,
+    ) -> AsyncIterator[STTStreamResult]:
+        """Transcribe audio arriving as a stream of chunks.
+
+        The default implementation suits batch-only providers. Every
+        ``partial_every`` chunks, the audio received since the previous
+        partial request is transcribed in the background (one request in
+        flight at a time), prefixed with the first chunk so it carries the
+        container header. Partial text is the segments' text joined, so each
+        second of audio is sent once for partials rather than once per
+        partial. Once the stream ends the full audio is transcribed once more
+        and yielded as the final result. Providers with native streaming
+        recognition should override this method.
+
+        Args:
+            chunks: Async iterator of audio chunks; the first chunk must carry
+                the container header (as MediaRecorder chunks do)
+            language: Language code ('ru' for Russian, 'kk' for Kazakh)
+            hints: Optional list of words/phrases to improve recognition
+            partial_every: Number of chunks between partial transcriptions,
+                0 disables partial results
+
+        Yields:
+            STTStreamResult objects; the last one has ``is_final=True``
+
+        Raises:
+            STTError: If the final transcription fails
+        """
+        buffer = bytearray()
+        header = b""
+        received = 0
+        # Start of the audio not yet sent for a partial transcription
+        segment_start = 0
+        segment_texts: list[str] = []
+        pending: Optional[asyncio.Task] = None
+
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                if not header:
+                    header = chunk
+                    segment_start = len(chunk)
+                buffer.extend(chunk)
+                received += 1
+
+                if pending is not None and pending.done():
+                    # Partial failures are not fatal, the final pass decides
+                    if not pending.cancelled() and pending.exception() is None:
+                        segment = pending.result()
+                        if segment.text:
+                            segment_texts.append(segment.text)
+                        yield STTStreamResult(
+                            result=replace(segment, text=" ".join(segment_texts), words=[]),
+                            is_final=False,
+                        )
+                    pending = None
+
+                if partial_every and pending is None and received % partial_every == 0:
+                    pending = asyncio.create_task(
+                        self.transcribe(header + bytes(buffer[segment_start:]), language=language, hints=hints)
+                    )
+                    segment_start = len(buffer)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+        result = await self.transcribe(bytes(buffer), language=language, hints=hints)
+        yield STTStreamResult(result=result, is_final=True)
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get the name of this STT provider."""
@@ -87,3 +174,9 @@ class STTRateLimitError(STTError):
     """Raised when rate limit is exceeded."""
 
     pass
+
+
+class STTCircuitOpenError(STTError):
+    """Raised without calling the provider while its circuit breaker is open."""
+
+    pass
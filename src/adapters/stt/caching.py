@@ -0,0 +1,181 @@
+"""STT result cache keyed by audio fingerprint.
+
+Flaky mobile clients retry uploads and the comparison flow re-submits the
+same recording, so identical bytes are often transcribed more than once.
+Results are cached by sha256(audio) plus provider, language and hints in a
+bounded in-process LRU, optionally backed by Redis so workers share hits.
+
+Validates: Requirements 3.4, 12.1
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, replace
+from typing import Literal, Optional
+
+from src.adapters.stt.base import STTAdapter, STTResult, STTStreamResult, STTWord
+
+logger = logging.getLogger(__name__)
+
+
+def stt_cache_key(
+    audio: bytes,
+    provider: str,
+    language: str,
+    hints: Optional[list[str]] = None,
+) -> str:
+    """Hex digest identifying one transcription request."""
+    fingerprint = hashlib.sha256(audio).hexdigest()
+    params = json.dumps([provider, language, sorted(hints or [])], ensure_ascii=False)
+    return hashlib.sha256(f"{fingerprint}:{params}".encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit counters for the STT result cache."""
+
+    hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def _dump(result: STTResult) -> str:
+    return json.dumps(asdict(result), ensure_ascii=False)
+
+
+def _load(raw: bytes | str) -> STTResult:
+    data = json.loads(raw)
+    data["words"] = [STTWord(**word) for word in data.get("words", [])]
+    return STTResult(**data)
+
+
+class STTResultCache:
+    """Bounded LRU of STT results with an optional Redis tier."""
+
+    REDIS_PREFIX = "stt:result:"
+
+    def __init__(
+        self,
+        max_entries: int,
+        redis_url: Optional[str] = None,
+        redis_ttl_seconds: int = 86400,
+    ):
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, STTResult] = OrderedDict()
+        self._redis = None
+
+    def _client(self):
+        if self._redis is None and self.redis_url:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(self.redis_url)
+        return self._redis
+
+    def _remember(self, key: str, result: STTResult) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[STTResult]:
+        """Cached result for key, or None (counted as a miss)."""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return result
+
+        client = self._client()
+        if client is not None:
+            try:
+                raw = await client.get(self.REDIS_PREFIX + key)
+                if raw is not None:
+                    result = _load(raw)
+                    self._remember(key, result)
+                    self.stats.hits += 1
+                    self.stats.redis_hits += 1
+                    return result
+            except Exception as e:
+                logger.warning(f"STT cache Redis lookup failed: {e}")
+
+        self.stats.misses += 1
+        return None
+
+    async def put(self, key: str, result: STTResult) -> None:
+        """Store a provider result (in memory, and in Redis if configured)."""
+        self._remember(key, result)
+        client = self._client()
+        if client is not None:
+            try:
+                await client.set(self.REDIS_PREFIX + key, _dump(result), ex=self.redis_ttl_seconds)
+            except Exception as e:
+                logger.warning(f"STT cache Redis write failed: {e}")
+
+    async def aclose(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+class CachingSTTAdapter(STTAdapter):
+    """STT adapter wrapper that answers repeated audio from the cache.
+
+    Hits return a copy of the stored result (words included) marked
+    ``cached=True``; ``latency_ms`` is still the provider's original
+    latency. Streaming is passed through uncached.
+    """
+
+    def __init__(self, adapter: STTAdapter, cache: STTResultCache):
+        self.adapter = adapter
+        self.cache = cache
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        key = stt_cache_key(audio, self.adapter.get_provider_name(), language, hints)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return replace(cached, words=list(cached.words), cached=True)
+
+        result = await self.adapter.transcribe(audio, language=language, hints=hints)
+        # Callers may adjust their result (e.g. latency_ms); keep our own copy
+        await self.cache.put(key, replace(result, words=list(result.words)))
+        return result
+
+    async def transcribe_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+        partial_every: int = 10,
+    ) -> AsyncIterator[STTStreamResult]:
+        # Partial re-transcriptions would only churn the cache
+        async for event in self.adapter.transcribe_stream(
+            chunks, language=language, hints=hints, partial_every=partial_every
+        ):
+            yield event
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
@@ -0,0 +1,183 @@
+"""Hedged STT requests across two providers.
+
+The primary provider is asked first. If it has not answered within its
+rolling p90 latency (or fails, or answers below the confidence threshold),
+the same audio goes to a secondary provider, picked per request among the
+healthy providers the user is allowed. The first acceptable result wins and
+the other request is cancelled, so the tail latency of a slow provider is
+cut at the cost of a second request on roughly one turn in ten.
+
+Validates: Requirements 3.4, 12.1
+"""
+
+import asyncio
+import copy
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field, replace
+from typing import Literal, Optional
+
+from src.adapters.stt.base import STTAdapter, STTResult, STTStreamResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgeStats:
+    """Hedge and win counters for one primary provider."""
+
+    requests: int = 0
+    hedged: int = 0
+    wins: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict:
+        won = sum(self.wins.values())
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_rate": round(self.hedge_rate, 4),
+            "wins": dict(self.wins),
+            "win_rate": {name: round(n / won, 4) for name, n in self.wins.items()} if won else {},
+        }
+
+
+class HedgedSTTAdapter(STTAdapter):
+    """STT adapter that hedges a slow primary with a secondary provider.
+
+    Reports the primary's provider name, so callers see one logical
+    adapter; the provider that actually answered is in STTResult.provider.
+    The secondary comes from pick_secondary(allowed) on every request, so
+    it follows provider health; with no eligible secondary the request
+    goes to the primary alone.
+    """
+
+    def __init__(
+        self,
+        primary: STTAdapter,
+        pick_secondary: Callable[[Optional[list[str]]], Optional[STTAdapter]],
+        min_confidence: float = 0.5,
+        quantile: float = 0.9,
+        initial_delay_ms: int = 3000,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.primary = primary
+        self.pick_secondary = pick_secondary
+        # Providers the secondary may be picked from; None for any
+        self.allowed: Optional[list[str]] = None
+        self.min_confidence = min_confidence
+        self.quantile = quantile
+        self.initial_delay_ms = initial_delay_ms
+        self.min_samples = min_samples
+        self.stats = HedgeStats()
+        # Wall-clock latencies of primary provider calls
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def allowing(self, allowed: Optional[list[str]]) -> "HedgedSTTAdapter":
+        """This adapter, hedging only with providers in allowed.
+
+        The copy shares latency history and stats with this adapter.
+        """
+        scoped = copy.copy(self)
+        scoped.allowed = allowed
+        return scoped
+
+    def hedge_delay_ms(self) -> float:
+        """How long to wait for the primary before firing the secondary."""
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay_ms
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(self.quantile * len(ordered)))
+        return ordered[rank - 1]
+
+    def _acceptable(self, task: asyncio.Task) -> bool:
+        return (
+            not task.cancelled()
+            and task.exception() is None
+            and task.result().confidence >= self.min_confidence
+        )
+
+    async def _timed_primary(self, audio: bytes, language: str, hints: Optional[list[str]]) -> STTResult:
+        start = time.perf_counter()
+        try:
+            result = await self.primary.transcribe(audio, language=language, hints=hints)
+        except asyncio.CancelledError:
+            # A primary that lost to the hedge is the slow tail: its elapsed
+            # time is a lower bound on its latency. Dropping it would pull
+            # the p90 down and hedge ever more often.
+            self._latencies.append((time.perf_counter() - start) * 1000)
+            raise
+        # Cache hits cost no provider call and say nothing about its latency
+        if not result.cached:
+            self._latencies.append((time.perf_counter() - start) * 1000)
+        return result
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        self.stats.requests += 1
+        primary = asyncio.create_task(self._timed_primary(audio, language, hints))
+        tasks = {primary: self.primary}
+        try:
+            await asyncio.wait({primary}, timeout=self.hedge_delay_ms() / 1000)
+            if primary.done() and self._acceptable(primary):
+                return self._won(primary, tasks)
+
+            # Slow, failed or unsure: ask a secondary as well, if one is
+            # healthy and allowed right now
+            adapter = self.pick_secondary(self.allowed)
+            if adapter is None:
+                await primary
+                return self._won(primary, tasks)
+            self.stats.hedged += 1
+            secondary = asyncio.create_task(
+                adapter.transcribe(audio, language=language, hints=hints)
+            )
+            tasks[secondary] = adapter
+
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if self._acceptable(task):
+                        return self._won(task, tasks)
+
+            # Nothing confident enough: best answer we have, else the primary's error
+            answered = [task for task in tasks if task.exception() is None]
+            if not answered:
+                raise primary.exception()
+            return self._won(max(answered, key=lambda task: task.result().confidence), tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _won(self, task: asyncio.Task, tasks: dict[asyncio.Task, STTAdapter]) -> STTResult:
+        name = tasks[task].get_provider_name()
+        self.stats.wins[name] = self.stats.wins.get(name, 0) + 1
+        return replace(task.result(), provider=name)
+
+    async def transcribe_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+        partial_every: int = 10,
+    ) -> AsyncIterator[STTStreamResult]:
+        # A live stream can't be replayed to a second provider
+        async for event in self.primary.transcribe_stream(
+            chunks, language=language, hints=hints, partial_every=partial_every
+        ):
+            yield event
+
+    def get_provider_name(self) -> str:
+        return self.primary.get_provider_name()
@@ -4,6 +4,7 @@ import io
 import time
 from typing import Literal, Optional
 
+import httpx
 from openai import AsyncOpenAI, APIError, APITimeoutError, RateLimitError
 
 from src.adapters.stt.base import (
@@ -27,15 +28,26 @@ class OpenAISTTAdapter(STTAdapter):
     PROVIDER_NAME = "openai"
     SUPPORTED_FORMATS = ["mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"]
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize OpenAI STT adapter.
         
         Args:
             api_key: OpenAI API key. If not provided, uses settings.
+            http_client: Shared HTTP client (connection pool) to send requests with.
         """
         settings = get_settings()
-        self.client = AsyncOpenAI(api_key=api_key or settings.openai_api_key)
         self.timeout = 30.0
+        # Retries and deadlines are handled by ResilientSTTAdapter
+        self.client = AsyncOpenAI(
+            api_key=api_key or settings.openai_api_key,
+            http_client=http_client,
+            timeout=self.timeout,
+            max_retries=0,
+        )
 
     async def transcribe(
         self,
@@ -78,3 +78,9 @@ class TTSRateLimitError(TTSError):
     """Raised when rate limit is exceeded."""
 
     pass
+
+
+class TTSCircuitOpenError(TTSError):
+    """Raised without calling the provider while its circuit breaker is open."""
+
+    pass
@@ -3,6 +3,7 @@
 import time
 from typing import Literal, Optional
 
+import httpx
 from openai import AsyncOpenAI, APIError, APITimeoutError, RateLimitError
 
 from src.adapters.tts.base import (
@@ -29,15 +30,26 @@ class OpenAITTSAdapter(TTSAdapter):
     VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
     DEFAULT_VOICE = "nova"  # Good for Russian
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize OpenAI TTS adapter.
         
         Args:
             api_key: OpenAI API key. If not provided, uses settings.
+            http_client: Shared HTTP client (connection pool) to send requests with.
         """
         settings = get_settings()
-        self.client = AsyncOpenAI(api_key=api_key or settings.openai_api_key)
         self.timeout = 30.0
+        # Retries and deadlines are handled by ResilientTTSAdapter
+        self.client = AsyncOpenAI(
+            api_key=api_key or settings.openai_api_key,
+            http_client=http_client,
+            timeout=self.timeout,
+            max_retries=0,
+        )
 
     async def synthesize(
         self,
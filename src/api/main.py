@@ -3,7 +3,7 @@
 import uuid
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.openapi.utils import get_openapi
@@ -11,6 +11,7 @@ from fastapi.openapi.utils import get_openapi
 from src.api.routers import auth, voice, admin, comparison
 from src.api.schemas import ErrorResponse
 from src.config import get_settings
+from src.services.storage import StorageService, get_storage
 
 
 @asynccontextmanager
@@ -51,8 +52,67 @@ async def lifespan(app: FastAPI):
             await session.commit()
             print("Demo user created")
 
+    # Spread normalization dictionary invalidations across workers
+    from src.services.dictionary_cache import get_dictionary_cache
+
+    dictionary_cache = get_dictionary_cache()
+    await dictionary_cache.start(get_settings().redis_url)
+
+    # Keep provider_metrics_hourly up to date for the analytics dashboard
+    from src.services.metrics_rollup import get_metrics_rollup
+
+    metrics_rollup = get_metrics_rollup()
+    await metrics_rollup.start()
+
+    # One storage instance for the app; probes S3 in the background
+    storage = get_storage()
+    await storage.start()
+
+    # Evict expired / over-budget TTS cache blobs
+    from src.services.tts_cache import get_tts_cache
+
+    tts_cache = get_tts_cache()
+    await tts_cache.start()
+
+    # Batch WER/CER scoring workers (spawned on first use)
+    from src.services.metrics import get_scoring_pool, shutdown_scoring_pool
+
+    get_scoring_pool(get_settings().evaluation_batch_processes or None)
+
     yield
     # Shutdown
+    from src.adapters.registry import close_adapter_registry
+
+    shutdown_scoring_pool()
+    await tts_cache.stop()
+    await storage.stop()
+    await metrics_rollup.stop()
+    await dictionary_cache.stop()
+    await close_adapter_registry()
+
+
+# Audio keys are written once (turn/record IDs in the path), so clients may cache forever
+AUDIO_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def _is_not_modified(request_headers, response_headers) -> bool:
+    """Whether a conditional GET can be answered with 304 (RFC 9110 13.1)."""
+    if if_none_match := request_headers.get("if-none-match"):
+        etag = response_headers["etag"]
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if if_modified_since := request_headers.get("if-modified-since"):
+        from email.utils import parsedate_to_datetime
+
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+            last_modified = parsedate_to_datetime(response_headers["last-modified"])
+        except (TypeError, ValueError):
+            return False
+        return last_modified <= since
+
+    return False
 
 
 def custom_openapi(app: FastAPI):
@@ -154,6 +214,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Include routers
@@ -186,30 +247,49 @@ def create_app() -> FastAPI:
 
     # Audio file serving endpoint
     @app.get("/api/audio/{path:path}", tags=["system"])
-    async def serve_audio(path: str):
-        """Serve audio files from local storage."""
-        from fastapi.responses import Response
-        from src.services.storage import StorageService
-
-        storage = StorageService()
-        audio_data = storage.get_local_file(path)
-
-        if audio_data is None:
+    async def serve_audio(
+        path: str,
+        request: Request,
+        storage: StorageService = Depends(get_storage),
+    ):
+        """Serve audio files from local storage.
+        
+        Streams from disk (sendfile where the server supports it) with
+        Range/206 support. Audio is never rewritten under the same key, so
+        responses carry ETag/Last-Modified and an immutable Cache-Control,
+        and conditional requests get 304.
+        """
+        from fastapi.responses import FileResponse, Response
+
+        local_file = await storage.stat_local_file(path)
+
+        if local_file is None:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Audio file not found"},
             )
+        file_path, stat_result = local_file
 
         # Determine content type
         content_type = "audio/mpeg" if path.endswith(".mp3") else "audio/wav"
 
-        return Response(
-            content=audio_data,
+        response = FileResponse(
+            file_path,
+            stat_result=stat_result,
             media_type=content_type,
-            headers={
-                "Content-Disposition": f"inline; filename={path.split('/')[-1]}",
-            },
+            content_disposition_type="inline",
+            filename=file_path.name,
+            headers={"Cache-Control": AUDIO_CACHE_CONTROL},
         )
+        if _is_not_modified(request.headers, response.headers):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={
+                    name: response.headers[name]
+                    for name in ("etag", "last-modified", "cache-control")
+                },
+            )
+        return response
 
     return app
 
@@ -4,13 +4,16 @@ Validates: Requirements 6.1-6.4, 7.1-7.5, 8.1-8.5
 """
 
 import uuid
-from typing import Optional
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select, func, and_, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.adapters.registry import get_adapter_registry
 from src.api.auth import get_current_admin
 from src.api.schemas import (
     UserResponse,
@@ -22,11 +25,18 @@ from src.api.schemas import (
     UnknownTermResponse,
     UnknownTermCreate,
     UnknownTermApprove,
+    EvaluationBatchRequest,
+    EvaluationBatchResponse,
+    EvaluationScore,
 )
 from src.models.database import get_db
 from src.models.entities import User, Conversation, Turn
 from src.models.entities_ext import UnknownTerm, AuditLog
+from src.services.analytics import AnalyticsService
+from src.services.dictionary_cache import get_dictionary_cache
+from src.services.latency_sketch import RELATIVE_ERROR
 from src.services.normalization import NormalizationService
+from src.services.pagination import InvalidCursorError, apply_keyset, encode_cursor, paginate
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -34,28 +44,29 @@ router = APIRouter(prefix="/api/admin", tags=["admin"])
 # User management endpoints
 @router.get("/users", response_model=list[UserResponse])
 async def list_users(
+    response: Response,
     role: Optional[str] = None,
     limit: int = Query(default=50, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
     current_admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all users with optional role filter.
+    """List all users with optional role filter, newest first.
+    
+    The next page's cursor is returned in the X-Next-Cursor header.
     
     Validates: Requirements 6.1
     """
     query = select(User)
     if role:
         query = query.where(User.role == role)
-    query = query.offset(offset).limit(limit)
     
-    result = await db.execute(query)
-    users = result.scalars().all()
+    page = await _paginate(db, query, User.created_at, User.id, cursor, limit, response)
     
     # Log action
     await _log_action(db, current_admin.id, "list_users", "user", None)
     
-    return [UserResponse.model_validate(u) for u in users]
+    return [UserResponse.model_validate(u) for u in page]
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
@@ -105,6 +116,8 @@ async def update_user(
         user.stt_provider = request.stt_provider
     if request.tts_provider is not None:
         user.tts_provider = request.tts_provider
+    if request.allowed_providers is not None:
+        user.allowed_providers = request.allowed_providers or None
     if request.language is not None:
         user.language = request.language
     if request.is_test_user is not None:
@@ -119,47 +132,73 @@ async def update_user(
 # Conversation endpoints
 @router.get("/conversations", response_model=list[ConversationSummary])
 async def list_conversations(
+    response: Response,
     user_id: Optional[uuid.UUID] = None,
     provider: Optional[str] = None,
     low_confidence: Optional[bool] = None,
     limit: int = Query(default=50, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
     current_admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """List conversations with filters.
+    """List conversations with filters, newest first.
+    
+    The next page's cursor is returned in the X-Next-Cursor header.
     
     Validates: Requirements 7.1, 7.4
     """
-    query = select(Conversation).options(selectinload(Conversation.user))
+    page = select(Conversation.id, Conversation.started_at)
     
     if user_id:
-        query = query.where(Conversation.user_id == user_id)
+        page = page.where(Conversation.user_id == str(user_id))
     if provider:
-        query = query.where(Conversation.stt_provider_used == provider)
+        page = page.where(Conversation.stt_provider_used == provider)
+    if low_confidence is not None:
+        # Served by idx_turns_conversation_low_confidence
+        has_low_confidence = exists().where(
+            Turn.conversation_id == Conversation.id,
+            Turn.low_confidence.is_(True),
+        )
+        page = page.where(has_low_confidence if low_confidence else ~has_low_confidence)
     
-    query = query.order_by(Conversation.started_at.desc()).offset(offset).limit(limit)
+    try:
+        page = apply_keyset(page, Conversation.started_at, Conversation.id, cursor, limit).subquery()
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    # Turn counts for the page only, in the same statement
+    turn_counts = (
+        select(Turn.conversation_id, func.count(Turn.id).label("turn_count"))
+        .where(Turn.conversation_id.in_(select(page.c.id)))
+        .group_by(Turn.conversation_id)
+        .subquery()
+    )
     
+    query = (
+        select(Conversation, User.name, func.coalesce(turn_counts.c.turn_count, 0))
+        .join(page, page.c.id == Conversation.id)
+        .join(User, User.id == Conversation.user_id)
+        .outerjoin(turn_counts, turn_counts.c.conversation_id == Conversation.id)
+        .order_by(page.c.started_at.desc(), page.c.id.desc())
+    )
     result = await db.execute(query)
-    conversations = result.scalars().all()
-    
-    # Get turn counts
-    summaries = []
-    for conv in conversations:
-        turn_count_query = select(func.count(Turn.id)).where(Turn.conversation_id == conv.id)
-        turn_count_result = await db.execute(turn_count_query)
-        turn_count = turn_count_result.scalar()
-        
-        summaries.append(ConversationSummary(
+    
+    summaries = [
+        ConversationSummary(
             id=conv.id,
             user_id=conv.user_id,
-            user_name=conv.user.name,
+            user_name=user_name,
             started_at=conv.started_at,
             ended_at=conv.ended_at,
             stt_provider_used=conv.stt_provider_used,
             tts_provider_used=conv.tts_provider_used,
             turn_count=turn_count,
-        ))
+        )
+        for conv, user_name, turn_count in result.all()
+    ]
+    if len(summaries) > limit:
+        summaries = summaries[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(summaries[-1].started_at, summaries[-1].id)
     
     await _log_action(db, current_admin.id, "list_conversations", "conversation", None)
     
@@ -201,15 +240,18 @@ async def get_conversation(
 # Unknown terms endpoints
 @router.get("/unknown-terms", response_model=list[UnknownTermResponse])
 async def list_unknown_terms(
+    response: Response,
     status_filter: Optional[str] = Query(None, alias="status"),
     language: Optional[str] = None,
     provider: Optional[str] = None,
     limit: int = Query(default=50, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
     current_admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """List unknown terms with filters.
+    """List unknown terms with filters, most frequent first.
+    
+    The next page's cursor is returned in the X-Next-Cursor header.
     
     Validates: Requirements 8.1, 8.2
     """
@@ -222,10 +264,9 @@ async def list_unknown_terms(
     if provider:
         query = query.where(UnknownTerm.provider_where_seen == provider)
     
-    query = query.order_by(UnknownTerm.occurrence_count.desc()).offset(offset).limit(limit)
-    
-    result = await db.execute(query)
-    terms = result.scalars().all()
+    terms = await _paginate(
+        db, query, UnknownTerm.occurrence_count, UnknownTerm.id, cursor, limit, response
+    )
     
     return [UnknownTermResponse.model_validate(t) for t in terms]
 
@@ -265,6 +306,7 @@ async def create_unknown_term(
     )
     db.add(term)
     await db.flush()
+    get_dictionary_cache().invalidate_on_commit(db, term.language)
     
     await _log_action(db, current_admin.id, "create_term", "unknown_term", term.id)
     
@@ -319,6 +361,7 @@ async def reject_term(
 # Analytics endpoint
 @router.get("/analytics")
 async def get_analytics(
+    days: int = Query(30, ge=1, le=365),
     current_admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
@@ -326,41 +369,22 @@ async def get_analytics(
     
     Validates: Requirements 9.1, 9.2, 9.3
     """
-    # Get metrics by provider
-    metrics = []
-    for provider in ["openai", "google"]:
-        # Count requests
-        count_query = (
-            select(func.count(Turn.id))
-            .join(Conversation, Turn.conversation_id == Conversation.id)
-            .where(Conversation.stt_provider_used == provider)
-        )
-        count_result = await db.execute(count_query)
-        total_requests = count_result.scalar() or 0
-        
-        if total_requests > 0:
-            # Get averages
-            avg_query = (
-                select(
-                    func.avg(Turn.transcript_confidence),
-                    func.avg(Turn.stt_latency_ms),
-                    func.avg(Turn.tts_latency_ms),
-                    func.count(Turn.user_correction),
-                )
-                .join(Conversation, Turn.conversation_id == Conversation.id)
-                .where(Conversation.stt_provider_used == provider)
-            )
-            avg_result = await db.execute(avg_query)
-            row = avg_result.one()
-            
-            metrics.append({
-                "provider": provider,
-                "total_requests": total_requests,
-                "avg_confidence": float(row[0] or 0),
-                "avg_stt_latency_ms": int(row[1] or 0),
-                "avg_tts_latency_ms": int(row[2] or 0),
-                "correction_rate": (row[3] or 0) / total_requests if total_requests > 0 else 0,
-            })
+    # Get metrics by provider (single grouped query)
+    service = AnalyticsService(db)
+    provider_metrics = await service.get_provider_metrics(period=f"{days}d", days=days)
+    metrics = [
+        {
+            "provider": m.provider,
+            "total_requests": m.total_requests,
+            "avg_confidence": m.avg_confidence,
+            "avg_stt_latency_ms": int(m.avg_stt_latency_ms),
+            "avg_tts_latency_ms": int(m.avg_tts_latency_ms),
+            "correction_rate": m.correction_rate,
+            "wer": m.wer,
+            "cer": m.cer,
+        }
+        for m in provider_metrics
+    ]
     
     # Get top unknown terms
     terms_query = (
@@ -379,6 +403,99 @@ async def get_analytics(
     return {"metrics": metrics, "top_unknown_terms": top_terms}
 
 
+@router.get("/analytics/latency")
+async def get_latency_percentiles(
+    days: int = Query(7, ge=1, le=365),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    stage: Optional[Literal["stt", "tts"]] = None,
+    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get p50/p95/p99 STT/TTS latency per provider.
+    
+    The window is [start, end) when given, otherwise the last `days` days.
+    Percentiles are within ~5% of the exact value.
+    
+    Validates: Requirements 9.1
+    """
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=days)
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must be before end",
+        )
+    
+    service = AnalyticsService(db)
+    percentiles = await service.get_latency_percentiles(start, end, stage)
+    
+    return {
+        "start": start,
+        "end": end,
+        "relative_error": RELATIVE_ERROR,
+        "latency": [asdict(p) for p in percentiles],
+    }
+
+
+@router.post("/evaluations/batch", response_model=EvaluationBatchResponse)
+async def score_evaluation_batch(
+    request: EvaluationBatchRequest,
+    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Score and store WER/CER for a labeled evaluation set.
+    
+    Turns that do not exist or have no transcript are skipped and listed
+    in missing_turn_ids.
+    
+    Validates: Requirements 9.5
+    """
+    service = AnalyticsService(db)
+    batch = await service.calculate_wer_cer_batch(
+        [(label.turn_id, label.ground_truth) for label in request.labels],
+        labeled_by=current_admin.id,
+        label_source=request.label_source,
+    )
+    
+    await _log_action(db, current_admin.id, "score_evaluations", "stt_evaluation", None)
+    
+    return EvaluationBatchResponse(
+        scored=len(batch.scored),
+        mean_wer=batch.mean_wer,
+        mean_cer=batch.mean_cer,
+        missing_turn_ids=batch.missing,
+        results=[
+            EvaluationScore(turn_id=turn_id, wer=wer, cer=cer)
+            for turn_id, wer, cer in batch.scored
+        ],
+    )
+
+
+@router.get("/adapters/stats")
+async def get_adapter_stats(
+    current_admin: User = Depends(get_current_admin),
+):
+    """Get provider adapter connection pool usage.
+    
+    Reports in-flight requests and saturation of each provider pool, STT
+    result cache hits, STT hedge and win rates, provider health and
+    reroutes, and circuit breaker states.
+    """
+    return get_adapter_registry().stats()
+
+
+async def _paginate(db, query, sort_column, id_column, cursor, limit, response: Response) -> list:
+    """Fetch one keyset page and expose the next cursor in X-Next-Cursor."""
+    try:
+        page = await paginate(db, query, sort_column, id_column, cursor, limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
+
+
 async def _log_action(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -13,7 +13,7 @@ from src.api.schemas import (
 from src.models.database import get_db
 from src.models.entities import User
 from src.services.comparison import ComparisonService
-from src.services.storage import StorageService
+from src.services.storage import StorageService, get_storage
 
 router = APIRouter(prefix="/api/speech", tags=["comparison"])
 
@@ -24,6 +24,7 @@ async def process_speech(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage),
 ):
     """
     Process audio for comparative analysis.
@@ -40,7 +41,6 @@ async def process_speech(
     # Read audio content
     content = await file.read()
 
-    storage = StorageService()
     service = ComparisonService(db, storage)
 
     try:
@@ -64,9 +64,9 @@ async def get_history(
     offset: int = 0,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage),
 ):
     """Get processed speech history for the current user."""
-    storage = StorageService()
     service = ComparisonService(db, storage)
 
     records = await service.get_history(current_user.id, limit, offset)
@@ -77,6 +77,7 @@ async def get_history(
 async def get_metrics(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage),
 ):
     """
     Get aggregated metrics for comparative analysis.
@@ -84,7 +85,6 @@ async def get_metrics(
     Returns total records and average confidence/latency per provider.
     Accessible by all users (or could be restricted to admin).
     """
-    storage = StorageService()
     service = ComparisonService(db, storage)
 
     stats = await service.get_metrics_stats()
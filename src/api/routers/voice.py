@@ -3,13 +3,29 @@
 Validates: Requirements 11.1, 11.2, 11.3, 11.4, 11.5
 """
 
+import asyncio
+import logging
 import uuid
+from collections.abc import AsyncIterator
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.auth import get_current_user, get_optional_user
+from src.adapters.stt.base import STTCircuitOpenError, STTError
+from src.adapters.tts.base import TTSCircuitOpenError
+from src.api.auth import decode_token, get_current_user, get_optional_user
 from src.api.schemas import (
     SessionCreateRequest,
     SessionResponse,
@@ -19,9 +35,13 @@ from src.api.schemas import (
     RespondRequest,
     RespondResponse,
 )
-from src.models.database import get_db
-from src.models.entities import User
-from src.services.voice_session import VoiceSessionService
+from src.config import get_settings
+from src.models.database import async_session_maker, get_db
+from src.models.entities import Conversation, User
+from src.services.vad import NoSpeechError
+from src.services.voice_session import AdapterFactory, VoiceSessionService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/voice", tags=["voice"])
 
@@ -89,6 +109,10 @@ async def upload_and_transcribe(
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except NoSpeechError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except STTCircuitOpenError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -101,6 +125,127 @@ async def upload_and_transcribe(
     )
 
 
+@router.websocket("/stream/{session_id}")
+async def stream_transcribe(
+    websocket: WebSocket,
+    session_id: uuid.UUID,
+    token: Optional[str] = Query(default=None),
+):
+    """Stream audio chunks and receive partial and final transcripts.
+
+    Protocol: the client sends MediaRecorder chunks (webm/opus, 100 ms each)
+    as binary frames and a text frame ``end`` once recording stops. The server
+    replies with ``{"type": "partial", ...}`` messages while audio arrives and
+    a single ``{"type": "final", ...}`` message carrying the
+    TranscribeResponse fields, then closes the socket.
+
+    No database connection is held while the user speaks: the session is
+    checked up front and the turn is written in a short session at the end.
+    Silent recordings are rejected as on upload, but voice activity
+    detection only analyses WAV, so webm/opus recordings are kept as is.
+
+    Validates: Requirements 11.2, 11.3
+    """
+    await websocket.accept()
+
+    # Use demo user if not authenticated
+    user_id = "00000000-0000-0000-0000-000000000001"
+    if token:
+        try:
+            user_id = str(decode_token(token).user_id)
+        except HTTPException:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid token")
+            return
+
+    async with async_session_maker() as db:
+        user = await VoiceSessionService(db).get_user(user_id)
+        conversation = await db.get(Conversation, str(session_id))
+    # Someone else's session is reported like a missing one
+    if not user or not conversation or str(conversation.user_id) != str(user.id):
+        await websocket.send_json({"type": "error", "detail": f"Session {session_id} not found"})
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+    audio = bytearray()
+
+    async def receive_chunks() -> None:
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message.get("bytes"):
+                    await queue.put(message["bytes"])
+                elif message.get("text") is not None:
+                    break
+        finally:
+            await queue.put(None)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        while (chunk := await queue.get()) is not None:
+            audio.extend(chunk)
+            yield chunk
+
+    receiver = asyncio.create_task(receive_chunks())
+    stt_provider = AdapterFactory.route("stt", user.stt_provider, user.allowed_providers).provider
+    stt_adapter = AdapterFactory.get_stt_adapter(stt_provider, user.allowed_providers)
+
+    try:
+        async for event in stt_adapter.transcribe_stream(
+            chunks(),
+            language=user.language,
+            partial_every=get_settings().stt_stream_partial_every_chunks,
+        ):
+            if not event.is_final:
+                await websocket.send_json({
+                    "type": "partial",
+                    "text": event.result.text,
+                    "confidence": event.result.confidence,
+                })
+                continue
+
+            if len(audio) < 500:
+                await websocket.send_json({"type": "error", "detail": "Audio too short."})
+                break
+
+            async with async_session_maker() as db:
+                result = await VoiceSessionService(db).process_audio(
+                    session_id=str(session_id),
+                    audio=bytes(audio),
+                    user_id=user_id,
+                    stt_result=event.result,
+                )
+                # Commit before replying so the client can confirm the turn right away
+                await db.commit()
+
+            response = TranscribeResponse(
+                turn_id=result.turn_id,
+                raw_transcript=result.raw_transcript,
+                normalized_transcript=result.normalized_transcript,
+                confidence=result.confidence,
+                stt_latency_ms=result.stt_latency_ms,
+            )
+            await websocket.send_json({"type": "final", **response.model_dump(mode="json")})
+    except WebSocketDisconnect:
+        return
+    except (STTError, ValueError, NoSpeechError) as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+    except Exception as e:
+        # e.g. a database or storage failure while recording the turn
+        logger.exception(f"Streaming transcription for session {session_id} failed: {e}")
+        try:
+            await websocket.send_json({"type": "error", "detail": "Internal error"})
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        except Exception:
+            pass  # the client is already gone
+        return
+    finally:
+        receiver.cancel()
+
+    await websocket.close()
+
+
 @router.post("/transcribe/{session_id}", response_model=TranscribeResponse)
 async def transcribe(
     session_id: uuid.UUID,
@@ -162,6 +307,8 @@ async def generate_response(
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except TTSCircuitOpenError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
 
     return RespondResponse(
         assistant_text=result.assistant_text,
@@ -170,6 +317,35 @@ async def generate_response(
     )
 
 
+@router.post("/respond/{session_id}/stream")
+async def stream_response(
+    session_id: uuid.UUID,
+    request: RespondRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user),
+):
+    """Generate TTS response as a chunked MP3 stream.
+    
+    Audio starts after the first sentence is synthesized. Synthesis runs
+    in the background: the assembled file is stored on the turn once the
+    reply is complete, even if the client disconnects mid-stream.
+    
+    Validates: Requirements 11.4
+    """
+    service = VoiceSessionService(db)
+
+    try:
+        audio = await service.stream_response(
+            session_id=session_id,
+            turn_id=request.turn_id,
+            assistant_text=request.assistant_text,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return StreamingResponse(audio, media_type="audio/mpeg")
+
+
 @router.post("/end/{session_id}")
 async def end_session(
     session_id: uuid.UUID,
@@ -34,6 +34,7 @@ class UserResponse(BaseModel):
     language: str
     stt_provider: str
     tts_provider: str
+    allowed_providers: Optional[list[str]] = None
     is_test_user: bool
     created_at: datetime
     last_active_at: Optional[datetime]
@@ -47,6 +48,8 @@ class UserUpdate(BaseModel):
     name: Optional[str] = None
     stt_provider: Optional[Literal["openai", "google"]] = None
     tts_provider: Optional[Literal["openai", "google"]] = None
+    # Empty list clears the restriction (any provider)
+    allowed_providers: Optional[list[Literal["openai", "google"]]] = None
     language: Optional[Literal["ru", "kk"]] = None
     is_test_user: Optional[bool] = None
 
@@ -134,11 +137,13 @@ class TurnResponse(BaseModel):
     normalized_transcript: Optional[str]
     transcript_confidence: Optional[float]
     stt_latency_ms: Optional[int]
+    stt_provider: Optional[str] = None
     user_confirmed: Optional[bool]
     user_correction: Optional[str]
     assistant_text: Optional[str]
     audio_output_url: Optional[str]
     tts_latency_ms: Optional[int]
+    tts_provider: Optional[str] = None
     low_confidence: bool
 
     class Config:
@@ -190,6 +195,35 @@ class UnknownTermApprove(BaseModel):
     correct_form: str = Field(..., min_length=1, max_length=255)
 
 
+# Evaluation schemas
+class EvaluationLabel(BaseModel):
+    """Ground truth for one turn."""
+    turn_id: uuid.UUID
+    ground_truth: str = Field(..., min_length=1)
+
+
+class EvaluationBatchRequest(BaseModel):
+    """Batch WER/CER scoring request."""
+    labels: list[EvaluationLabel] = Field(..., min_length=1, max_length=100_000)
+    label_source: str = Field("admin_review", max_length=20)
+
+
+class EvaluationScore(BaseModel):
+    """WER/CER of one turn."""
+    turn_id: uuid.UUID
+    wer: float
+    cer: float
+
+
+class EvaluationBatchResponse(BaseModel):
+    """Batch WER/CER scoring result."""
+    scored: int
+    mean_wer: float
+    mean_cer: float
+    missing_turn_ids: list[uuid.UUID]
+    results: list[EvaluationScore]
+
+
 # Error schemas
 class ErrorResponse(BaseModel):
     """API error response."""
@@ -231,3 +265,4 @@ class ComparisonStatsResponse(BaseModel):
     total_records: int
     avg_confidence_by_provider: dict[str, float]
     avg_latency_by_provider: dict[str, float]
+    latency_percentiles_by_provider: dict[str, dict[str, Optional[float]]] = {}
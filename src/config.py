@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     s3_secret_key: str = "minioadmin"
     s3_bucket_name: str = "voice-assistant"
     s3_url_expiration_seconds: int = 3600
+    # Threads for blocking boto3 calls, shared by all StorageService instances
+    storage_io_threads: int = 16
+    # S3 reachability probe; storage fails over to local files while it fails
+    storage_health_check_interval_seconds: int = 30
 
     # OpenAI
     openai_api_key: str = ""
@@ -36,14 +40,102 @@ class Settings(BaseSettings):
     google_application_credentials: str = ""
     google_api_key: str = ""
 
+    # Provider HTTP connection pools (shared per provider, see AdapterRegistry)
+    provider_http_max_connections: int = 100
+    provider_http_max_keepalive_connections: int = 20
+    provider_http_keepalive_expiry: float = 30.0
+    provider_http2: bool = True
+    provider_http_timeout_seconds: float = 30.0
+    provider_http_connect_timeout_seconds: float = 5.0
+
+    # Provider resilience
+    # Per-provider deadline per call (retries included), jittered retries of
+    # transient errors, and a circuit breaker opening after consecutive failures
+    provider_stt_deadline_seconds: dict[str, float] = {"openai": 20.0, "google": 20.0}
+    provider_tts_deadline_seconds: dict[str, float] = {"openai": 15.0, "google": 15.0}
+    provider_retry_max_attempts: int = 3
+    provider_retry_base_delay_ms: int = 200
+    provider_retry_max_delay_ms: int = 2000
+    provider_breaker_failure_threshold: int = 5
+    provider_breaker_reset_seconds: int = 30
+
+    # Provider routing
+    # Over a sliding window, a provider is degraded after a rate limit (for the
+    # cooldown), or with enough samples, an error rate or p90 latency over the limits
+    provider_routing_enabled: bool = True
+    provider_routing_window_seconds: int = 300
+    provider_routing_min_samples: int = 5
+    provider_routing_max_error_rate: float = 0.3
+    provider_routing_max_p90_latency_ms: int = 10000
+    provider_routing_rate_limit_cooldown_seconds: int = 60
+
     # JWT Auth
     jwt_secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 60
 
+    # STT result cache
+    # By audio fingerprint: in-process LRU size, and an optional Redis tier
+    # shared by workers
+    stt_cache_enabled: bool = True
+    stt_cache_max_entries: int = 2048
+    stt_cache_redis: bool = False
+    stt_cache_redis_ttl_seconds: int = 86400
+
+    # Hedged STT
+    # Fire the other provider when the user's one hasn't answered within its
+    # rolling p90 latency; first result above the confidence wins
+    stt_hedging_enabled: bool = False
+    stt_hedge_min_confidence: float = 0.5
+    stt_hedge_quantile: float = 0.9
+    stt_hedge_initial_delay_ms: int = 3000
+
+    # Streaming STT (WebSocket)
+    # Partial transcript every N chunks (100 ms each)
+    stt_stream_partial_every_chunks: int = 10
+
+    # Voice activity detection
+    # Before STT (16-bit PCM WAV uploads): silence kept around speech, longest
+    # pause kept, and the minimum speech below which an upload is rejected
+    # without calling a provider
+    vad_enabled: bool = True
+    vad_padding_ms: int = 200
+    vad_max_pause_ms: int = 500
+    vad_margin_db: float = 12.0
+    vad_floor_db: float = -50.0
+    vad_min_speech_ms: int = 250
+    vad_reject_silent: bool = True
+
+    # Streaming TTS
+    # Concurrent sentence synthesis requests per reply
+    tts_stream_max_concurrency: int = 3
+
+    # TTS output cache
+    # In-memory LRU entries, blob TTL and total size budget
+    tts_cache_enabled: bool = True
+    tts_cache_memory_entries: int = 1024
+    tts_cache_ttl_seconds: int = 30 * 24 * 3600
+    tts_cache_max_bytes: int = 1024 * 1024 * 1024
+    tts_cache_evict_interval_seconds: int = 3600
+
     # Normalization
     normalization_confidence_threshold: float = 0.7
     normalization_fuzzy_max_distance: int = 2
+    normalization_fuzzy_index: Literal["linear", "bktree", "symspell"] = "symspell"
+    # Shared dictionary snapshots are reloaded at least this often, even
+    # without an invalidation (safety net for missed pub/sub messages)
+    normalization_dictionary_ttl_seconds: int = 300
+
+    # Evaluation
+    # Batch WER/CER scoring worker processes (0 = one per CPU)
+    evaluation_batch_processes: int = 0
+
+    # Metrics rollup
+    # Hourly provider metrics compactor interval (0 disables; analytics lag new
+    # turns by up to this long) and how long an hour stays open to late turn
+    # updates before it is final
+    metrics_rollup_interval_seconds: int = 60
+    metrics_rollup_settle_hours: int = 2
 
     # Retention
     audio_retention_days: int = 90
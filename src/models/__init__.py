@@ -1,7 +1,13 @@
 # SQLAlchemy Models and Pydantic Schemas
 from src.models.database import Base, get_db, engine, async_session_maker
 from src.models.entities import User, Conversation, Turn
-from src.models.entities_ext import UnknownTerm, STTEvaluation, AuditLog
+from src.models.entities_ext import (
+    UnknownTerm,
+    STTEvaluation,
+    AuditLog,
+    ProviderMetricsHourly,
+    MetricsRollupState,
+)
 
 __all__ = [
     "Base",
@@ -14,4 +20,6 @@ __all__ = [
     "UnknownTerm",
     "STTEvaluation",
     "AuditLog",
+    "ProviderMetricsHourly",
+    "MetricsRollupState",
 ]
@@ -17,7 +17,7 @@ from sqlalchemy import (
     JSON,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from src.models.database import Base
 
@@ -32,6 +32,10 @@ class User(Base):
     """User model - supports both senior users and admins."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination of the admin user list
+        Index("idx_users_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -41,6 +45,8 @@ class User(Base):
     language: Mapped[str] = mapped_column(String(5), nullable=False, default="ru")
     stt_provider: Mapped[str] = mapped_column(String(20), nullable=False, default="openai")
     tts_provider: Mapped[str] = mapped_column(String(20), nullable=False, default="openai")
+    # Providers the router may move this user to when theirs is degraded; None for any
+    allowed_providers: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
     is_test_user: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     last_active_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -58,6 +64,10 @@ class Conversation(Base):
     """Conversation/Session model."""
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Keyset pagination of the admin conversation list
+        Index("idx_conversations_started_at_id", "started_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
@@ -66,6 +76,8 @@ class Conversation(Base):
     stt_provider_used: Mapped[str] = mapped_column(String(20), nullable=False)
     tts_provider_used: Mapped[str] = mapped_column(String(20), nullable=False)
     device_info: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Turn number the next turn will get; bumped atomically per upload
+    next_turn_number: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
     user: Mapped["User"] = relationship(back_populates="conversations")
@@ -78,6 +90,18 @@ class Turn(Base):
     """Turn model - each step in a conversation."""
 
     __tablename__ = "turns"
+    __table_args__ = (
+        UniqueConstraint("conversation_id", "turn_number", name="uq_turn_number"),
+        # Range scans by the metrics rollup compactor
+        Index("idx_turns_timestamp", "timestamp"),
+        # Conversation list filter: "has a low-confidence turn"
+        Index(
+            "idx_turns_conversation_low_confidence",
+            "conversation_id",
+            postgresql_where=text("low_confidence = true"),
+            sqlite_where=text("low_confidence = 1"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     conversation_id: Mapped[str] = mapped_column(String(36), ForeignKey("conversations.id"), nullable=False)
@@ -93,6 +117,8 @@ class Turn(Base):
     normalized_transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     transcript_confidence: Mapped[Optional[float]] = mapped_column(Numeric(5, 4), nullable=True)
     stt_latency_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Provider that produced the transcript (may differ from the conversation's when rerouted)
+    stt_provider: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     stt_words: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     # User Confirmation
@@ -108,6 +134,7 @@ class Turn(Base):
     audio_output_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     audio_output_duration_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     tts_latency_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    tts_provider: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Flags
     needs_review: Mapped[bool] = mapped_column(Boolean, default=False)
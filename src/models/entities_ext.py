@@ -1,16 +1,20 @@
-"""Additional SQLAlchemy ORM models - UnknownTerm, STTEvaluation, AuditLog."""
+"""Additional SQLAlchemy ORM models - UnknownTerm, STTEvaluation, AuditLog, metrics rollups."""
 
 import uuid
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    UniqueConstraint,
     JSON,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -22,6 +26,12 @@ class UnknownTerm(Base):
     """Unknown Terms Dictionary for improving STT recognition."""
 
     __tablename__ = "unknown_terms"
+    __table_args__ = (
+        # ON CONFLICT target of NormalizationService.record_pending_terms
+        UniqueConstraint("language", "heard_variant", name="uq_language_heard_variant"),
+        # Keyset pagination of the admin unknown terms list
+        Index("idx_unknown_terms_occurrence_id", "occurrence_count", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     language: Mapped[str] = mapped_column(String(5), nullable=False)
@@ -55,6 +65,10 @@ class AuditLog(Base):
     """Audit log for tracking admin actions."""
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Keyset pagination of AuditLogService.get_logs
+        Index("idx_audit_logs_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True)
@@ -64,3 +78,47 @@ class AuditLog(Base):
     details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ProviderMetricsHourly(Base):
+    """Hourly pre-aggregated turn metrics per provider pair and language.
+
+    Maintained by MetricsRollupService; dashboards read these rows instead
+    of scanning turns.
+    """
+
+    __tablename__ = "provider_metrics_hourly"
+    __table_args__ = (
+        UniqueConstraint("hour", "stt_provider", "tts_provider", "language", name="uq_metrics_hourly_key"),
+        Index("idx_provider_metrics_hourly_hour", "hour"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    hour: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    stt_provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    tts_provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    language: Mapped[str] = mapped_column(String(5), nullable=False)
+
+    turn_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    correction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    confidence_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    confidence_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    stt_latency_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    stt_latency_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    tts_latency_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    tts_latency_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Log-scale latency histograms: {bucket index: count}, see latency_sketch.LatencySketch
+    stt_latency_buckets: Mapped[dict] = mapped_column(JSON, default=dict)
+    tts_latency_buckets: Mapped[dict] = mapped_column(JSON, default=dict)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class MetricsRollupState(Base):
+    """Watermark of a rollup: hours before it are final."""
+
+    __tablename__ = "metrics_rollup_state"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
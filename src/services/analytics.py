@@ -3,92 +3,24 @@
 Validates: Requirements 9.1, 9.2, 9.3, 9.4, 9.5
 """
 
+import asyncio
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Literal, Optional
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.entities import User, Conversation, Turn
-from src.models.entities_ext import UnknownTerm, STTEvaluation
+from src.models.entities_ext import UnknownTerm, STTEvaluation, ProviderMetricsHourly
+from src.config import get_settings
+from src.services.metrics import calculate_cer, calculate_wer, get_scoring_pool, score_batch
+from src.services.latency_sketch import LatencySketch
+from src.services.metrics_rollup import floor_hour
 
-
-def calculate_wer(hypothesis: str, reference: str) -> float:
-    """Calculate Word Error Rate (WER).
-    
-    WER = (S + D + I) / N
-    where:
-    - S = substitutions
-    - D = deletions
-    - I = insertions
-    - N = number of words in reference
-    
-    Validates: Requirements 9.5
-    """
-    ref_words = reference.lower().split()
-    hyp_words = hypothesis.lower().split()
-    
-    if len(ref_words) == 0:
-        return 0.0 if len(hyp_words) == 0 else 1.0
-    
-    # Dynamic programming for edit distance
-    d = [[0] * (len(hyp_words) + 1) for _ in range(len(ref_words) + 1)]
-    
-    for i in range(len(ref_words) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_words) + 1):
-        d[0][j] = j
-    
-    for i in range(1, len(ref_words) + 1):
-        for j in range(1, len(hyp_words) + 1):
-            if ref_words[i - 1] == hyp_words[j - 1]:
-                d[i][j] = d[i - 1][j - 1]
-            else:
-                d[i][j] = min(
-                    d[i - 1][j] + 1,      # deletion
-                    d[i][j - 1] + 1,      # insertion
-                    d[i - 1][j - 1] + 1,  # substitution
-                )
-    
-    return d[len(ref_words)][len(hyp_words)] / len(ref_words)
-
-
-def calculate_cer(hypothesis: str, reference: str) -> float:
-    """Calculate Character Error Rate (CER).
-    
-    CER = (S + D + I) / N
-    where operations are at character level.
-    
-    Validates: Requirements 9.5
-    """
-    ref_chars = list(reference.lower())
-    hyp_chars = list(hypothesis.lower())
-    
-    if len(ref_chars) == 0:
-        return 0.0 if len(hyp_chars) == 0 else 1.0
-    
-    # Dynamic programming for edit distance
-    d = [[0] * (len(hyp_chars) + 1) for _ in range(len(ref_chars) + 1)]
-    
-    for i in range(len(ref_chars) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_chars) + 1):
-        d[0][j] = j
-    
-    for i in range(1, len(ref_chars) + 1):
-        for j in range(1, len(hyp_chars) + 1):
-            if ref_chars[i - 1] == hyp_chars[j - 1]:
-                d[i][j] = d[i - 1][j - 1]
-            else:
-                d[i][j] = min(
-                    d[i - 1][j] + 1,
-                    d[i][j - 1] + 1,
-                    d[i - 1][j - 1] + 1,
-                )
-    
-    return d[len(ref_chars)][len(hyp_chars)] / len(ref_chars)
+# Turn IDs per IN (...) lookup, well below driver bind-parameter limits
+EVALUATION_LOOKUP_CHUNK = 5000
 
 
 @dataclass
@@ -105,6 +37,17 @@ class ProviderMetrics:
     cer: Optional[float] = None
 
 
+@dataclass
+class LatencyPercentiles:
+    """Latency percentiles of one pipeline stage for a provider."""
+    stage: Literal["stt", "tts"]
+    provider: str
+    count: int
+    p50: Optional[float]
+    p95: Optional[float]
+    p99: Optional[float]
+
+
 @dataclass
 class TopUnknownTerm:
     """Unknown term with occurrence count."""
@@ -113,6 +56,21 @@ class TopUnknownTerm:
     provider: Optional[str]
 
 
+@dataclass
+class BatchEvaluationResult:
+    """Outcome of scoring a batch of labeled turns."""
+    scored: list[tuple[str, float, float]] = field(default_factory=list)  # (turn_id, wer, cer)
+    missing: list[str] = field(default_factory=list)  # turns not found or without transcript
+
+    @property
+    def mean_wer(self) -> float:
+        return sum(s[1] for s in self.scored) / len(self.scored) if self.scored else 0.0
+
+    @property
+    def mean_cer(self) -> float:
+        return sum(s[2] for s in self.scored) / len(self.scored) if self.scored else 0.0
+
+
 class AnalyticsService:
     """Service for computing STT/TTS analytics.
     
@@ -130,6 +88,11 @@ class AnalyticsService:
     ) -> list[ProviderMetrics]:
         """Get aggregated metrics by provider.
         
+        Turn metrics are read from provider_metrics_hourly, so they are as
+        fresh as the last rollup compaction (up to
+        metrics_rollup_interval_seconds behind) and the window starts on an
+        hour.
+        
         Args:
             provider: Filter by specific provider
             period: Period label
@@ -141,29 +104,127 @@ class AnalyticsService:
         Validates: Requirements 9.1, 9.3
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
+        rollup = ProviderMetricsHourly
         
-        # Base query for conversations
-        query = (
+        # Turn metrics come from the hourly rollup, not from scanning turns
+        hourly = (
             select(
-                Conversation.stt_provider_used,
-                func.count(Turn.id).label("total_requests"),
-                func.avg(Turn.transcript_confidence).label("avg_confidence"),
-                func.avg(Turn.stt_latency_ms).label("avg_stt_latency"),
-                func.avg(Turn.tts_latency_ms).label("avg_tts_latency"),
-                func.sum(
-                    func.cast(Turn.user_correction.isnot(None), Integer)
-                ).label("corrections"),
+                rollup.stt_provider.label("provider"),
+                func.sum(rollup.turn_count).label("total_requests"),
+                func.sum(rollup.correction_count).label("corrections"),
+                func.sum(rollup.confidence_sum).label("confidence_sum"),
+                func.sum(rollup.confidence_count).label("confidence_count"),
+                func.sum(rollup.stt_latency_sum).label("stt_latency_sum"),
+                func.sum(rollup.stt_latency_count).label("stt_latency_count"),
+                func.sum(rollup.tts_latency_sum).label("tts_latency_sum"),
+                func.sum(rollup.tts_latency_count).label("tts_latency_count"),
             )
-            .join(Turn, Turn.conversation_id == Conversation.id)
-            .where(Conversation.started_at >= cutoff_date)
-            .group_by(Conversation.stt_provider_used)
+            .where(rollup.hour >= floor_hour(cutoff_date))
+            .group_by(rollup.stt_provider)
         )
-        
         if provider:
-            query = query.where(Conversation.stt_provider_used == provider)
+            hourly = hourly.where(rollup.stt_provider == provider)
+        hourly = hourly.subquery()
+        
+        # One row per evaluated turn, so repeated labels don't fan out the join
+        per_turn = (
+            select(
+                STTEvaluation.turn_id,
+                func.avg(STTEvaluation.wer).label("wer"),
+                func.avg(STTEvaluation.cer).label("cer"),
+            )
+            .group_by(STTEvaluation.turn_id)
+            .subquery()
+        )
+        served_by = func.coalesce(Turn.stt_provider, Conversation.stt_provider_used)
+        evaluations = (
+            select(
+                served_by.label("provider"),
+                func.avg(per_turn.c.wer).label("wer"),
+                func.avg(per_turn.c.cer).label("cer"),
+            )
+            .select_from(per_turn)
+            .join(Turn, Turn.id == per_turn.c.turn_id)
+            .join(Conversation, Turn.conversation_id == Conversation.id)
+            .where(Turn.timestamp >= cutoff_date)
+            .group_by(served_by)
+            .subquery()
+        )
+        
+        query = (
+            select(hourly, evaluations.c.wer, evaluations.c.cer)
+            .outerjoin(evaluations, evaluations.c.provider == hourly.c.provider)
+            .order_by(hourly.c.provider)
+        )
+        result = await self.db.execute(query)
+        
+        def ratio(total, count) -> float:
+            return float(total) / count if count else 0.0
+        
+        return [
+            ProviderMetrics(
+                provider=row.provider,
+                period=period,
+                total_requests=row.total_requests,
+                avg_confidence=ratio(row.confidence_sum, row.confidence_count),
+                avg_stt_latency_ms=ratio(row.stt_latency_sum, row.stt_latency_count),
+                avg_tts_latency_ms=ratio(row.tts_latency_sum, row.tts_latency_count),
+                correction_rate=ratio(row.corrections, row.total_requests),
+                wer=float(row.wer) if row.wer is not None else None,
+                cer=float(row.cer) if row.cer is not None else None,
+            )
+            for row in result.all()
+            if row.total_requests
+        ]
+
+    async def get_latency_percentiles(
+        self,
+        start: datetime,
+        end: datetime,
+        stage: Optional[Literal["stt", "tts"]] = None,
+    ) -> list[LatencyPercentiles]:
+        """Get p50/p95/p99 latency per stage and provider for a time window.
+        
+        Merges the hourly latency sketches from the rollup, so any window
+        is answered from rollup rows without touching turns. Hours are
+        included if they start within [start, end).
+        
+        Args:
+            start: Window start (UTC), rounded down to the hour
+            end: Window end (UTC)
+            stage: Only "stt" or only "tts"
+            
+        Returns:
+            List of LatencyPercentiles sorted by stage and provider
+            
+        Validates: Requirements 9.1
+        """
+        rollup = ProviderMetricsHourly
+        query = select(
+            rollup.stt_provider,
+            rollup.tts_provider,
+            rollup.stt_latency_buckets,
+            rollup.tts_latency_buckets,
+        ).where(rollup.hour >= floor_hour(start), rollup.hour < end)
+        result = await self.db.execute(query)
         
-        # For now, return empty list - full implementation requires Integer import
-        return []
+        sketches: dict[tuple[str, str], LatencySketch] = {}
+        for stt_provider, tts_provider, stt_buckets, tts_buckets in result.all():
+            for key, buckets in (("stt", stt_provider), stt_buckets), (("tts", tts_provider), tts_buckets):
+                if stage and key[0] != stage:
+                    continue
+                sketches.setdefault(key, LatencySketch()).merge(LatencySketch.from_json(buckets))
+        
+        return [
+            LatencyPercentiles(
+                stage=key[0],
+                provider=key[1],
+                count=sketch.count,
+                **sketch.percentiles(),
+            )
+            for key, sketch in sorted(sketches.items())
+            if sketch.count
+        ]
 
     async def get_top_unknown_terms(
         self,
@@ -250,6 +311,72 @@ class AnalyticsService:
         
         return wer, cer
 
+    async def calculate_wer_cer_batch(
+        self,
+        labels: list[tuple[uuid.UUID, str]],
+        labeled_by: Optional[uuid.UUID] = None,
+        label_source: str = "admin_review",
+    ) -> BatchEvaluationResult:
+        """Calculate and store WER/CER for many turns at once.
+        
+        Transcripts are fetched with IN lookups, scored off the event loop
+        (process pool for large batches) and stored with one bulk INSERT.
+        
+        Args:
+            labels: (turn_id, ground_truth) pairs
+            labeled_by: User who provided ground truth
+            label_source: Source of labels
+            
+        Returns:
+            BatchEvaluationResult; unknown turns are reported, not raised
+            
+        Validates: Requirements 9.5
+        """
+        turn_ids = list(dict.fromkeys(str(turn_id) for turn_id, _ in labels))
+        transcripts: dict[str, str] = {}
+        for i in range(0, len(turn_ids), EVALUATION_LOOKUP_CHUNK):
+            chunk = turn_ids[i:i + EVALUATION_LOOKUP_CHUNK]
+            result = await self.db.execute(
+                select(Turn.id, Turn.raw_transcript).where(Turn.id.in_(chunk))
+            )
+            transcripts.update({str(row[0]): row[1] for row in result.all() if row[1]})
+        
+        batch = BatchEvaluationResult()
+        pending: list[tuple[str, str]] = []
+        for turn_id, ground_truth in labels:
+            turn_id = str(turn_id)
+            if turn_id in transcripts:
+                pending.append((turn_id, ground_truth))
+            else:
+                batch.missing.append(turn_id)
+        
+        if not pending:
+            return batch
+        
+        scores = await asyncio.to_thread(
+            score_batch,
+            [(transcripts[turn_id], ground_truth) for turn_id, ground_truth in pending],
+            get_scoring_pool(get_settings().evaluation_batch_processes or None),
+        )
+        
+        rows = []
+        for (turn_id, ground_truth), (wer, cer) in zip(pending, scores):
+            batch.scored.append((turn_id, wer, cer))
+            rows.append({
+                "id": str(uuid.uuid4()),
+                "turn_id": turn_id,
+                "ground_truth_text": ground_truth,
+                "labeled_by": str(labeled_by) if labeled_by else None,
+                "label_source": label_source,
+                "wer": wer,
+                "cer": cer,
+            })
+        
+        # executemany of one INSERT; SQLAlchemy batches it into multi-row VALUES
+        await self.db.execute(insert(STTEvaluation), rows)
+        
+        return batch
+
 
 class DualProviderService:
     """Service for dual provider testing mode.
@@ -285,12 +412,15 @@ class DualProviderService:
             
         Validates: Requirements 9.4
         """
-        from src.services.voice_session import AdapterFactory
+        from src.adapters.registry import get_adapter_registry
         
+        # Unhedged and uncached: each result (and its latency) must come from
+        # a fresh request to the provider it is filed under
+        registry = get_adapter_registry()
         results = {}
         
         # Process with OpenAI
-        openai_adapter = AdapterFactory.get_stt_adapter("openai")
+        openai_adapter = registry.get_stt_adapter("openai", cached=False)
         try:
             openai_result = await openai_adapter.transcribe(audio, language)
             results["openai"] = {
@@ -302,7 +432,7 @@ class DualProviderService:
             results["openai"] = {"error": str(e)}
         
         # Process with Google
-        google_adapter = AdapterFactory.get_stt_adapter("google")
+        google_adapter = registry.get_stt_adapter("google", cached=False)
         try:
             google_result = await google_adapter.transcribe(audio, language)
             results["google"] = {
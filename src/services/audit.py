@@ -11,6 +11,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.entities_ext import AuditLog
+from src.services.pagination import Page, paginate
 
 
 class AuditLogService:
@@ -65,19 +66,22 @@ class AuditLogService:
         action: Optional[str] = None,
         resource_type: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0,
-    ) -> list[AuditLog]:
-        """Query audit logs with filters.
+        cursor: Optional[str] = None,
+    ) -> Page[AuditLog]:
+        """Query audit logs with filters, newest first.
         
         Args:
             user_id: Filter by user
             action: Filter by action type
             resource_type: Filter by resource type
             limit: Max results
-            offset: Pagination offset
+            cursor: next_cursor of the previous page
             
         Returns:
-            List of matching AuditLog entries
+            Page of matching AuditLog entries
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
         query = select(AuditLog)
         
@@ -88,10 +92,7 @@ class AuditLogService:
         if resource_type:
             query = query.where(AuditLog.resource_type == resource_type)
         
-        query = query.order_by(AuditLog.created_at.desc()).offset(offset).limit(limit)
-        
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return await paginate(self.db, query, AuditLog.created_at, AuditLog.id, cursor, limit)
 
     async def get_logs_for_resource(
         self,
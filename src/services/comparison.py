@@ -13,9 +13,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.adapters.stt import get_google_adapter, get_openai_adapter
+from src.adapters.registry import get_adapter_registry
 from src.adapters.stt.base import STTAdapter, STTResult
 from src.models.entities import RecognitionMetric, SpeechRecord, User
+from src.services.latency_sketch import LatencySketch
 from src.services.storage import StorageService
 
 
@@ -30,15 +31,15 @@ class ComparisonService:
 
     def _init_adapters(self):
         """Initialize all available STT adapters."""
+        registry = get_adapter_registry()
+
         try:
-            openai_adapter = get_openai_adapter()()
-            self.adapters.append(openai_adapter)
+            self.adapters.append(registry.get_stt_adapter("openai", cached=False))
         except Exception as e:
             print(f"Warning: Failed to init OpenAI adapter: {e}")
 
         try:
-            google_adapter = get_google_adapter()()
-            self.adapters.append(google_adapter)
+            self.adapters.append(registry.get_stt_adapter("google", cached=False))
         except Exception as e:
             print(f"Warning: Failed to init Google adapter: {e}")
 
@@ -190,11 +191,17 @@ class ComparisonService:
         for m in metrics:
             name = m.algorithm_name
             if name not in provider_stats:
-                provider_stats[name] = {"confidence_sum": 0.0, "latency_sum": 0, "count": 0}
+                provider_stats[name] = {
+                    "confidence_sum": 0.0,
+                    "latency_sum": 0,
+                    "count": 0,
+                    "latency": LatencySketch(),
+                }
 
             provider_stats[name]["confidence_sum"] += float(m.confidence_score)
             provider_stats[name]["latency_sum"] += m.processing_time_ms
             provider_stats[name]["count"] += 1
+            provider_stats[name]["latency"].add(m.processing_time_ms)
 
         avg_confidence = {
             k: v["confidence_sum"] / v["count"] if v["count"] > 0 else 0
@@ -205,8 +212,13 @@ class ComparisonService:
             for k, v in provider_stats.items()
         }
 
+        latency_percentiles = {
+            k: v["latency"].percentiles() for k, v in provider_stats.items()
+        }
+
         return {
             "total_records": total_records,
             "avg_confidence_by_provider": avg_confidence,
             "avg_latency_by_provider": avg_latency,
+            "latency_percentiles_by_provider": latency_percentiles,
         }
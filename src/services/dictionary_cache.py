@@ -0,0 +1,264 @@
+"""Process-level cache of approved normalization dictionaries.
+
+Each language has an immutable snapshot that is loaded once and swapped
+atomically when its version changes. Versions are bumped when terms are
+approved, rejected or created, and bumps are broadcast to other workers over
+Redis pub/sub.
+
+Validates: Requirements 4.1, 8.3
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.models.entities_ext import UnknownTerm
+from src.services.fuzzy_index import FuzzyIndex, FuzzyIndexKind, build_fuzzy_index
+from src.services.phrase_matcher import PhraseMatcher
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DictionarySnapshot:
+    """Immutable view of the approved terms for one language."""
+
+    language: str
+    version: int
+    entries: dict[str, dict]  # heard_variant -> {correct_form, id}
+    loaded_at: float = field(default_factory=time.monotonic)
+    _indexes: dict = field(default_factory=dict, compare=False, repr=False)  # lazily built lookups
+
+    def fuzzy_index(self, kind: FuzzyIndexKind, max_distance: int) -> FuzzyIndex:
+        """Fuzzy index over the entries, built once per snapshot."""
+        key = (kind, max_distance)
+        index = self._indexes.get(key)
+        if index is None:
+            index = build_fuzzy_index(kind, self.entries, max_distance)
+            self._indexes[key] = index
+        return index
+
+    def phrase_matcher(self) -> PhraseMatcher:
+        """Phrase matcher over the entries, built once per snapshot."""
+        matcher = self._indexes.get("phrases")
+        if matcher is None:
+            matcher = PhraseMatcher(self.entries)
+            self._indexes["phrases"] = matcher
+        return matcher
+
+    def build_indexes(self, kind: FuzzyIndexKind, max_distance: int) -> None:
+        """Build the lookups normalize() needs, ahead of the first request."""
+        self.fuzzy_index(kind, max_distance)
+        self.phrase_matcher()
+
+
+class DictionaryCache:
+    """Per-language dictionary snapshots shared by all requests of a worker."""
+
+    CHANNEL = "normalization:dictionary"
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else get_settings().normalization_dictionary_ttl_seconds
+        )
+        self._snapshots: dict[str, DictionarySnapshot] = {}
+        self._versions: dict[str, int] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._origin = uuid.uuid4().hex
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self._background: set[asyncio.Task] = set()
+
+    def version(self, language: str) -> int:
+        """Current dictionary version for language."""
+        return self._versions.get(language, 0)
+
+    def _is_fresh(self, snapshot: Optional[DictionarySnapshot]) -> bool:
+        if snapshot is None or snapshot.version != self.version(snapshot.language):
+            return False
+        # TTL is a safety net for missed invalidations (e.g. Redis outage)
+        return not self.ttl_seconds or time.monotonic() - snapshot.loaded_at < self.ttl_seconds
+
+    async def get_snapshot(self, db: AsyncSession, language: str) -> DictionarySnapshot:
+        """Get the dictionary snapshot for language, loading it if stale.
+
+        Args:
+            db: Database session used only when the snapshot must be (re)loaded
+            language: Language code
+
+        Returns:
+            Current DictionarySnapshot
+        """
+        snapshot = self._snapshots.get(language)
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        lock = self._locks.setdefault(language, asyncio.Lock())
+        async with lock:
+            snapshot = self._snapshots.get(language)
+            if self._is_fresh(snapshot):
+                return snapshot
+
+            # Capture the version before loading: an invalidation that lands
+            # during the load leaves this snapshot stale and forces a reload.
+            version = self.version(language)
+            entries = await self._load_entries(db, language)
+            snapshot = DictionarySnapshot(language=language, version=version, entries=entries)
+            # Index builds take seconds on large dictionaries; keep them off
+            # the event loop and publish the snapshot only once they are done
+            settings = get_settings()
+            await asyncio.to_thread(
+                snapshot.build_indexes,
+                settings.normalization_fuzzy_index,
+                settings.normalization_fuzzy_max_distance,
+            )
+            self._snapshots[language] = snapshot
+
+        return snapshot
+
+    async def _load_entries(self, db: AsyncSession, language: str) -> dict[str, dict]:
+        """Load approved terms for language from the database."""
+        query = select(UnknownTerm.id, UnknownTerm.heard_variant, UnknownTerm.correct_form).where(
+            UnknownTerm.status == "approved",
+            UnknownTerm.language == language,
+        )
+        result = await db.execute(query)
+
+        entries: dict[str, dict] = {}
+        for term_id, heard_variant, correct_form in result.all():
+            entries[heard_variant.lower()] = {
+                "correct_form": correct_form,
+                "id": term_id,
+            }
+        return entries
+
+    def invalidate(self, language: str, publish: bool = True) -> None:
+        """Bump the dictionary version for language.
+
+        Args:
+            language: Language code
+            publish: Broadcast the invalidation to other workers
+        """
+        self._versions[language] = self.version(language) + 1
+        if publish and self._redis is not None:
+            self._spawn(self._publish(language))
+
+    def invalidate_on_commit(self, db: AsyncSession, language: str) -> None:
+        """Invalidate language once db commits.
+
+        Invalidating before commit would let a concurrent request reload the
+        old rows and cache them under the new version. Pending invalidations
+        belong to the outermost transaction: they fire when it commits and
+        are dropped when it rolls back.
+        """
+        sync_session = getattr(db, "sync_session", None)
+        if sync_session is None:
+            self.invalidate(language)
+            return
+        key = f"dictionary_invalidations:{self._origin}"
+        if key not in sync_session.info:
+            def after_commit(session) -> None:
+                # Releasing a savepoint is not the commit
+                if not session.in_nested_transaction():
+                    pending = session.info[key]
+                    session.info[key] = set()
+                    for pending_language in pending:
+                        self.invalidate(pending_language)
+
+            def after_transaction_end(session, transaction) -> None:
+                if transaction.parent is None:
+                    session.info[key].clear()
+
+            sync_session.info[key] = set()
+            event.listen(sync_session, "after_commit", after_commit)
+            event.listen(sync_session, "after_transaction_end", after_transaction_end)
+        sync_session.info[key].add(language)
+
+    def _spawn(self, coro) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()
+            return
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _publish(self, language: str) -> None:
+        try:
+            await self._redis.publish(
+                self.CHANNEL,
+                json.dumps({"language": language, "origin": self._origin}),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish dictionary invalidation: {e}")
+
+    async def start(self, redis_url: str) -> None:
+        """Start listening for invalidations from other workers."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(redis_url))
+
+    async def stop(self) -> None:
+        """Stop the pub/sub listener and close the Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _listen(self, redis_url: str) -> None:
+        import redis.asyncio as redis
+
+        delay = 1.0
+        while True:
+            try:
+                client = redis.from_url(redis_url)
+                pubsub = client.pubsub()
+                await pubsub.subscribe(self.CHANNEL)
+                self._redis = client
+                delay = 1.0
+                # Anything published while disconnected was missed
+                for language in list(self._snapshots):
+                    self.invalidate(language, publish=False)
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") != self._origin:
+                        self.invalidate(payload["language"], publish=False)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Dictionary invalidation listener disconnected: {e}")
+                self._redis = None
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+
+
+_cache: Optional[DictionaryCache] = None
+
+
+def get_dictionary_cache() -> DictionaryCache:
+    """Get the process-wide dictionary cache."""
+    global _cache
+    if _cache is None:
+        _cache = DictionaryCache()
+    return _cache
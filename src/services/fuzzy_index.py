@@ -0,0 +1,207 @@
+"""Fuzzy lookup indexes for dictionary terms.
+
+All indexes answer the same question as a linear scan: the dictionary key
+with the smallest Levenshtein distance to a word, within max_distance, with
+ties resolved in favour of the key inserted first.
+
+Validates: Requirements 4.3
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Literal, Optional
+
+from Levenshtein import distance as levenshtein_distance
+
+FuzzyIndexKind = Literal["linear", "bktree", "symspell"]
+
+
+class FuzzyIndex(ABC):
+    """Index over dictionary keys for nearest-neighbour lookup."""
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys: list[str] = list(dict.fromkeys(keys))
+
+    @abstractmethod
+    def search(self, word: str, max_distance: int) -> Optional[tuple[str, int]]:
+        """Find the closest key to word.
+
+        Args:
+            word: Word to match
+            max_distance: Maximum Levenshtein distance
+
+        Returns:
+            Tuple of (key, distance) or None if nothing is within max_distance
+        """
+        pass
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class LinearFuzzyIndex(FuzzyIndex):
+    """Reference implementation: compare against every key."""
+
+    def search(self, word: str, max_distance: int) -> Optional[tuple[str, int]]:
+        best: Optional[tuple[str, int]] = None
+        best_distance = max_distance + 1
+
+        for key in self.keys:
+            dist = levenshtein_distance(word, key, score_cutoff=best_distance)
+            if dist < best_distance:
+                best_distance = dist
+                best = (key, dist)
+                if dist == 0:
+                    break
+
+        return best
+
+
+class BKTreeFuzzyIndex(FuzzyIndex):
+    """Burkhard-Keller tree over Levenshtein distance.
+
+    Works for any max_distance; the triangle inequality prunes subtrees whose
+    edge distance is outside [d - max_distance, d + max_distance].
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        super().__init__(keys)
+        # Node i holds self.keys[i]; children[i] maps edge distance -> node
+        self._children: list[dict[int, int]] = [{} for _ in self.keys]
+
+        for node in range(1, len(self.keys)):
+            key = self.keys[node]
+            parent = 0
+            while True:
+                dist = levenshtein_distance(key, self.keys[parent])
+                child = self._children[parent].get(dist)
+                if child is None:
+                    self._children[parent][dist] = node
+                    break
+                parent = child
+
+    def search(self, word: str, max_distance: int) -> Optional[tuple[str, int]]:
+        if not self.keys:
+            return None
+
+        best_rank = -1
+        best_distance = max_distance + 1
+        stack = [0]
+
+        while stack:
+            node = stack.pop()
+            dist = levenshtein_distance(word, self.keys[node])
+            if dist < best_distance or (dist == best_distance and node < best_rank):
+                best_distance = dist
+                best_rank = node
+
+            # Ties must still be visited to honour insertion order
+            radius = min(max_distance, best_distance)
+            for edge, child in self._children[node].items():
+                if dist - radius <= edge <= dist + radius:
+                    stack.append(child)
+
+        if best_rank < 0:
+            return None
+        return self.keys[best_rank], best_distance
+
+
+class SymSpellFuzzyIndex(FuzzyIndex):
+    """Symmetric-delete index (SymSpell).
+
+    Every key is stored under all strings obtained by deleting up to
+    max_distance characters. A word within max_distance of a key shares at
+    least one such deletion with it, so lookups only verify the handful of
+    keys found under the word's own deletions, independent of dictionary
+    size. Memory grows with key length, so keep max_distance small.
+
+    The number of deletions grows with key length to the power of
+    max_distance, and confirmed transcripts are stored as whole-sentence
+    heard variants. Multi-word and long keys therefore go to a BK-tree
+    searched alongside the deletion table.
+    """
+
+    MAX_KEY_LENGTH = 32
+
+    def __init__(self, keys: Iterable[str], max_distance: int):
+        super().__init__(keys)
+        self.max_distance = max_distance
+        self._deletes: dict[str, list[int]] = {}
+        self._long_ranks: dict[str, int] = {}
+
+        for rank, key in enumerate(self.keys):
+            if len(key) > self.MAX_KEY_LENGTH or any(ch.isspace() for ch in key):
+                self._long_ranks[key] = rank
+                continue
+            for variant in _deletes(key, max_distance):
+                self._deletes.setdefault(variant, []).append(rank)
+
+        self._long = BKTreeFuzzyIndex(self._long_ranks)
+
+    def search(self, word: str, max_distance: int) -> Optional[tuple[str, int]]:
+        if max_distance > self.max_distance:
+            raise ValueError(
+                f"Index was built for max_distance={self.max_distance}, got {max_distance}"
+            )
+
+        best_rank = -1
+        best_distance = max_distance + 1
+        seen: set[int] = set()
+
+        for variant in _deletes(word, max_distance):
+            for rank in self._deletes.get(variant, ()):
+                if rank in seen:
+                    continue
+                seen.add(rank)
+                dist = levenshtein_distance(word, self.keys[rank], score_cutoff=best_distance)
+                if dist < best_distance or (dist == best_distance and rank < best_rank):
+                    best_distance = dist
+                    best_rank = rank
+
+        # BK-tree ties resolve to its first key, i.e. the lowest rank among long keys
+        match = self._long.search(word, max_distance)
+        if match is not None:
+            long_key, dist = match
+            rank = self._long_ranks[long_key]
+            if dist < best_distance or (dist == best_distance and rank < best_rank):
+                best_distance = dist
+                best_rank = rank
+
+        if best_rank < 0:
+            return None
+        return self.keys[best_rank], best_distance
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """All strings obtained by deleting up to max_distance characters."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def build_fuzzy_index(
+    kind: FuzzyIndexKind,
+    keys: Iterable[str],
+    max_distance: int,
+) -> FuzzyIndex:
+    """Build a fuzzy index of the given kind.
+
+    Args:
+        kind: Index implementation ("linear", "bktree" or "symspell")
+        keys: Dictionary keys, in priority order for ties
+        max_distance: Largest distance the index will be queried with
+
+    Returns:
+        FuzzyIndex instance
+    """
+    if kind == "linear":
+        return LinearFuzzyIndex(keys)
+    elif kind == "bktree":
+        return BKTreeFuzzyIndex(keys)
+    elif kind == "symspell":
+        return SymSpellFuzzyIndex(keys, max_distance)
+    else:
+        raise ValueError(f"Unknown fuzzy index: {kind}")
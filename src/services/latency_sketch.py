@@ -0,0 +1,88 @@
+"""Mergeable latency sketch for percentile queries.
+
+Latencies are counted in log-scale buckets: bucket i holds values in
+(GAMMA**(i-1), GAMMA**i] ms. Any quantile is then answered within a fixed
+relative error, (GAMMA - 1) / (GAMMA + 1) ~ 4.8%, and sketches for any
+set of hours or providers merge by adding bucket counts. This is the same
+idea as DDSketch; the rollup stores the buckets as JSON.
+
+Validates: Requirements 9.1
+"""
+
+import math
+from typing import Optional
+
+GAMMA = 1.1
+RELATIVE_ERROR = (GAMMA - 1) / (GAMMA + 1)
+
+
+def latency_bucket(latency_ms: float) -> int:
+    """Index of the bucket holding latency_ms (0 for anything <= 1 ms)."""
+    if latency_ms <= 1:
+        return 0
+    return math.ceil(math.log(latency_ms) / math.log(GAMMA))
+
+
+def bucket_value(index: int) -> float:
+    """Representative value of a bucket, minimizing the relative error."""
+    if index <= 0:
+        return 1.0
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+class LatencySketch:
+    """Bucketed latency distribution with relative-error quantiles."""
+
+    def __init__(self, buckets: Optional[dict[int, int]] = None):
+        self.buckets: dict[int, int] = dict(buckets or {})
+
+    @classmethod
+    def from_json(cls, data: Optional[dict]) -> "LatencySketch":
+        """Build from the JSON form stored in the rollup ({"12": 3, ...})."""
+        return cls({int(k): int(v) for k, v in (data or {}).items()})
+
+    def to_json(self) -> dict[str, int]:
+        return {str(k): v for k, v in sorted(self.buckets.items())}
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, latency_ms: float, count: int = 1) -> None:
+        index = latency_bucket(latency_ms)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        """Add other's counts into this sketch and return it."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (nearest rank), or None if empty.
+
+        Args:
+            q: Quantile in [0, 1], e.g. 0.95
+
+        Returns:
+            Latency in ms within RELATIVE_ERROR of the exact value
+        """
+        total = self.count
+        if total == 0:
+            return None
+
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return bucket_value(index)
+        return bucket_value(max(self.buckets))
+
+    def percentiles(self) -> dict[str, Optional[float]]:
+        """p50/p95/p99 as used by the analytics API."""
+        return {
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
@@ -1,80 +1,268 @@
 """Metrics calculation functions (WER, CER).
 
+Edit distance uses Hyyrö's bit-parallel algorithm over Python integers, so
+memory is O(n) and each step processes a whole column at once. Words are
+mapped to integer IDs before WER scoring. The S/D/I breakdown uses a
+two-row dynamic program. score_batch spreads large evaluation sets over a
+long-lived process pool (get_scoring_pool).
+
 Validates: Requirements 9.5
 """
 
+import multiprocessing
+import os
+from collections.abc import Hashable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+# Pairs per worker task; small enough to balance, large enough to amortize IPC
+BATCH_CHUNK_SIZE = 2000
+
+_scoring_pool: Optional[ProcessPoolExecutor] = None
+
+
+@dataclass(frozen=True)
+class ErrorBreakdown:
+    """Edit operations aligning a hypothesis to a reference."""
+
+    substitutions: int
+    deletions: int
+    insertions: int
+    reference_length: int
+
+    @property
+    def errors(self) -> int:
+        return self.substitutions + self.deletions + self.insertions
+
+    @property
+    def rate(self) -> float:
+        """Error rate, with the same empty-reference convention as WER/CER."""
+        if self.reference_length == 0:
+            return 0.0 if self.insertions == 0 else 1.0
+        return self.errors / self.reference_length
+
+
+def edit_distance(a: Sequence[Hashable], b: Sequence[Hashable]) -> int:
+    """Levenshtein distance between two sequences (Hyyrö bit-parallel).
+
+    Args:
+        a: First sequence
+        b: Second sequence
+
+    Returns:
+        Minimum number of substitutions, deletions and insertions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    # b is the (shorter) pattern: one bit per element
+    m = len(b)
+    if m == 0:
+        return len(a)
+
+    peq: dict[Hashable, int] = {}
+    for i, symbol in enumerate(b):
+        peq[symbol] = peq.get(symbol, 0) | (1 << i)
+
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+
+    for symbol in a:
+        eq = peq.get(symbol, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Shifting in 1 encodes the first row D[0][j] = j (global distance)
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+
+    return score
+
+
+def edit_breakdown(
+    hypothesis: Sequence[Hashable], reference: Sequence[Hashable]
+) -> ErrorBreakdown:
+    """Count substitutions, deletions and insertions of an optimal alignment.
+
+    Uses two rows of (cost, S, D, I); ties prefer substitution, then
+    deletion, then insertion.
+    """
+    n = len(reference)
+    previous = [(j, 0, 0, j) for j in range(len(hypothesis) + 1)]
+
+    for i in range(1, n + 1):
+        ref_symbol = reference[i - 1]
+        current = [(i, 0, i, 0)]
+        for j in range(1, len(hypothesis) + 1):
+            diagonal = previous[j - 1]
+            if ref_symbol == hypothesis[j - 1]:
+                best = diagonal
+            else:
+                up = previous[j]
+                left = current[j - 1]
+                best = (diagonal[0] + 1, diagonal[1] + 1, diagonal[2], diagonal[3])
+                if up[0] + 1 < best[0]:
+                    best = (up[0] + 1, up[1], up[2] + 1, up[3])
+                if left[0] + 1 < best[0]:
+                    best = (left[0] + 1, left[1], left[2], left[3] + 1)
+            current.append(best)
+        previous = current
+
+    _, substitutions, deletions, insertions = previous[-1]
+    return ErrorBreakdown(
+        substitutions=substitutions,
+        deletions=deletions,
+        insertions=insertions,
+        reference_length=n,
+    )
+
+
+def _word_ids(hypothesis: str, reference: str) -> tuple[list[int], list[int]]:
+    """Tokenize both texts into lowercase words mapped to shared integer IDs."""
+    vocabulary: dict[str, int] = {}
+    ref_ids = [vocabulary.setdefault(w, len(vocabulary)) for w in reference.lower().split()]
+    hyp_ids = [vocabulary.setdefault(w, len(vocabulary)) for w in hypothesis.lower().split()]
+    return hyp_ids, ref_ids
+
 
 def calculate_wer(hypothesis: str, reference: str) -> float:
     """Calculate Word Error Rate (WER).
-    
+
     WER = (S + D + I) / N
     where:
     - S = substitutions
     - D = deletions
     - I = insertions
     - N = number of words in reference
-    
+
     Validates: Requirements 9.5
     """
-    ref_words = reference.lower().split()
-    hyp_words = hypothesis.lower().split()
-    
-    if len(ref_words) == 0:
-        return 0.0 if len(hyp_words) == 0 else 1.0
-    
-    # Dynamic programming for edit distance
-    d = [[0] * (len(hyp_words) + 1) for _ in range(len(ref_words) + 1)]
-    
-    for i in range(len(ref_words) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_words) + 1):
-        d[0][j] = j
-    
-    for i in range(1, len(ref_words) + 1):
-        for j in range(1, len(hyp_words) + 1):
-            if ref_words[i - 1] == hyp_words[j - 1]:
-                d[i][j] = d[i - 1][j - 1]
-            else:
-                d[i][j] = min(
-                    d[i - 1][j] + 1,      # deletion
-                    d[i][j - 1] + 1,      # insertion
-                    d[i - 1][j - 1] + 1,  # substitution
-                )
-    
-    return d[len(ref_words)][len(hyp_words)] / len(ref_words)
+    hyp_ids, ref_ids = _word_ids(hypothesis, reference)
+
+    if len(ref_ids) == 0:
+        return 0.0 if len(hyp_ids) == 0 else 1.0
+
+    return edit_distance(ref_ids, hyp_ids) / len(ref_ids)
 
 
 def calculate_cer(hypothesis: str, reference: str) -> float:
     """Calculate Character Error Rate (CER).
-    
+
     CER = (S + D + I) / N
     where operations are at character level.
-    
+
     Validates: Requirements 9.5
     """
-    ref_chars = list(reference.lower())
-    hyp_chars = list(hypothesis.lower())
-    
+    ref_chars = reference.lower()
+    hyp_chars = hypothesis.lower()
+
     if len(ref_chars) == 0:
         return 0.0 if len(hyp_chars) == 0 else 1.0
-    
-    # Dynamic programming for edit distance
-    d = [[0] * (len(hyp_chars) + 1) for _ in range(len(ref_chars) + 1)]
-    
-    for i in range(len(ref_chars) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_chars) + 1):
-        d[0][j] = j
-    
-    for i in range(1, len(ref_chars) + 1):
-        for j in range(1, len(hyp_chars) + 1):
-            if ref_chars[i - 1] == hyp_chars[j - 1]:
-                d[i][j] = d[i - 1][j - 1]
-            else:
-                d[i][j] = min(
-                    d[i - 1][j] + 1,
-                    d[i][j - 1] + 1,
-                    d[i - 1][j - 1] + 1,
-                )
-    
-    return d[len(ref_chars)][len(hyp_chars)] / len(ref_chars)
+
+    return edit_distance(ref_chars, hyp_chars) / len(ref_chars)
+
+
+def wer_breakdown(hypothesis: str, reference: str) -> ErrorBreakdown:
+    """Word-level S/D/I counts; breakdown.rate equals calculate_wer."""
+    hyp_ids, ref_ids = _word_ids(hypothesis, reference)
+    return edit_breakdown(hyp_ids, ref_ids)
+
+
+def cer_breakdown(hypothesis: str, reference: str) -> ErrorBreakdown:
+    """Character-level S/D/I counts; breakdown.rate equals calculate_cer."""
+    return edit_breakdown(hypothesis.lower(), reference.lower())
+
+
+def _score_pair(hypothesis: str, reference: str) -> tuple[float, float]:
+    """WER and CER of one pair, tokenizing each text once."""
+    hyp_lower = hypothesis.lower()
+    ref_lower = reference.lower()
+    hyp_ids, ref_ids = _word_ids(hyp_lower, ref_lower)
+
+    if len(ref_ids) == 0:
+        wer = 0.0 if len(hyp_ids) == 0 else 1.0
+    else:
+        wer = edit_distance(ref_ids, hyp_ids) / len(ref_ids)
+
+    if len(ref_lower) == 0:
+        cer = 0.0 if len(hyp_lower) == 0 else 1.0
+    else:
+        cer = edit_distance(ref_lower, hyp_lower) / len(ref_lower)
+
+    return wer, cer
+
+
+def _score_chunk(pairs: Sequence[tuple[str, str]]) -> list[tuple[float, float]]:
+    return [_score_pair(hypothesis, reference) for hypothesis, reference in pairs]
+
+
+def score_batch(
+    pairs: Sequence[tuple[str, str]],
+    executor: Optional[Executor] = None,
+) -> list[tuple[float, float]]:
+    """Score many (hypothesis, reference) pairs.
+
+    Results are identical to calling calculate_wer/calculate_cer per pair.
+    This is CPU-bound; call it from a worker thread in async code.
+
+    Args:
+        pairs: (hypothesis, reference) pairs
+        executor: Pool to spread chunks over (see get_scoring_pool); None
+            scores in the calling thread
+
+    Returns:
+        List of (WER, CER) tuples in input order
+
+    Validates: Requirements 9.5
+    """
+    chunks = [pairs[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(pairs), BATCH_CHUNK_SIZE)]
+
+    if executor is None or len(chunks) <= 1:
+        return _score_chunk(pairs)
+
+    results: list[tuple[float, float]] = []
+    for chunk_result in executor.map(_score_chunk, chunks):
+        results.extend(chunk_result)
+    return results
+
+
+def get_scoring_pool(processes: Optional[int] = None) -> Optional[ProcessPoolExecutor]:
+    """Get the process-wide scoring pool, creating it on first use.
+
+    Workers are started with spawn rather than fork: the server process has
+    threads, an event loop and open database connections that must not be
+    copied into children. Workers start on first use and are reused.
+
+    Args:
+        processes: Worker processes; None uses all CPUs
+
+    Returns:
+        The pool, or None when a single process is configured
+    """
+    global _scoring_pool
+    processes = processes or os.cpu_count() or 1
+    if processes <= 1:
+        return None
+    if _scoring_pool is None:
+        _scoring_pool = ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _scoring_pool
+
+
+def shutdown_scoring_pool() -> None:
+    """Stop the scoring pool's worker processes."""
+    global _scoring_pool
+    if _scoring_pool is not None:
+        _scoring_pool.shutdown(cancel_futures=True)
+        _scoring_pool = None
@@ -0,0 +1,244 @@
+"""Hourly rollup of turn metrics per provider and language.
+
+A background compactor re-aggregates every hour from the watermark onwards
+and replaces those ProviderMetricsHourly rows. Turns keep changing for a
+while after insert (TTS latency, user confirmation), so open hours are
+recomputed rather than incremented; once an hour is older than the settle
+window the watermark moves past it and it is never scanned again.
+
+Every API worker runs the compactor loop, but on PostgreSQL each pass
+takes a transaction-scoped advisory lock first and skips the pass if
+another worker holds it, so only one worker compacts at a time. Analytics
+read the rollup, so they lag new turns by up to the compactor interval
+(metrics_rollup_interval_seconds, 60 s by default).
+
+Validates: Requirements 9.1, 9.3
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.models.entities import Conversation, Turn, User
+from src.models.entities_ext import MetricsRollupState, ProviderMetricsHourly
+from src.services.latency_sketch import LatencySketch
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_NAME = "provider_metrics_hourly"
+
+# pg_advisory_xact_lock key serializing compactions across workers
+_ADVISORY_LOCK_KEY = 0x6D657472696373
+
+
+def floor_hour(ts: datetime) -> datetime:
+    """Start of the hour containing ts."""
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class _HourAccumulator:
+    """Running sums for one rollup row."""
+
+    turn_count: int = 0
+    correction_count: int = 0
+    confidence_sum: float = 0.0
+    confidence_count: int = 0
+    stt_latency_sum: int = 0
+    stt_latency_count: int = 0
+    tts_latency_sum: int = 0
+    tts_latency_count: int = 0
+    stt_latency: LatencySketch = field(default_factory=LatencySketch)
+    tts_latency: LatencySketch = field(default_factory=LatencySketch)
+
+    def add(
+        self,
+        confidence: Optional[float],
+        stt_latency_ms: Optional[int],
+        tts_latency_ms: Optional[int],
+        corrected: bool,
+    ) -> None:
+        self.turn_count += 1
+        if corrected:
+            self.correction_count += 1
+        if confidence is not None:
+            self.confidence_sum += float(confidence)
+            self.confidence_count += 1
+        if stt_latency_ms is not None:
+            self.stt_latency_sum += stt_latency_ms
+            self.stt_latency_count += 1
+            self.stt_latency.add(stt_latency_ms)
+        if tts_latency_ms is not None:
+            self.tts_latency_sum += tts_latency_ms
+            self.tts_latency_count += 1
+            self.tts_latency.add(tts_latency_ms)
+
+    def to_row(self) -> dict:
+        return {
+            "turn_count": self.turn_count,
+            "correction_count": self.correction_count,
+            "confidence_sum": self.confidence_sum,
+            "confidence_count": self.confidence_count,
+            "stt_latency_sum": self.stt_latency_sum,
+            "stt_latency_count": self.stt_latency_count,
+            "tts_latency_sum": self.tts_latency_sum,
+            "tts_latency_count": self.tts_latency_count,
+            "stt_latency_buckets": self.stt_latency.to_json(),
+            "tts_latency_buckets": self.tts_latency.to_json(),
+        }
+
+
+class MetricsRollupService:
+    """Maintains provider_metrics_hourly from the turns table."""
+
+    def __init__(
+        self,
+        settle_hours: Optional[int] = None,
+        interval_seconds: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.settle_hours = (
+            settle_hours if settle_hours is not None else settings.metrics_rollup_settle_hours
+        )
+        self.interval_seconds = (
+            interval_seconds if interval_seconds is not None
+            else settings.metrics_rollup_interval_seconds
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    async def _try_lock(db: AsyncSession) -> bool:
+        """Take the compaction lock for the current transaction.
+
+        Only PostgreSQL has advisory locks; other dialects (sqlite in tests
+        and single-process setups) always get the lock.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return True
+        return bool(await db.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+        ))
+
+    async def compact(self, db: AsyncSession, now: Optional[datetime] = None) -> int:
+        """Recompute rollup rows from the watermark up to now.
+
+        Skips the pass when another worker is compacting; the lock is held
+        until the caller's transaction ends.
+
+        Args:
+            db: Database session; the caller commits
+            now: Current time (UTC), for tests
+
+        Returns:
+            Number of rollup rows written (0 if skipped)
+        """
+        now = now or datetime.utcnow()
+        if not await self._try_lock(db):
+            logger.debug("Metrics rollup skipped: another worker is compacting")
+            return 0
+        state = await db.get(MetricsRollupState, ROLLUP_NAME)
+        if state is not None:
+            start = state.watermark
+        else:
+            first = await db.scalar(select(func.min(Turn.timestamp)))
+            if first is None:
+                return 0
+            start = floor_hour(first)
+
+        query = (
+            select(
+                Turn.timestamp,
+                # The provider that served the turn, which routing may have changed
+                func.coalesce(Turn.stt_provider, Conversation.stt_provider_used),
+                func.coalesce(Turn.tts_provider, Conversation.tts_provider_used),
+                User.language,
+                Turn.transcript_confidence,
+                Turn.stt_latency_ms,
+                Turn.tts_latency_ms,
+                Turn.user_correction.isnot(None),
+            )
+            .join(Conversation, Turn.conversation_id == Conversation.id)
+            .join(User, Conversation.user_id == User.id)
+            .where(Turn.timestamp >= start)
+            .execution_options(yield_per=5000)
+        )
+
+        hours: dict[tuple, _HourAccumulator] = {}
+        result = await db.stream(query)
+        async for timestamp, stt, tts, language, confidence, stt_ms, tts_ms, corrected in result:
+            key = (floor_hour(timestamp), stt, tts, language)
+            acc = hours.get(key)
+            if acc is None:
+                acc = hours[key] = _HourAccumulator()
+            acc.add(confidence, stt_ms, tts_ms, bool(corrected))
+
+        await db.execute(delete(ProviderMetricsHourly).where(ProviderMetricsHourly.hour >= start))
+        if hours:
+            await db.execute(
+                insert(ProviderMetricsHourly),
+                [
+                    {
+                        "hour": hour,
+                        "stt_provider": stt,
+                        "tts_provider": tts,
+                        "language": language,
+                        **acc.to_row(),
+                    }
+                    for (hour, stt, tts, language), acc in hours.items()
+                ],
+            )
+
+        watermark = max(start, floor_hour(now - timedelta(hours=self.settle_hours)))
+        if state is None:
+            db.add(MetricsRollupState(name=ROLLUP_NAME, watermark=watermark))
+        else:
+            state.watermark = watermark
+        await db.flush()
+
+        return len(hours)
+
+    async def start(self) -> None:
+        """Start the background compactor (no-op if the interval is 0)."""
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background compactor."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        from src.models.database import async_session_maker
+
+        while True:
+            try:
+                async with async_session_maker() as db:
+                    await self.compact(db)
+                    await db.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Metrics rollup failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+
+_rollup: Optional[MetricsRollupService] = None
+
+
+def get_metrics_rollup() -> MetricsRollupService:
+    """Get the process-wide metrics rollup service."""
+    global _rollup
+    if _rollup is None:
+        _rollup = MetricsRollupService()
+    return _rollup
@@ -4,15 +4,41 @@ Validates: Requirements 4.1, 4.2, 4.3, 4.4, 4.5
 """
 
 import uuid
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Literal, Optional
 
-from Levenshtein import distance as levenshtein_distance
-from sqlalchemy import select
+from sqlalchemy import case, cast, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.entities_ext import UnknownTerm
 from src.config import get_settings
+from src.services.dictionary_cache import DictionarySnapshot, get_dictionary_cache
+from src.services.fuzzy_index import FuzzyIndex, build_fuzzy_index
+from src.services.phrase_matcher import PhraseMatcher
+
+# INSERT constructs supporting ON CONFLICT, by dialect name
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _append_context(dialect: str, context: str):
+    """SQL for context_examples with context appended unless already there."""
+    if dialect == "postgresql":
+        existing = func.coalesce(cast(UnknownTerm.context_examples, JSONB), literal([], JSONB))
+        item = literal([context], JSONB)
+        return case(
+            (existing.op("@>")(item), existing),
+            else_=existing.op("||", return_type=JSONB)(item),
+        )
+
+    existing = func.coalesce(UnknownTerm.context_examples, "[]")
+    examples = func.json_each(existing).table_valued("value")
+    seen = select(1).select_from(examples).where(examples.c.value == context).exists()
+    return case((seen, existing), else_=func.json_insert(existing, "$[#]", context))
 
 
 @dataclass
@@ -51,27 +77,25 @@ class NormalizationService:
         self.settings = get_settings()
         self._dictionary: dict[str, dict] = {}  # heard_variant -> {correct_form, ...}
         self._dictionary_loaded = False
+        self._dictionary_language: Optional[str] = None
+        self._snapshot: Optional[DictionarySnapshot] = None
+        self._index: Optional[FuzzyIndex] = None
+        self._phrases: Optional[PhraseMatcher] = None
 
     async def load_dictionary(self, language: Literal["ru", "kk"] = "ru") -> None:
-        """Load approved terms from database into memory.
+        """Load approved terms for language from the shared dictionary cache.
+        
+        The database is only queried when the cached snapshot is stale.
         
         Args:
             language: Language to load dictionary for
         """
-        query = select(UnknownTerm).where(
-            UnknownTerm.status == "approved",
-            UnknownTerm.language == language,
-        )
-        result = await self.db.execute(query)
-        terms = result.scalars().all()
-
-        self._dictionary = {}
-        for term in terms:
-            self._dictionary[term.heard_variant.lower()] = {
-                "correct_form": term.correct_form,
-                "id": term.id,
-            }
-        
+        snapshot = await get_dictionary_cache().get_snapshot(self.db, language)
+        self._snapshot = snapshot
+        self._dictionary = snapshot.entries
+        self._index = None
+        self._phrases = None
+        self._dictionary_language = language
         self._dictionary_loaded = True
 
     async def normalize(
@@ -83,6 +107,10 @@ class NormalizationService:
     ) -> NormalizationResult:
         """Normalize transcript using dictionary corrections.
         
+        Known phrases (single words or multi-word heard variants) are
+        replaced leftmost-longest first; remaining words fall back to
+        fuzzy matching when STT confidence is low.
+        
         Args:
             text: Raw transcript text
             language: Language code
@@ -94,7 +122,7 @@ class NormalizationService:
             
         Validates: Requirements 4.1, 4.2, 4.3
         """
-        if not self._dictionary_loaded:
+        if not self._dictionary_loaded or self._dictionary_language != language:
             await self.load_dictionary(language)
 
         raw_transcript = text
@@ -103,31 +131,39 @@ class NormalizationService:
 
         # Split into words
         words = text.split()
+        words_lower = [word.lower() for word in words]
         normalized_words = []
 
         confidence_threshold = self.settings.normalization_confidence_threshold
         fuzzy_max_distance = self.settings.normalization_fuzzy_max_distance
-
-        for word in words:
-            word_lower = word.lower()
-            corrected_word = word
-            correction_applied = False
-
-            # Try exact match first (always applied)
-            if word_lower in self._dictionary:
-                corrected_word = self._dictionary[word_lower]["correct_form"]
+        phrases = self._phrase_matcher()
+
+        position = 0
+        while position < len(words):
+            # Try exact phrase match first (always applied)
+            match = phrases.match_at(words_lower, position)
+            if match is not None:
+                original = " ".join(words[match.start:match.end])
+                corrected_phrase = self._dictionary[match.key]["correct_form"]
                 corrections.append(
                     Correction(
-                        original=word,
-                        corrected=corrected_word,
+                        original=original,
+                        corrected=corrected_phrase,
                         rule_type="exact",
                         confidence=1.0,
                     )
                 )
-                correction_applied = True
+                normalized_words.append(corrected_phrase)
+                position = match.end
+                continue
+
+            word = words[position]
+            word_lower = words_lower[position]
+            corrected_word = word
+            position += 1
 
             # Try fuzzy match if confidence is low
-            elif stt_confidence < confidence_threshold:
+            if stt_confidence < confidence_threshold:
                 best_match = self._find_fuzzy_match(word_lower, fuzzy_max_distance)
                 if best_match:
                     corrected_word = best_match["correct_form"]
@@ -139,7 +175,6 @@ class NormalizationService:
                             confidence=best_match["confidence"],
                         )
                     )
-                    correction_applied = True
                 else:
                     # Create pending unknown term
                     if len(word) >= 3:  # Only for words with 3+ chars
@@ -168,22 +203,39 @@ class NormalizationService:
         Returns:
             Match info or None
         """
-        best_match = None
-        best_distance = max_distance + 1
-
-        for heard_variant, term_info in self._dictionary.items():
-            dist = levenshtein_distance(word, heard_variant)
-            if dist <= max_distance and dist < best_distance:
-                best_distance = dist
-                # Confidence decreases with distance
-                confidence = 1.0 - (dist / (max_distance + 1))
-                best_match = {
-                    "correct_form": term_info["correct_form"],
-                    "confidence": confidence,
-                    "distance": dist,
-                }
-
-        return best_match
+        match = self._fuzzy_index(max_distance).search(word, max_distance)
+        if match is None:
+            return None
+
+        heard_variant, dist = match
+        # Confidence decreases with distance
+        confidence = 1.0 - (dist / (max_distance + 1))
+        return {
+            "correct_form": self._dictionary[heard_variant]["correct_form"],
+            "confidence": confidence,
+            "distance": dist,
+        }
+
+    def _fuzzy_index(self, max_distance: int) -> FuzzyIndex:
+        """Get the fuzzy index for the loaded dictionary.
+        
+        Shared snapshots keep their index, so it is built once per
+        dictionary version rather than once per request.
+        """
+        kind = self.settings.normalization_fuzzy_index
+        if self._snapshot is not None and self._snapshot.entries is self._dictionary:
+            return self._snapshot.fuzzy_index(kind, max_distance)
+        if self._index is None:
+            self._index = build_fuzzy_index(kind, self._dictionary, max_distance)
+        return self._index
+
+    def _phrase_matcher(self) -> PhraseMatcher:
+        """Get the phrase matcher for the loaded dictionary."""
+        if self._snapshot is not None and self._snapshot.entries is self._dictionary:
+            return self._snapshot.phrase_matcher()
+        if self._phrases is None:
+            self._phrases = PhraseMatcher(self._dictionary)
+        return self._phrases
 
     async def create_pending_term(
         self,
@@ -223,7 +275,7 @@ class NormalizationService:
 
         # Create new term
         term = UnknownTerm(
-            id=uuid.uuid4(),
+            id=str(uuid.uuid4()),
             language=language,
             heard_variant=heard_variant.lower(),
             correct_form=heard_variant,  # Default to same as heard
@@ -236,6 +288,72 @@ class NormalizationService:
         await self.db.flush()
         return term
 
+    async def record_pending_terms(
+        self,
+        heard_variants: Iterable[str],
+        language: Literal["ru", "kk"],
+        context: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> None:
+        """Create or bump pending unknown terms in one statement.
+        
+        A single INSERT ... ON CONFLICT (language, heard_variant) DO UPDATE
+        that adds to occurrence_count and, like create_pending_term, appends
+        context to existing terms that don't have it yet. Dialects without
+        ON CONFLICT fall back to create_pending_term per term.
+        
+        Args:
+            heard_variants: Words as heard by STT (repeats are counted)
+            language: Language code
+            context: Optional context (surrounding words)
+            provider: STT provider that produced these
+            
+        Validates: Requirements 4.5
+        """
+        counts = Counter(variant.lower() for variant in heard_variants)
+        if not counts:
+            return
+
+        dialect = self.db.get_bind().dialect.name
+        make_insert = _UPSERT_INSERTS.get(dialect)
+        if make_insert is None:
+            for variant, count in counts.items():
+                term = await self.create_pending_term(variant, language, context, provider)
+                term.occurrence_count += count - 1
+            await self.db.flush()
+            return
+
+        now = datetime.utcnow()
+        stmt = make_insert(UnknownTerm).values([
+            {
+                "id": str(uuid.uuid4()),
+                "language": language,
+                "heard_variant": variant,
+                "correct_form": variant,  # Default to same as heard
+                "context_examples": [context] if context else [],
+                "provider_where_seen": provider,
+                "occurrence_count": count,
+                "status": "pending",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for variant, count in counts.items()
+        ])
+        updates = {
+            "occurrence_count": UnknownTerm.occurrence_count + stmt.excluded.occurrence_count,
+            "updated_at": now,
+        }
+        if context:
+            updates["context_examples"] = _append_context(dialect, context)
+        if dialect == "postgresql":
+            stmt = stmt.on_conflict_do_update(constraint="uq_language_heard_variant", set_=updates)
+        else:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UnknownTerm.language, UnknownTerm.heard_variant],
+                set_=updates,
+            )
+        await self.db.execute(stmt)
+
     async def approve_term(
         self,
         term_id: uuid.UUID,
@@ -268,6 +386,7 @@ class NormalizationService:
 
         # Reload dictionary to include new term
         self._dictionary_loaded = False
+        get_dictionary_cache().invalidate_on_commit(self.db, term.language)
 
         return term
 
@@ -292,4 +411,8 @@ class NormalizationService:
         term.status = "rejected"
         await self.db.flush()
 
+        # A previously approved term must drop out of the dictionary
+        self._dictionary_loaded = False
+        get_dictionary_cache().invalidate_on_commit(self.db, term.language)
+
         return term
@@ -0,0 +1,109 @@
+"""Keyset (cursor) pagination for admin listings.
+
+Pages are ordered by (sort column, id) descending and the next page starts
+strictly after the last row's key, so deep pages cost the same as the first
+one when a composite index on (sort column, id) exists. Cursors are opaque
+url-safe base64 strings of that key.
+
+Validates: Requirements 6.1, 7.1, 8.1, 10.4
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Optional, TypeVar
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Cursor could not be decoded for this listing."""
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results and the cursor of the next page, if any."""
+
+    items: list[T]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(sort_value: Any, id_value: Any) -> str:
+    """Encode the key of the last row on a page."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, str(id_value)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column: InstrumentedAttribute) -> tuple[Any, str]:
+    """Decode a cursor into a (sort value, id) key for sort_column.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, id_value = json.loads(base64.urlsafe_b64decode(padded))
+        if sort_column.type.python_type is datetime:
+            sort_value = datetime.fromisoformat(sort_value)
+        elif sort_value is not None:
+            sort_value = sort_column.type.python_type(sort_value)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    return sort_value, str(id_value)
+
+
+def apply_keyset(
+    query: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: Optional[str],
+    limit: int,
+) -> Select:
+    """Order query by (sort_column, id_column) descending and seek past cursor.
+
+    Fetches limit + 1 rows so the caller can tell whether a next page exists.
+    """
+    if cursor:
+        sort_value, id_value = decode_cursor(cursor, sort_column)
+        query = query.where(tuple_(sort_column, id_column) < tuple_(sort_value, id_value))
+    return query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: Optional[str],
+    limit: int,
+) -> Page:
+    """Run an entity query one keyset page at a time.
+
+    Args:
+        db: Database session
+        query: select() of a single mapped entity, with filters applied
+        sort_column: Sort attribute of that entity
+        id_column: Primary key attribute of that entity
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size
+
+    Returns:
+        Page of entities
+    """
+    result = await db.execute(apply_keyset(query, sort_column, id_column, cursor, limit))
+    items = list(result.scalars().all())
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return Page(items=items, next_cursor=next_cursor)
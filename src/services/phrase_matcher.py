@@ -0,0 +1,86 @@
+"""Token trie for multi-word dictionary phrases.
+
+Heard variants are split on whitespace and stored in a trie keyed by token,
+so a transcript is matched in a single left-to-right pass: at each position
+the longest phrase starting there wins and matching resumes after it. The
+work per position is bounded by the length of the longest matching phrase,
+not by the number of phrases in the dictionary.
+
+Validates: Requirements 4.1
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional
+
+
+class _Node:
+    __slots__ = ("children", "key")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.key: Optional[str] = None  # dictionary key ending at this node
+
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    """A dictionary phrase found in a token sequence."""
+
+    start: int  # index of the first token
+    end: int  # index after the last token
+    key: str  # dictionary key (heard_variant)
+
+
+class PhraseMatcher:
+    """Leftmost-longest matcher over whitespace-tokenized dictionary keys."""
+
+    def __init__(self, keys: Iterable[str]):
+        self._root = _Node()
+        self.max_tokens = 0
+
+        for key in keys:
+            tokens = key.split()
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.children.setdefault(token, _Node())
+            # Keep the first key for phrases that only differ in whitespace
+            if node.key is None:
+                node.key = key
+            self.max_tokens = max(self.max_tokens, len(tokens))
+
+    def match_at(self, tokens: list[str], start: int) -> Optional[PhraseMatch]:
+        """Find the longest phrase starting at tokens[start].
+
+        Args:
+            tokens: Lowercased transcript tokens
+            start: Position to match from
+
+        Returns:
+            PhraseMatch or None
+        """
+        node = self._root
+        best: Optional[PhraseMatch] = None
+
+        for position in range(start, len(tokens)):
+            node = node.children.get(tokens[position])
+            if node is None:
+                break
+            if node.key is not None:
+                best = PhraseMatch(start=start, end=position + 1, key=node.key)
+
+        return best
+
+    def find_all(self, tokens: list[str]) -> list[PhraseMatch]:
+        """Find the leftmost-longest non-overlapping phrases in tokens."""
+        matches: list[PhraseMatch] = []
+        position = 0
+        while position < len(tokens):
+            match = self.match_at(tokens, position)
+            if match is None:
+                position += 1
+            else:
+                matches.append(match)
+                position = match.end
+        return matches
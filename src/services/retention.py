@@ -6,12 +6,14 @@ Validates: Requirements 10.5
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from typing import Optional
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.entities import Turn
-from src.services.storage import StorageService
+from src.services.storage import StorageService, get_storage
+from src.services.tts_cache import TTS_CACHE_PREFIX
 from src.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -23,10 +25,10 @@ class RetentionPolicyService:
     Validates: Requirements 10.5
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, storage: Optional[StorageService] = None):
         self.db = db
         self.settings = get_settings()
-        self.storage = StorageService()
+        self.storage = storage or get_storage()
 
     async def cleanup_old_audio(self) -> dict:
         """Delete audio files older than retention period.
@@ -58,9 +60,12 @@ class RetentionPolicyService:
                     await self.storage.delete_audio(turn.audio_input_url)
                     turn.audio_input_url = None
                 
-                # Delete output audio
+                # Delete output audio; cached TTS blobs are shared between
+                # turns, and the TTS cache deletes them once no turn
+                # references them any more
                 if turn.audio_output_url:
-                    await self.storage.delete_audio(turn.audio_output_url)
+                    if not turn.audio_output_url.startswith(TTS_CACHE_PREFIX):
+                        await self.storage.delete_audio(turn.audio_output_url)
                     turn.audio_output_url = None
                 
                 deleted_count += 1
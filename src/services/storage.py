@@ -1,20 +1,65 @@
 """Object Storage Service for audio files.
 
+Nothing here blocks the event loop: local files go through aiofiles and
+boto3 calls run on a bounded thread pool. One instance is shared by the
+app (get_storage); a background health check switches it between S3 and
+local storage.
+
 Validates: Requirements 5.1, 10.2
 """
 
+import asyncio
+import functools
+import logging
 import os
+import stat
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
+
+import aiofiles
+import aiofiles.os
 
 from src.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 # Local storage directory
 LOCAL_STORAGE_DIR = Path("audio_storage")
 
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """A stored object as returned by StorageService.list_objects."""
+
+    key: str
+    size: int
+    last_modified: datetime
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Get the process-wide thread pool for blocking S3 calls."""
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(
+            max_workers=get_settings().storage_io_threads,
+            thread_name_prefix="storage-io",
+        )
+    return _io_executor
+
+
+async def _run_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking call on the storage thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_io_executor(), functools.partial(fn, *args, **kwargs))
+
 
 class StorageService:
     """Service for storing and retrieving audio files from S3/MinIO or local storage.
@@ -22,17 +67,26 @@ class StorageService:
     Validates: Requirements 5.1, 10.2
     """
 
-    def __init__(self):
-        """Initialize storage service."""
+    def __init__(self, health_check_interval_seconds: Optional[int] = None):
+        """Initialize storage service.
+
+        Starts on local storage; check_health (run by start()) switches to
+        S3 once the bucket is reachable.
+        """
         self.settings = get_settings()
         self.client = None
         self.bucket = self.settings.s3_bucket_name
         self.use_local = True  # Default to local storage
+        self.health_check_interval_seconds = (
+            health_check_interval_seconds if health_check_interval_seconds is not None
+            else self.settings.storage_health_check_interval_seconds
+        )
+        self._task: Optional[asyncio.Task] = None
 
         # Ensure local storage directory exists
         LOCAL_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
 
-        # Try to initialize S3 client
+        # Build the S3 client (no network call)
         try:
             import boto3
             from botocore.config import Config
@@ -43,20 +97,66 @@ class StorageService:
                 aws_secret_access_key=self.settings.s3_secret_key,
                 config=Config(signature_version="s3v4"),
             )
-            # Test connection
-            self.client.head_bucket(Bucket=self.bucket)
-            self.use_local = False
-        except Exception:
-            print("Info: Using local storage for audio files")
+        except Exception as e:
+            logger.info(f"S3 client unavailable, using local storage: {e}")
+
+    async def check_health(self) -> bool:
+        """Probe the bucket and fail over between S3 and local storage.
+
+        Returns:
+            True if S3 is in use after the check
+        """
+        if self.client is None:
+            return False
+
+        try:
+            await _run_blocking(self.client.head_bucket, Bucket=self.bucket)
+            healthy = True
+        except Exception as e:
+            healthy = False
+            if not self.use_local:
+                logger.warning(f"S3 unreachable, failing over to local storage: {e}")
 
-    def _generate_path(
+        if healthy and self.use_local:
+            logger.info("S3 reachable, using S3 storage")
+        self.use_local = not healthy
+        return healthy
+
+    async def start(self) -> None:
+        """Run an initial health check and start the periodic one."""
+        if not await self.check_health():
+            logger.info("Using local storage for audio files")
+        if self._task is None and self.health_check_interval_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic health check."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval_seconds)
+            try:
+                await self.check_health()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Storage health check failed: {e}")
+
+    def audio_key(
         self,
         user_id,
         conversation_id,
         turn_id,
         file_type: str,
     ) -> str:
-        """Generate storage path for audio file."""
+        """Storage key of a turn's audio file."""
         return f"users/{user_id}/conversations/{conversation_id}/turns/{turn_id}/{file_type}"
 
     async def upload_audio(
@@ -69,28 +169,8 @@ class StorageService:
         content_type: str = "audio/wav",
     ) -> str:
         """Upload audio file to storage."""
-        key = self._generate_path(user_id, conversation_id, turn_id, file_type)
-
-        if self.use_local:
-            # Save to local storage
-            local_path = LOCAL_STORAGE_DIR / key
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            local_path.write_bytes(audio)
-        elif self.client:
-            try:
-                self.client.put_object(
-                    Bucket=self.bucket,
-                    Key=key,
-                    Body=audio,
-                    ContentType=content_type,
-                )
-            except Exception as e:
-                print(f"Warning: Failed to upload to S3: {e}")
-                # Fallback to local
-                local_path = LOCAL_STORAGE_DIR / key
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                local_path.write_bytes(audio)
-
+        key = self.audio_key(user_id, conversation_id, turn_id, file_type)
+        await self.put_object(key, audio, content_type)
         return key
 
     async def upload_research_audio(
@@ -108,35 +188,54 @@ class StorageService:
             ext = "ogg"
 
         key = f"users/{user_id}/research/{record_id}.{ext}"
+        await self.put_object(key, audio, content_type)
+        return key
 
-        if self.use_local:
-            # Save to local storage
-            local_path = LOCAL_STORAGE_DIR / key
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            local_path.write_bytes(audio)
-        elif self.client:
+    async def put_object(self, key: str, data: bytes, content_type: str) -> None:
+        """Write to S3, or to local storage if S3 is unavailable or fails."""
+        if not self.use_local and self.client:
             try:
-                self.client.put_object(
+                await _run_blocking(
+                    self.client.put_object,
                     Bucket=self.bucket,
                     Key=key,
-                    Body=audio,
+                    Body=data,
                     ContentType=content_type,
                 )
+                return
             except Exception as e:
-                print(f"Warning: Failed to upload to S3: {e}")
+                logger.warning(f"Failed to upload to S3: {e}")
                 # Fallback to local
-                local_path = LOCAL_STORAGE_DIR / key
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                local_path.write_bytes(audio)
 
-        return key
+        local_path = LOCAL_STORAGE_DIR / key
+        await aiofiles.os.makedirs(local_path.parent, exist_ok=True)
+        async with aiofiles.open(local_path, "wb") as f:
+            await f.write(data)
+
+    async def get_object(self, key: str) -> Optional[bytes]:
+        """Read an object from S3 or, failing that, local storage.
+
+        Returns:
+            Object bytes, or None if it is in neither
+        """
+        if not self.use_local and self.client:
+            try:
+                response = await _run_blocking(self.client.get_object, Bucket=self.bucket, Key=key)
+                return await _run_blocking(response["Body"].read)
+            except Exception:
+                # Missing, or written locally while S3 was down
+                pass
+        return await self.get_local_file(key)
 
     def generate_signed_url(
         self,
         key: str,
         expiration_seconds: Optional[int] = None,
     ) -> str:
-        """Generate a URL for accessing audio file."""
+        """Generate a URL for accessing audio file.
+
+        Presigning is local signing with no network call, so it stays sync.
+        """
         if self.use_local:
             # Return API endpoint URL for local files
             return f"/api/audio/{key}"
@@ -157,20 +256,81 @@ class StorageService:
         except Exception:
             return f"/api/audio/{key}"
 
-    def get_local_file(self, key: str) -> Optional[bytes]:
+    async def stat_local_file(self, key: str) -> Optional[tuple[Path, os.stat_result]]:
+        """Resolve a key to a local file for streaming.
+
+        Returns:
+            (path, stat) of the file, or None if it does not exist or the
+            key points outside local storage
+        """
+        root = LOCAL_STORAGE_DIR.resolve()
+        path = (root / key).resolve()
+        if root not in path.parents:
+            return None
+        try:
+            stat_result = await aiofiles.os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        return path, stat_result
+
+    async def get_local_file(self, key: str) -> Optional[bytes]:
         """Get file from local storage."""
         local_path = LOCAL_STORAGE_DIR / key
-        if local_path.exists():
-            return local_path.read_bytes()
-        return None
+        try:
+            async with aiofiles.open(local_path, "rb") as f:
+                return await f.read()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
 
     async def delete_audio(self, key: str) -> None:
-        """Delete audio file from storage."""
-        if self.client:
+        """Delete audio file from storage (S3 when in use, and any local copy)."""
+        if not self.use_local and self.client:
             try:
-                self.client.delete_object(Bucket=self.bucket, Key=key)
+                await _run_blocking(self.client.delete_object, Bucket=self.bucket, Key=key)
             except Exception:
                 pass
+        try:
+            await aiofiles.os.remove(LOCAL_STORAGE_DIR / key)
+        except OSError:
+            pass
+
+    async def list_objects(self, prefix: str) -> list[StoredObject]:
+        """List objects under prefix in S3 (when in use) and local storage."""
+
+        def list_s3() -> list[StoredObject]:
+            objects = []
+            paginator = self.client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    objects.append(StoredObject(
+                        key=obj["Key"],
+                        size=obj["Size"],
+                        last_modified=obj["LastModified"].replace(tzinfo=None),
+                    ))
+            return objects
+
+        def list_local() -> list[StoredObject]:
+            objects = []
+            root = LOCAL_STORAGE_DIR / prefix
+            for path in root.rglob("*") if root.is_dir() else []:
+                if path.is_file():
+                    st = path.stat()
+                    objects.append(StoredObject(
+                        key=path.relative_to(LOCAL_STORAGE_DIR).as_posix(),
+                        size=st.st_size,
+                        last_modified=datetime.utcfromtimestamp(st.st_mtime),
+                    ))
+            return objects
+
+        objects = await _run_blocking(list_local)
+        if not self.use_local and self.client:
+            try:
+                objects += await _run_blocking(list_s3)
+            except Exception as e:
+                logger.warning(f"Failed to list S3 objects under {prefix}: {e}")
+        return objects
 
     async def list_old_files(self, older_than_days: int) -> list[str]:
         """List files older than specified days."""
@@ -178,15 +338,28 @@ class StorageService:
             return []
 
         cutoff_date = datetime.utcnow() - timedelta(days=older_than_days)
-        old_keys = []
 
-        try:
+        def list_keys() -> list[str]:
+            old_keys = []
             paginator = self.client.get_paginator("list_objects_v2")
             for page in paginator.paginate(Bucket=self.bucket, Prefix="users/"):
                 for obj in page.get("Contents", []):
                     if obj["LastModified"].replace(tzinfo=None) < cutoff_date:
                         old_keys.append(obj["Key"])
+            return old_keys
+
+        try:
+            return await _run_blocking(list_keys)
         except Exception:
-            pass
+            return []
+
+
+_storage: Optional[StorageService] = None
+
 
-        return old_keys
+def get_storage() -> StorageService:
+    """Get the process-wide storage service (also a FastAPI dependency)."""
+    global _storage
+    if _storage is None:
+        _storage = StorageService()
+    return _storage
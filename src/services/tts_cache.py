@@ -0,0 +1,294 @@
+"""Content-addressed cache of synthesized speech.
+
+Assistant replies repeat a lot ("Повторите, пожалуйста", greetings,
+confirmations), so TTS output is stored once per
+hash(provider, voice, language, speed, normalized text) under
+TTS_CACHE_PREFIX and shared by every turn that says the same thing. An
+in-memory LRU of entry metadata sits in front of the storage tier, where
+each blob has a small JSON sidecar; a hit skips both the provider call
+and the upload. A background sweep evicts blobs past the TTL and the
+oldest ones while the tier is over its size budget.
+
+Turns point at the shared blobs, so eviction never deletes audio that a
+turn still references: retention clears the reference once the turn ages
+out, and the next sweep removes the blob.
+
+Validates: Requirements 3.5, 5.3
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.adapters.tts.base import TTSResult
+from src.config import get_settings
+from src.services.storage import StorageService, get_storage
+
+logger = logging.getLogger(__name__)
+
+# Shared blobs; retention must not delete these per turn
+TTS_CACHE_PREFIX = "tts-cache/"
+
+_CONTENT_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav", "ogg": "audio/ogg"}
+
+# A blob without a sidecar may be a put in progress; only older ones are orphans
+_ORPHAN_GRACE = timedelta(minutes=5)
+
+# Memory hits are re-checked against the sidecar this often, so a worker
+# stops serving an entry another worker evicted well before its blob goes
+_MEMORY_REVALIDATE_SECONDS = 60
+
+# Blob keys per reference lookup query
+_REFERENCE_BATCH = 500
+
+ReferenceLookup = Callable[[list[str]], Awaitable[set[str]]]
+
+
+async def referenced_output_keys(keys: list[str]) -> set[str]:
+    """Subset of keys that some turn still uses as its output audio."""
+    from sqlalchemy import select
+
+    from src.models.database import async_session_maker
+    from src.models.entities import Turn
+
+    referenced: set[str] = set()
+    async with async_session_maker() as db:
+        for start in range(0, len(keys), _REFERENCE_BATCH):
+            result = await db.execute(
+                select(Turn.audio_output_url)
+                .where(Turn.audio_output_url.in_(keys[start:start + _REFERENCE_BATCH]))
+                .distinct()
+            )
+            referenced.update(result.scalars().all())
+    return referenced
+
+
+def normalize_tts_text(text: str) -> str:
+    """Canonical form of text for cache keys: NFC, single spaces, trimmed."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def tts_cache_key(
+    provider: str,
+    voice: Optional[str],
+    language: str,
+    speed: float,
+    text: str,
+) -> str:
+    """Hex digest identifying one synthesis request."""
+    parts = [provider, voice or "", language, f"{speed:.2f}", normalize_tts_text(text)]
+    return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedSpeech:
+    """A synthesized reply stored in the cache."""
+
+    audio_key: str
+    format: str
+    duration_ms: int
+    created_at: datetime
+
+
+class TTSCache:
+    """Two-tier (memory LRU + storage) TTS output cache."""
+
+    def __init__(
+        self,
+        storage: Optional[StorageService] = None,
+        memory_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        evict_interval_seconds: Optional[int] = None,
+        referenced: Optional[ReferenceLookup] = None,
+    ):
+        settings = get_settings()
+        self.storage = storage or get_storage()
+        self.memory_entries = (
+            memory_entries if memory_entries is not None else settings.tts_cache_memory_entries
+        )
+        self.ttl = timedelta(
+            seconds=ttl_seconds if ttl_seconds is not None else settings.tts_cache_ttl_seconds
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else settings.tts_cache_max_bytes
+        self.evict_interval_seconds = (
+            evict_interval_seconds if evict_interval_seconds is not None
+            else settings.tts_cache_evict_interval_seconds
+        )
+        self.referenced = referenced or referenced_output_keys
+        self._memory: OrderedDict[str, tuple[CachedSpeech, float]] = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _blob_key(digest: str, fmt: str) -> str:
+        return f"{TTS_CACHE_PREFIX}{digest[:2]}/{digest}.{fmt}"
+
+    @staticmethod
+    def _meta_key(digest: str) -> str:
+        return f"{TTS_CACHE_PREFIX}{digest[:2]}/{digest}.json"
+
+    def _fresh(self, entry: CachedSpeech) -> bool:
+        return datetime.utcnow() - entry.created_at < self.ttl
+
+    def _remember(self, digest: str, entry: CachedSpeech) -> None:
+        self._memory[digest] = (entry, time.monotonic())
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, digest: str) -> Optional[CachedSpeech]:
+        """Look up a cache entry by tts_cache_key digest.
+
+        Returns:
+            The stored speech, or None on a miss or an expired entry
+        """
+        cached = self._memory.get(digest)
+        if cached is not None:
+            entry, remembered_at = cached
+            if self._fresh(entry) and time.monotonic() - remembered_at < _MEMORY_REVALIDATE_SECONDS:
+                self._memory.move_to_end(digest)
+                return entry
+            del self._memory[digest]
+
+        raw = await self.storage.get_object(self._meta_key(digest))
+        if raw is None:
+            return None
+        try:
+            meta = json.loads(raw)
+            entry = CachedSpeech(
+                audio_key=self._blob_key(digest, meta["format"]),
+                format=meta["format"],
+                duration_ms=int(meta["duration_ms"]),
+                created_at=datetime.fromisoformat(meta["created_at"]),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring corrupt TTS cache entry {digest}: {e}")
+            return None
+        if not self._fresh(entry):
+            return None
+
+        self._remember(digest, entry)
+        return entry
+
+    async def put(self, digest: str, result: TTSResult) -> CachedSpeech:
+        """Store synthesized speech under its digest.
+
+        The sidecar is written after the blob, so a reader that finds it
+        can rely on the audio being there.
+        """
+        entry = CachedSpeech(
+            audio_key=self._blob_key(digest, result.format),
+            format=result.format,
+            duration_ms=result.duration_ms,
+            created_at=datetime.utcnow(),
+        )
+        await self.storage.put_object(
+            entry.audio_key, result.audio, _CONTENT_TYPES.get(result.format, "application/octet-stream")
+        )
+        meta = {
+            "format": entry.format,
+            "duration_ms": entry.duration_ms,
+            "created_at": entry.created_at.isoformat(),
+        }
+        await self.storage.put_object(self._meta_key(digest), json.dumps(meta).encode(), "application/json")
+
+        self._remember(digest, entry)
+        return entry
+
+    async def evict(self, now: Optional[datetime] = None) -> int:
+        """Evict expired entries, then the oldest until under max_bytes.
+
+        Eviction is two-phase so that a request which read a sidecar just
+        before it was deleted can still commit its turn: a sweep deletes the
+        sidecar (the entry stops being served), and a later sweep deletes the
+        blob. Entries whose blob a turn references are skipped in both
+        phases and do not count against max_bytes: retention owns them.
+
+        Returns:
+            Number of entries evicted
+        """
+        now = now or datetime.utcnow()
+        # digest -> (oldest write, total bytes, blob keys, sidecar key)
+        entries: dict[str, tuple[datetime, int, list[str], Optional[str]]] = {}
+        for obj in await self.storage.list_objects(TTS_CACHE_PREFIX):
+            digest = obj.key.rsplit("/", 1)[-1].split(".", 1)[0]
+            written, size, blobs, meta = entries.get(digest, (obj.last_modified, 0, [], None))
+            if obj.key.endswith(".json"):
+                meta = obj.key
+            else:
+                blobs = blobs + [obj.key]
+            entries[digest] = (min(written, obj.last_modified), size + obj.size, blobs, meta)
+
+        referenced = await self.referenced(
+            [key for _, _, blobs, _ in entries.values() for key in blobs]
+        ) if entries else set()
+
+        total = sum(
+            size for _, size, blobs, _ in entries.values() if not referenced.intersection(blobs)
+        )
+        evicted = 0
+        for digest, (written, size, blobs, meta) in entries.items():
+            # Blobs whose sidecar an earlier sweep deleted
+            if meta is None and now - written >= _ORPHAN_GRACE and not referenced.intersection(blobs):
+                for key in blobs:
+                    await self.storage.delete_audio(key)
+                total -= size
+
+        by_age = sorted(entries.items(), key=lambda item: item[1][0])
+        for digest, (written, size, blobs, meta) in by_age:
+            if meta is None or referenced.intersection(blobs):
+                continue
+            if now - written < self.ttl and total <= self.max_bytes:
+                break
+            await self.storage.delete_audio(meta)
+            self._memory.pop(digest, None)
+            total -= size
+            evicted += 1
+        return evicted
+
+    async def start(self) -> None:
+        """Start the background eviction sweep (no-op if the interval is 0)."""
+        if self._task is None and self.evict_interval_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background eviction sweep."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                evicted = await self.evict()
+                if evicted:
+                    logger.info(f"Evicted {evicted} TTS cache entries")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"TTS cache eviction failed: {e}")
+            await asyncio.sleep(self.evict_interval_seconds)
+
+
+_tts_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> TTSCache:
+    """Get the process-wide TTS cache."""
+    global _tts_cache
+    if _tts_cache is None:
+        _tts_cache = TTSCache()
+    return _tts_cache
@@ -3,22 +3,33 @@
 Validates: Requirements 3.4, 3.5, 5.1, 5.2, 5.3, 5.4, 11.1
 """
 
+import asyncio
+import logging
 import uuid
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal, Optional
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.adapters.registry import get_adapter_registry
+from src.adapters.router import Kind, RoutingDecision
 from src.adapters.stt.base import STTAdapter, STTResult
 from src.adapters.tts.base import TTSAdapter, TTSResult
+from src.models.database import async_session_maker
 from src.models.entities import User, Conversation, Turn
 from src.services.normalization import NormalizationService, NormalizationResult
-from src.services.storage import StorageService
+from src.services.storage import StorageService, get_storage
+from src.services.tts_cache import TTSCache, get_tts_cache, tts_cache_key
+from src.services.tts_streaming import split_sentences, synthesize_sentences
+from src.services.vad import NoSpeechError, VADResult, trim_silence
 from src.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ProcessAudioResult:
@@ -31,6 +42,40 @@ class ProcessAudioResult:
     stt_latency_ms: int
 
 
+# Streamed replies still being synthesized or stored
+_background_tasks: set[asyncio.Task] = set()
+
+
+class ResponseAudioStream:
+    """Audio chunks of a streamed reply, fed by a background task.
+    
+    Iterating yields the chunks in order. Closing the iterator (a client
+    disconnect) does not stop the task: the reply is still completed and
+    stored, and task can be awaited for that.
+    """
+
+    _END = object()
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def put(self, chunk: bytes) -> None:
+        self._queue.put_nowait(chunk)
+
+    def finish(self) -> None:
+        self._queue.put_nowait(self._END)
+
+    def fail(self, error: BaseException) -> None:
+        self._queue.put_nowait(error)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while (item := await self._queue.get()) is not self._END:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+
 @dataclass
 class GenerateResponseResult:
     """Result of generating assistant response."""
@@ -41,29 +86,28 @@ class GenerateResponseResult:
 
 
 class AdapterFactory:
-    """Factory for creating STT/TTS adapters based on provider name.
+    """Factory for getting STT/TTS adapters based on provider name.
+    
+    Adapters are shared process-wide through the AdapterRegistry.
     
     Validates: Requirements 3.4, 3.5, 3.6
     """
 
     @staticmethod
-    def get_stt_adapter(provider: Literal["openai", "google"]) -> STTAdapter:
+    def get_stt_adapter(
+        provider: Literal["openai", "google"],
+        allowed: Optional[list[str]] = None,
+    ) -> STTAdapter:
         """Get STT adapter for provider.
         
         Args:
             provider: Provider name
+            allowed: Providers a hedged request may also be sent to; None for any
             
         Returns:
             STT adapter instance
         """
-        if provider == "openai":
-            from src.adapters.stt.openai_adapter import OpenAISTTAdapter
-            return OpenAISTTAdapter()
-        elif provider == "google":
-            from src.adapters.stt.google_adapter import GoogleSTTAdapter
-            return GoogleSTTAdapter()
-        else:
-            raise ValueError(f"Unknown STT provider: {provider}")
+        return get_adapter_registry().get_stt_adapter(provider, allowed=allowed)
 
     @staticmethod
     def get_tts_adapter(provider: Literal["openai", "google"]) -> TTSAdapter:
@@ -75,14 +119,25 @@ class AdapterFactory:
         Returns:
             TTS adapter instance
         """
-        if provider == "openai":
-            from src.adapters.tts.openai_adapter import OpenAITTSAdapter
-            return OpenAITTSAdapter()
-        elif provider == "google":
-            from src.adapters.tts.google_adapter import GoogleTTSAdapter
-            return GoogleTTSAdapter()
-        else:
-            raise ValueError(f"Unknown TTS provider: {provider}")
+        return get_adapter_registry().get_tts_adapter(provider)
+
+    @staticmethod
+    def route(
+        kind: Kind,
+        preferred: Literal["openai", "google"],
+        allowed: Optional[list[str]] = None,
+    ) -> RoutingDecision:
+        """Choose the provider for a request, moving off a degraded one.
+        
+        Args:
+            kind: "stt" or "tts"
+            preferred: The user's configured provider
+            allowed: Providers the user may be routed to; None for any
+            
+        Returns:
+            Routing decision naming the provider to use
+        """
+        return get_adapter_registry().router.choose(kind, preferred, allowed)
 
 
 class VoiceSessionService:
@@ -91,17 +146,37 @@ class VoiceSessionService:
     Validates: Requirements 3.4, 3.5, 5.1, 5.2, 5.3, 5.4, 11.1
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        storage: Optional[StorageService] = None,
+        tts_cache: Optional[TTSCache] = None,
+        session_maker: Optional[async_sessionmaker] = None,
+    ):
         """Initialize voice session service.
         
         Args:
             db: Database session
+            storage: Storage service; defaults to the shared instance
+            tts_cache: TTS output cache; defaults to the shared instance
+                unless TTS_CACHE_ENABLED is off
+            session_maker: Sessions for work that outlives the request
+                (streamed replies); defaults to the app's session maker
         """
         self.db = db
         self.settings = get_settings()
-        self.storage = StorageService()
+        self.storage = storage or get_storage()
+        self._tts_cache = tts_cache
+        self._session_maker = session_maker or async_session_maker
         self._normalization_service: Optional[NormalizationService] = None
 
+    @property
+    def tts_cache(self) -> Optional[TTSCache]:
+        """Get the TTS cache, or None if caching is disabled."""
+        if self._tts_cache is None and self.settings.tts_cache_enabled:
+            self._tts_cache = get_tts_cache()
+        return self._tts_cache
+
     @property
     def normalization(self) -> NormalizationService:
         """Get normalization service (lazy init)."""
@@ -156,6 +231,7 @@ class VoiceSessionService:
         session_id: str,
         audio: bytes,
         user_id: str,
+        stt_result: Optional[STTResult] = None,
     ) -> ProcessAudioResult:
         """Process audio input through STT and normalization.
         
@@ -163,82 +239,98 @@ class VoiceSessionService:
             session_id: Conversation/session ID
             audio: Audio data as bytes
             user_id: User ID
+            stt_result: Transcription already produced by a streaming session;
+                when given, the STT call is skipped (silent audio is still
+                rejected)
             
         Returns:
             ProcessAudioResult with transcripts and confidence
             
+        Raises:
+            ValueError: If the session or user does not exist
+            NoSpeechError: If the audio contains no speech (nothing is stored)
+            
         Validates: Requirements 3.4, 5.1, 5.2
         """
-        # Get user settings
-        user = await self.get_user(str(user_id))
-        if not user:
+        # Silence is trimmed from what STT gets; the original audio is stored
+        vad = await self._detect_speech(audio)
+        if vad.analysed and vad.speech_ms < self.settings.vad_min_speech_ms and self.settings.vad_reject_silent:
+            raise NoSpeechError(f"No speech detected in {vad.original_ms} ms of audio")
+
+        # One round trip: the session must exist, plus the user's settings
+        found, language, stt_provider, allowed_providers = await self._load_turn_context(
+            str(session_id), str(user_id)
+        )
+        if not found:
+            raise ValueError(f"Session {session_id} not found")
+        if language is None:
             raise ValueError(f"User {user_id} not found")
 
-        # Get conversation
-        query = select(Conversation).where(Conversation.id == str(session_id))
-        result = await self.db.execute(query)
-        conversation = result.scalar_one_or_none()
-        if not conversation:
+        turn_id = str(uuid.uuid4())
+
+        # Store input audio while STT and normalization run
+        upload = asyncio.create_task(
+            self._store_input_audio(audio, str(user_id), str(session_id), turn_id)
+        )
+        try:
+            if stt_result is None:
+                # User's provider, unless it is degraded right now
+                stt_provider = AdapterFactory.route("stt", stt_provider, allowed_providers).provider
+                stt_adapter = AdapterFactory.get_stt_adapter(stt_provider, allowed_providers)
+
+                # Transcribe audio
+                stt_result = await stt_adapter.transcribe(
+                    audio=vad.audio,
+                    language=language,
+                )
+
+            # Normalize transcript
+            norm_result = await self.normalization.normalize(
+                text=stt_result.text,
+                language=language,
+                stt_confidence=stt_result.confidence,
+            )
+        finally:
+            # Never leave the upload running past the request
+            audio_key = await upload
+
+        # Taking the number locks the conversation row until commit, so it
+        # happens only now: concurrent uploads to the session wait for each
+        # other's insert, not for each other's provider call
+        turn_number = await self._next_turn_number(str(session_id))
+        if turn_number is None:
             raise ValueError(f"Session {session_id} not found")
 
-        # Create turn
-        turn_number = await self._get_next_turn_number(str(session_id))
+        # Insert the complete turn once
         turn = Turn(
-            id=str(uuid.uuid4()),
+            id=turn_id,
             conversation_id=str(session_id),
             turn_number=turn_number,
+            audio_input_url=audio_key,
+            audio_input_duration_ms=vad.original_ms if vad.analysed else None,
+            raw_transcript=norm_result.raw_transcript,
+            normalized_transcript=norm_result.normalized_transcript,
+            transcript_confidence=stt_result.confidence,
+            # Cached results cost no provider call; keep them out of latency metrics
+            stt_latency_ms=None if stt_result.cached else stt_result.latency_ms,
+            stt_provider=stt_result.provider or stt_provider,
+            stt_words=[
+                {"word": w.word, "start": w.start, "end": w.end, "confidence": w.confidence}
+                for w in stt_result.words
+            ],
+            low_confidence=stt_result.confidence < self.settings.normalization_confidence_threshold,
         )
         self.db.add(turn)
         await self.db.flush()
 
-        # Upload audio to storage
-        audio_key = await self.storage.upload_audio(
-            audio=audio,
-            user_id=user_id,
-            conversation_id=session_id,
-            turn_id=turn.id,
-            file_type="input.wav",
-        )
-        turn.audio_input_url = audio_key
-
-        # Get STT adapter based on user settings
-        stt_adapter = AdapterFactory.get_stt_adapter(user.stt_provider)
-
-        # Transcribe audio
-        stt_result = await stt_adapter.transcribe(
-            audio=audio,
-            language=user.language,
+        # Create or bump pending unknown terms in one statement
+        await self.normalization.record_pending_terms(
+            norm_result.unknown_terms_created,
+            language=language,
+            context=norm_result.raw_transcript,
+            provider=stt_result.provider or stt_provider,
         )
 
-        # Normalize transcript
-        norm_result = await self.normalization.normalize(
-            text=stt_result.text,
-            language=user.language,
-            stt_confidence=stt_result.confidence,
-        )
-
-        # Update turn with results
-        turn.raw_transcript = norm_result.raw_transcript
-        turn.normalized_transcript = norm_result.normalized_transcript
-        turn.transcript_confidence = stt_result.confidence
-        turn.stt_latency_ms = stt_result.latency_ms
-        turn.stt_words = [
-            {"word": w.word, "start": w.start, "end": w.end, "confidence": w.confidence}
-            for w in stt_result.words
-        ]
-        turn.low_confidence = stt_result.confidence < self.settings.normalization_confidence_threshold
-
-        # Create pending unknown terms
-        for term in norm_result.unknown_terms_created:
-            await self.normalization.create_pending_term(
-                heard_variant=term,
-                language=user.language,
-                context=norm_result.raw_transcript,
-                provider=user.stt_provider,
-            )
-
-        await self.db.flush()
-
         return ProcessAudioResult(
             turn_id=turn.id,
             raw_transcript=norm_result.raw_transcript,
@@ -289,7 +381,7 @@ class VoiceSessionService:
                     heard_variant=turn.raw_transcript,
                     language=user.language,
                     context=correction,
-                    provider=conversation.stt_provider_used,
+                    provider=turn.stt_provider or conversation.stt_provider_used,
                 )
 
         await self.db.flush()
@@ -312,48 +404,40 @@ class VoiceSessionService:
             
         Validates: Requirements 3.5, 5.3
         """
-        # Get turn
-        query = select(Turn).where(Turn.id == str(turn_id), Turn.conversation_id == str(session_id))
-        result = await self.db.execute(query)
-        turn = result.scalar_one_or_none()
-        if not turn:
-            raise ValueError(f"Turn {turn_id} not found")
-
-        # Get conversation and user
-        conv_query = select(Conversation).where(Conversation.id == str(session_id))
-        conv_result = await self.db.execute(conv_query)
-        conversation = conv_result.scalar_one()
-
-        user_query = select(User).where(User.id == str(conversation.user_id))
-        user_result = await self.db.execute(user_query)
-        user = user_result.scalar_one()
+        turn, user = await self._get_turn_and_user(session_id, turn_id)
+        tts_provider = AdapterFactory.route("tts", user.tts_provider, user.allowed_providers).provider
+
+        start_time = time.perf_counter()
+        digest = tts_cache_key(tts_provider, None, user.language, 1.0, assistant_text)
+        cached = await self.tts_cache.get(digest) if self.tts_cache else None
+
+        if cached is not None:
+            # Reuse the stored audio: no provider call, no upload
+            audio_key = cached.audio_key
+            duration_ms = cached.duration_ms
+            latency_ms = int((time.perf_counter() - start_time) * 1000)
+            provider_latency_ms = None
+        else:
+            # Get TTS adapter
+            tts_adapter = AdapterFactory.get_tts_adapter(tts_provider)
 
-        # Get TTS adapter
-        tts_adapter = AdapterFactory.get_tts_adapter(user.tts_provider)
+            # Synthesize speech
+            tts_result = await tts_adapter.synthesize(
+                text=assistant_text,
+                language=user.language,
+            )
 
-        # Synthesize speech
-        tts_result = await tts_adapter.synthesize(
-            text=assistant_text,
-            language=user.language,
-        )
+            audio_key = await self._store_output_audio(tts_result, digest, user.id, session_id, turn_id)
+            duration_ms = tts_result.duration_ms
+            latency_ms = provider_latency_ms = tts_result.latency_ms
 
-        # Upload audio - use format from TTS result
-        file_ext = "wav" if tts_result.format == "wav" else "mp3"
-        content_type = "audio/wav" if tts_result.format == "wav" else "audio/mpeg"
-        audio_key = await self.storage.upload_audio(
-            audio=tts_result.audio,
-            user_id=user.id,
-            conversation_id=session_id,
-            turn_id=turn_id,
-            file_type=f"output.{file_ext}",
-            content_type=content_type,
-        )
-
-        # Update turn
+        # Update turn; cache hits leave tts_latency_ms empty so provider
+        # latency metrics only count real synthesis
         turn.assistant_text = assistant_text
         turn.audio_output_url = audio_key
-        turn.audio_output_duration_ms = tts_result.duration_ms
-        turn.tts_latency_ms = tts_result.latency_ms
+        turn.audio_output_duration_ms = duration_ms
+        turn.tts_latency_ms = provider_latency_ms
+        turn.tts_provider = tts_provider
 
         await self.db.flush()
 
@@ -363,8 +447,120 @@ class VoiceSessionService:
         return GenerateResponseResult(
             assistant_text=assistant_text,
             audio_url=audio_url,
-            tts_latency_ms=tts_result.latency_ms,
+            tts_latency_ms=latency_ms,
+        )
+
+    async def stream_response(
+        self,
+        session_id: str,
+        turn_id: str,
+        assistant_text: str,
+    ) -> "ResponseAudioStream":
+        """Synthesize a response sentence by sentence, streaming MP3 audio.
+        
+        The turn is looked up before anything is streamed, so a missing
+        turn fails the request up front. Sentences are synthesized
+        concurrently by a background task and their audio is streamed in
+        order. Once the last sentence is done, that task stores the
+        assembled file (in the TTS cache when enabled) and updates the turn
+        as in generate_response, in its own database session. A client that
+        disconnects mid-stream stops receiving audio, but the reply is
+        still completed and stored. The turn's tts_latency_ms is the time to
+        the first audio chunk.
+        
+        Args:
+            session_id: Conversation ID
+            turn_id: Turn ID
+            assistant_text: Text to synthesize
+            
+        Returns:
+            Async iterable of MP3 audio chunks
+            
+        Raises:
+            ValueError: If the turn does not exist
+            
+        Validates: Requirements 3.5, 5.3, 11.4
+        """
+        turn, user = await self._get_turn_and_user(session_id, turn_id)
+        stream = ResponseAudioStream()
+        stream.task = asyncio.create_task(
+            self._synthesize_and_store(stream, user, str(session_id), turn.id, assistant_text)
         )
+        _background_tasks.add(stream.task)
+        stream.task.add_done_callback(_background_tasks.discard)
+        return stream
+
+    async def _synthesize_and_store(
+        self,
+        stream: "ResponseAudioStream",
+        user: User,
+        session_id: str,
+        turn_id: str,
+        assistant_text: str,
+    ) -> None:
+        try:
+            tts_provider = AdapterFactory.route("tts", user.tts_provider, user.allowed_providers).provider
+            start_time = time.perf_counter()
+            digest = tts_cache_key(tts_provider, None, user.language, 1.0, assistant_text)
+            cached = await self.tts_cache.get(digest) if self.tts_cache else None
+            audio = await self.storage.get_object(cached.audio_key) if cached else None
+
+            if audio is not None:
+                stream.put(audio)
+                audio_key = cached.audio_key
+                duration_ms = cached.duration_ms
+                first_chunk_ms = None
+            else:
+                tts_adapter = AdapterFactory.get_tts_adapter(tts_provider)
+                chunks: list[bytes] = []
+                duration_ms = 0
+                first_chunk_ms = None
+                async for part in synthesize_sentences(
+                    tts_adapter,
+                    split_sentences(assistant_text),
+                    language=user.language,
+                    max_concurrency=self.settings.tts_stream_max_concurrency,
+                ):
+                    if first_chunk_ms is None:
+                        first_chunk_ms = int((time.perf_counter() - start_time) * 1000)
+                    chunks.append(part.audio)
+                    duration_ms += part.duration_ms
+                    stream.put(part.audio)
+        except asyncio.CancelledError as e:
+            stream.fail(e)
+            raise
+        except Exception as e:
+            # The client sees the error; nothing was synthesized to store
+            stream.fail(e)
+            return
+        stream.finish()
+
+        # The client already has every chunk; storing doesn't hold up playback
+        try:
+            if audio is None:
+                assembled = TTSResult(
+                    audio=b"".join(chunks),
+                    format="mp3",
+                    duration_ms=duration_ms,
+                    latency_ms=first_chunk_ms or 0,
+                )
+                audio_key = await self._store_output_audio(assembled, digest, user.id, session_id, turn_id)
+
+            async with self._session_maker() as db:
+                await db.execute(
+                    update(Turn)
+                    .where(Turn.id == turn_id)
+                    .values(
+                        assistant_text=assistant_text,
+                        audio_output_url=audio_key,
+                        audio_output_duration_ms=duration_ms,
+                        tts_latency_ms=first_chunk_ms,
+                        tts_provider=tts_provider,
+                    )
+                )
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to store streamed response for turn {turn_id}: {e}")
 
     async def end_session(self, session_id: str) -> None:
         """End a voice session.
@@ -379,9 +575,135 @@ class VoiceSessionService:
             conversation.ended_at = datetime.utcnow()
             await self.db.flush()
 
-    async def _get_next_turn_number(self, session_id: str) -> int:
-        """Get next turn number for session."""
-        query = select(Turn).where(Turn.conversation_id == str(session_id))
+    async def _get_turn_and_user(self, session_id: str, turn_id: str) -> tuple[Turn, User]:
+        """Load a turn of the session and the session's user.
+        
+        Raises:
+            ValueError: If the turn does not exist
+        """
+        query = select(Turn).where(Turn.id == str(turn_id), Turn.conversation_id == str(session_id))
         result = await self.db.execute(query)
-        turns = result.scalars().all()
-        return len(turns) + 1
+        turn = result.scalar_one_or_none()
+        if not turn:
+            raise ValueError(f"Turn {turn_id} not found")
+
+        user_query = (
+            select(User)
+            .join(Conversation, Conversation.user_id == User.id)
+            .where(Conversation.id == str(session_id))
+        )
+        user_result = await self.db.execute(user_query)
+        return turn, user_result.scalar_one()
+
+    async def _store_output_audio(
+        self,
+        tts_result: TTSResult,
+        digest: str,
+        user_id: str,
+        session_id: str,
+        turn_id: str,
+    ) -> str:
+        """Store synthesized speech and return its key.
+        
+        Goes to the shared TTS cache when enabled, otherwise to the turn's
+        own output file.
+        """
+        if self.tts_cache:
+            return (await self.tts_cache.put(digest, tts_result)).audio_key
+
+        # Upload audio - use format from TTS result
+        file_ext = "wav" if tts_result.format == "wav" else "mp3"
+        content_type = "audio/wav" if tts_result.format == "wav" else "audio/mpeg"
+        return await self.storage.upload_audio(
+            audio=tts_result.audio,
+            user_id=user_id,
+            conversation_id=session_id,
+            turn_id=turn_id,
+            file_type=f"output.{file_ext}",
+            content_type=content_type,
+        )
+
+    async def _store_input_audio(
+        self, audio: bytes, user_id: str, session_id: str, turn_id: str
+    ) -> str:
+        """Upload a turn's input audio and return its key.
+        
+        A failed upload is logged rather than failing the turn; the key is
+        still returned so the turn records where the audio belongs.
+        """
+        try:
+            return await self.storage.upload_audio(
+                audio=audio,
+                user_id=user_id,
+                conversation_id=session_id,
+                turn_id=turn_id,
+                file_type="input.wav",
+            )
+        except Exception as e:
+            logger.error(f"Failed to store input audio for turn {turn_id}: {e}")
+            return self.storage.audio_key(user_id, session_id, turn_id, "input.wav")
+
+    async def _detect_speech(self, audio: bytes) -> VADResult:
+        """Trim silence for STT, off the event loop (frame analysis is CPU work)."""
+        if not self.settings.vad_enabled:
+            return VADResult(audio=audio, analysed=False)
+        vad = await asyncio.to_thread(
+            trim_silence,
+            audio,
+            padding_ms=self.settings.vad_padding_ms,
+            max_pause_ms=self.settings.vad_max_pause_ms,
+            margin_db=self.settings.vad_margin_db,
+            floor_db=self.settings.vad_floor_db,
+        )
+        if not vad.analysed:
+            logger.debug("VAD skipped: upload is not 16-bit PCM WAV")
+        elif vad.trimmed_ms:
+            logger.debug(f"VAD trimmed {vad.trimmed_ms} of {vad.original_ms} ms before STT")
+        return vad
+
+    async def _load_turn_context(
+        self, session_id: str, user_id: str
+    ) -> tuple[bool, Optional[str], Optional[str], Optional[list]]:
+        """Check the session exists and load the user's settings together.
+        
+        The user's language, STT provider and allowed providers ride along
+        as scalar subqueries of a plain SELECT on the conversation, so
+        nothing is locked while STT runs.
+        
+        Returns:
+            (session found, language, stt_provider, allowed_providers); the
+            user settings are None if the session or user does not exist
+        """
+        def user_column(column):
+            return select(column).where(User.id == user_id).scalar_subquery()
+
+        query = select(
+            Conversation.id,
+            user_column(User.language),
+            user_column(User.stt_provider),
+            user_column(User.allowed_providers),
+        ).where(Conversation.id == session_id)
+        row = (await self.db.execute(query)).first()
+        if row is None:
+            return False, None, None, None
+        return True, row[1], row[2], row[3]
+
+    async def _next_turn_number(self, session_id: str) -> Optional[int]:
+        """Take the next turn number from the conversation's counter.
+        
+        A single UPDATE ... RETURNING: concurrent uploads to the same session
+        are serialized by the row lock and never get the same number
+        (uq_turn_number backs this up). The lock is held until the
+        transaction ends, so call this right before inserting the turn.
+        
+        Returns:
+            The turn number, or None if the session does not exist
+        """
+        query = (
+            update(Conversation)
+            .where(Conversation.id == session_id)
+            .values(next_turn_number=Conversation.next_turn_number + 1)
+            .returning(Conversation.next_turn_number - 1)
+            .execution_options(synchronize_session=False)
+        )
+        return (await self.db.execute(query)).scalar_one_or_none()
@@ -0,0 +1,146 @@
+"""Tests for the process-wide adapter registry."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import httpx
+import pytest
+
+from src.adapters.registry import AdapterRegistry, PoolStats, _CountingTransport
+from src.config import Settings
+
+
+def make_registry() -> AdapterRegistry:
+    return AdapterRegistry(Settings(openai_api_key="sk-test", provider_http2=False))
+
+
+class TestAdapterRegistry:
+    """Adapters and connection pools are built once and reused."""
+
+    @pytest.mark.asyncio
+    async def test_adapters_are_reused(self):
+        registry = make_registry()
+
+        assert registry.get_stt_adapter("openai") is registry.get_stt_adapter("openai")
+        assert registry.get_tts_adapter("google") is registry.get_tts_adapter("google")
+
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stt_and_tts_share_provider_pool(self):
+        registry = make_registry()
+
+        registry.get_stt_adapter("openai")
+        registry.get_tts_adapter("openai")
+
+        assert len(registry._clients) == 1
+        assert set(registry.stats()["pools"]) == {"openai"}
+
+        await registry.aclose()
+        assert registry._clients == {}
+
+    def test_unknown_provider_raises(self):
+        registry = make_registry()
+
+        with pytest.raises(ValueError):
+            registry.get_stt_adapter("azure")
+
+    @pytest.mark.asyncio
+    async def test_hedging_wraps_both_providers(self):
+        from src.adapters.stt.hedged import HedgedSTTAdapter
+
+        registry = AdapterRegistry(
+            Settings(openai_api_key="sk-test", provider_http2=False, stt_hedging_enabled=True)
+        )
+
+        adapter = registry.get_stt_adapter("openai")
+
+        assert isinstance(adapter, HedgedSTTAdapter)
+        assert adapter.primary is registry.get_stt_adapter("openai", hedged=False)
+        assert adapter.pick_secondary(None) is registry.get_stt_adapter("google", hedged=False)
+        assert set(registry.stats()["stt_hedging"]) == {"openai"}
+
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_hedge_partner_must_be_allowed_and_healthy(self):
+        """Audio only goes to a second provider the user allows and the router trusts."""
+        from src.adapters.stt.base import STTRateLimitError
+
+        registry = AdapterRegistry(
+            Settings(openai_api_key="sk-test", provider_http2=False, stt_hedging_enabled=True)
+        )
+
+        restricted = registry.get_stt_adapter("openai", allowed=["openai"])
+        assert restricted.pick_secondary(restricted.allowed) is None
+        # Scoped views share one set of stats per primary
+        assert restricted.stats is registry.get_stt_adapter("openai").stats
+
+        registry.router.record("stt", "google", None, STTRateLimitError("slow down", provider="google"))
+        adapter = registry.get_stt_adapter("openai")
+        assert adapter.pick_secondary(adapter.allowed) is None
+
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_uncached_adapter_skips_the_result_cache(self):
+        """Comparisons measure a fresh provider request every time."""
+        from src.adapters.stt.caching import CachingSTTAdapter
+
+        registry = make_registry()
+
+        cached = registry.get_stt_adapter("openai", hedged=False)
+        uncached = registry.get_stt_adapter("openai", cached=False)
+
+        assert isinstance(cached, CachingSTTAdapter)
+        assert cached.adapter is uncached
+        assert registry.get_stt_adapter("openai", cached=False) is uncached
+
+        await registry.aclose()
+
+
+class TestPoolStats:
+    """In-flight requests are counted by the pool transport."""
+
+    @pytest.mark.asyncio
+    async def test_counting_transport_tracks_requests(self):
+        stats = PoolStats(max_connections=4)
+        transport = _CountingTransport(
+            # Unread body, as from a real connection
+            httpx.MockTransport(lambda request: httpx.Response(200, stream=httpx.ByteStream(b""))), stats
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://provider.test/")
+            await client.get("https://provider.test/")
+
+        assert stats.total_requests == 2
+        assert stats.in_flight == 0
+        assert stats.peak_in_flight == 1
+        assert stats.peak_saturation == 0.25
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_counts_until_closed(self):
+        stats = PoolStats(max_connections=4)
+        transport = _CountingTransport(
+            httpx.MockTransport(lambda request: httpx.Response(200, stream=httpx.ByteStream(b"audio" * 100))),
+            stats,
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with client.stream("GET", "https://provider.test/") as response:
+                assert stats.in_flight == 1
+                await response.aread()
+            assert stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_client_has_a_timeout(self):
+        registry = AdapterRegistry(Settings(openai_api_key="sk-test", provider_http2=False))
+
+        timeout = registry._http_client("openai").timeout
+
+        assert timeout.read == registry.settings.provider_http_timeout_seconds
+        assert timeout.connect == registry.settings.provider_http_connect_timeout_seconds
+        await registry.aclose()
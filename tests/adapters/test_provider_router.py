@@ -0,0 +1,187 @@
+"""Tests for latency- and error-aware provider routing.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.4, 3.5, 3.6**
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.adapters.router import MonitoredSTTAdapter, MonitoredTTSAdapter, ProviderRouter
+from src.adapters.stt.base import STTCircuitOpenError, STTError, STTInvalidAudioError, STTTimeoutError
+from src.adapters.tts.base import TTSRateLimitError, TTSTextTooLongError
+from tests.conftest import FakeSTTAdapter
+
+
+def make_router(**kwargs) -> ProviderRouter:
+    options = dict(window_seconds=60, min_samples=3, max_error_rate=0.3, max_p90_latency_ms=5000)
+    options.update(kwargs)
+    return ProviderRouter(**options)
+
+
+class TestProviderRouter:
+    """Traffic moves off degraded providers and back once they recover."""
+
+    def test_healthy_provider_is_kept(self):
+        router = make_router()
+        for _ in range(5):
+            router.record("stt", "openai", 800, now=0)
+
+        decision = router.choose("stt", "openai", now=1)
+
+        assert decision.provider == "openai" and not decision.rerouted
+
+    def test_rate_limit_reroutes_until_cooldown(self):
+        router = make_router(rate_limit_cooldown_seconds=30)
+        router.record("tts", "openai", None, TTSRateLimitError("429", provider="openai"), now=0)
+
+        decision = router.choose("tts", "openai", now=10)
+        assert decision.provider == "google"
+        assert decision.reason == "degraded:rate_limited"
+
+        assert router.choose("tts", "openai", now=40).provider == "openai"
+        assert router.reroutes == {"tts:openai->google": 1}
+
+    def test_error_rate_needs_enough_samples(self):
+        router = make_router()
+        router.record("stt", "openai", None, STTTimeoutError("timeout", provider="openai"), now=0)
+        assert router.choose("stt", "openai", now=1).provider == "openai"
+
+        router.record("stt", "openai", None, STTError("500", provider="openai"), now=1)
+        router.record("stt", "openai", 900, now=1)
+
+        health = router.health("stt", "openai", now=2)
+        assert health.timeouts == 1
+        assert health.degraded_reason == "errors"
+        assert router.choose("stt", "openai", now=2).provider == "google"
+
+    def test_slow_provider_is_degraded(self):
+        router = make_router()
+        for _ in range(3):
+            router.record("stt", "google", 9000, now=0)
+
+        assert router.choose("stt", "google", now=1).reason == "degraded:latency"
+
+    def test_window_forgets_old_samples(self):
+        router = make_router()
+        for _ in range(3):
+            router.record("stt", "google", 9000, now=0)
+
+        assert router.choose("stt", "google", now=120).provider == "google"
+
+    def test_allowed_set_limits_alternatives(self):
+        router = make_router()
+        for _ in range(3):
+            router.record("stt", "openai", None, STTError("500", provider="openai"), now=0)
+
+        decision = router.choose("stt", "openai", allowed=["openai"], now=1)
+
+        assert decision.provider == "openai" and decision.reason == "all_degraded"
+
+    def test_open_circuit_reroutes(self):
+        router = make_router()
+        router.record("stt", "openai", None, STTCircuitOpenError("open", provider="openai"), now=0)
+
+        assert router.choose("stt", "openai", now=1).reason == "degraded:circuit_open"
+
+    def test_disabled_router_never_reroutes(self):
+        router = make_router(enabled=False)
+        for _ in range(3):
+            router.record("stt", "openai", None, STTError("500", provider="openai"), now=0)
+
+        assert router.choose("stt", "openai", now=1).provider == "openai"
+
+    def test_window_is_bounded(self):
+        router = make_router(max_samples=10)
+        for _ in range(50):
+            router.record("stt", "openai", None, STTTimeoutError("timeout", provider="openai"), now=0)
+
+        health = router.health("stt", "openai", now=1)
+        assert health.requests == 10
+        assert health.timeouts == 10
+
+    def test_only_route_changes_are_logged(self, caplog):
+        router = make_router(rate_limit_cooldown_seconds=30)
+        router.record("tts", "openai", None, TTSRateLimitError("429", provider="openai"), now=0)
+
+        with caplog.at_level(logging.INFO, logger="src.adapters.router"):
+            for now in (1, 2, 3, 40, 41):
+                router.choose("tts", "openai", now=now)
+
+        assert [r.getMessage() for r in caplog.records] == [
+            "Routing tts from openai to google (degraded:rate_limited)",
+            "Routing tts from openai to openai (preferred)",
+        ]
+
+
+class TestMonitoredAdapter:
+    """Wrapped adapters report outcomes and stamp the provider."""
+
+    @pytest.mark.asyncio
+    async def test_records_success_and_failure(self):
+        router = make_router()
+        failing = FakeSTTAdapter(errors=[STTTimeoutError("timeout", provider="openai")])
+
+        result = await MonitoredSTTAdapter(FakeSTTAdapter(), router).transcribe(b"audio")
+        with pytest.raises(STTTimeoutError):
+            await MonitoredSTTAdapter(failing, router).transcribe(b"audio")
+
+        health = router.health("stt", "openai")
+        assert result.provider == "openai"
+        assert health.requests == 2
+        assert health.error_rate == 0.5
+        assert health.timeouts == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_records_latency(self):
+        """A slow primary cancelled by the hedge still counts towards p90."""
+        router = make_router()
+        call = asyncio.create_task(MonitoredSTTAdapter(FakeSTTAdapter(delay=10), router).transcribe(b"audio"))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        health = router.health("stt", "openai")
+        assert health.requests == 1
+        assert health.error_rate == 0
+        assert health.p90_latency_ms >= 50
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_flip_the_route(self):
+        """Invalid audio from one client says nothing about the provider."""
+        router = make_router()
+        errors = [STTInvalidAudioError("format", provider="openai") for _ in range(10)]
+        errors.append(STTError("400", provider="openai", details={"status_code": 400}))
+        adapter = MonitoredSTTAdapter(FakeSTTAdapter(errors=errors), router)
+
+        for _ in errors:
+            with pytest.raises(STTError):
+                await adapter.transcribe(b"audio")
+        await adapter.transcribe(b"audio")
+
+        health = router.health("stt", "openai")
+        assert health.error_rate == 0 and health.requests == 1
+        assert router.choose("stt", "openai").provider == "openai"
+
+    @pytest.mark.asyncio
+    async def test_tts_client_errors_are_not_counted(self):
+        class LongTextTTSAdapter:
+            async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+                raise TTSTextTooLongError("long", provider="openai")
+
+            def get_provider_name(self) -> str:
+                return "openai"
+
+        router = make_router()
+        for _ in range(5):
+            with pytest.raises(TTSTextTooLongError):
+                await MonitoredTTSAdapter(LongTextTTSAdapter(), router).synthesize("x" * 5000)
+
+        assert router.health("tts", "openai").requests == 0
@@ -0,0 +1,207 @@
+"""Tests for provider deadlines, retries and circuit breaking.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.4, 3.5, 12.1, 12.2**
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.adapters.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    ResilientSTTAdapter,
+    RetryPolicy,
+    is_retryable,
+)
+from src.adapters.stt.base import (
+    STTCircuitOpenError,
+    STTError,
+    STTInvalidAudioError,
+    STTRateLimitError,
+    STTTimeoutError,
+)
+from src.adapters.tts.base import TTSTextTooLongError
+from tests.conftest import FakeSTTAdapter
+
+FAST = RetryPolicy(deadline_seconds=1.0, max_attempts=3, base_delay_seconds=0.001, max_delay_seconds=0.001)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIsRetryable:
+    """Transient provider failures are retried, bad input is not."""
+
+    @pytest.mark.parametrize(
+        "error, retryable",
+        [
+            (STTTimeoutError("t", provider="openai"), True),
+            (STTRateLimitError("429", provider="openai"), True),
+            (STTError("500", provider="openai", details={"status_code": 503}), True),
+            (STTError("conn", provider="openai"), True),
+            (ConnectionError("reset"), True),
+            (STTError("400", provider="openai", details={"status_code": 400}), False),
+            (STTInvalidAudioError("format", provider="openai"), False),
+            (TTSTextTooLongError("long", provider="openai"), False),
+        ],
+    )
+    def test_classification(self, error, retryable):
+        assert is_retryable(error) is retryable
+
+
+class TestCircuitBreaker:
+    """closed -> open after consecutive failures -> half-open probe."""
+
+    def test_state_transitions(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # one probe at a time
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+        clock.now = 20
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.to_dict() == {"state": CLOSED, "consecutive_failures": 0, "times_opened": 2, "rejected": 2}
+
+
+class TestResilientSTTAdapter:
+    """Retries within the deadline, then fail fast once the circuit opens."""
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        inner = FakeSTTAdapter(errors=[STTRateLimitError("429", provider="openai")])
+        adapter = ResilientSTTAdapter(inner, FAST, CircuitBreaker())
+
+        assert (await adapter.transcribe(b"audio")).text == "openai"
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_bad_input_is_not_retried(self):
+        inner = FakeSTTAdapter(errors=[STTInvalidAudioError("format", provider="openai")])
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        with pytest.raises(STTInvalidAudioError):
+            await ResilientSTTAdapter(inner, FAST, breaker).transcribe(b"audio")
+
+        assert inner.calls == 1
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_the_call(self):
+        inner = FakeSTTAdapter(delay=5)
+        policy = RetryPolicy(deadline_seconds=0.05)
+
+        with pytest.raises(STTTimeoutError) as info:
+            await ResilientSTTAdapter(inner, policy, CircuitBreaker()).transcribe(b"audio")
+
+        assert info.value.details["deadline_seconds"] == 0.05
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        errors = [STTError("502", provider="openai", details={"status_code": 502}) for _ in range(3)]
+        inner = FakeSTTAdapter(errors=errors)
+        adapter = ResilientSTTAdapter(inner, FAST, CircuitBreaker(failure_threshold=3, reset_timeout_seconds=60))
+
+        with pytest.raises(STTError):
+            await adapter.transcribe(b"audio")
+        with pytest.raises(STTCircuitOpenError):
+            await adapter.transcribe(b"audio")
+
+        assert inner.calls == 3
+        assert adapter.breaker.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_frees_the_slot(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=1, clock=clock)
+        breaker.record_failure()
+        clock.now = 1
+        adapter = ResilientSTTAdapter(FakeSTTAdapter(delay=5), FAST, breaker)
+
+        probe = asyncio.create_task(adapter.transcribe(b"audio"))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_bad_input_does_not_reset_failures(self):
+        """A client error between provider failures does not hide them from the breaker."""
+        errors = [
+            STTError("502", provider="openai", details={"status_code": 502}),
+            STTInvalidAudioError("format", provider="openai"),
+            STTError("502", provider="openai", details={"status_code": 502}),
+        ]
+        single = RetryPolicy(deadline_seconds=1.0, max_attempts=1)
+        adapter = ResilientSTTAdapter(FakeSTTAdapter(errors=errors), single, CircuitBreaker(failure_threshold=2))
+
+        for _ in errors:
+            with pytest.raises(STTError):
+                await adapter.transcribe(b"audio")
+
+        assert adapter.breaker.state == OPEN
+
+
+async def _chunks():
+    for _ in range(3):
+        yield b"x" * 10
+
+
+class TestResilientSTTStreaming:
+    """Streaming goes through the breaker like single requests."""
+
+    @pytest.mark.asyncio
+    async def test_stream_failures_open_the_circuit(self):
+        errors = [STTError("502", provider="openai", details={"status_code": 502}) for _ in range(2)]
+        adapter = ResilientSTTAdapter(FakeSTTAdapter(errors=errors), FAST, CircuitBreaker(failure_threshold=2))
+
+        for _ in errors:
+            with pytest.raises(STTError):
+                [e async for e in adapter.transcribe_stream(_chunks(), partial_every=0)]
+        with pytest.raises(STTCircuitOpenError):
+            [e async for e in adapter.transcribe_stream(_chunks(), partial_every=0)]
+
+    @pytest.mark.asyncio
+    async def test_stream_is_a_single_half_open_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=1, clock=clock)
+        breaker.record_failure()
+        clock.now = 1
+        adapter = ResilientSTTAdapter(FakeSTTAdapter(), FAST, breaker)
+
+        probe = adapter.transcribe_stream(_chunks(), partial_every=1)
+        first = await probe.__anext__()
+        with pytest.raises(STTCircuitOpenError):
+            await adapter.transcribe(b"audio")
+
+        events = [first] + [e async for e in probe]
+        assert events[-1].is_final
+        assert breaker.state == CLOSED
@@ -4,6 +4,7 @@
 **Validates: Requirements 12.1, 12.2**
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -15,7 +16,8 @@ from hypothesis import given, strategies as st, settings
 from dataclasses import fields
 
 # Import only base classes (no external dependencies)
-from src.adapters.stt.base import STTAdapter, STTResult, STTWord
+from src.adapters.stt.base import STTAdapter, STTResult, STTStreamResult, STTWord
+from tests.conftest import FakeSTTAdapter
 
 
 class TestSTTResultSchema:
@@ -150,3 +152,62 @@ class TestSTTResultDataclass:
         assert required_fields.issubset(field_names), (
             f"Missing fields: {required_fields - field_names}"
         )
+
+
+def length_adapter() -> FakeSTTAdapter:
+    """Adapter that "transcribes" audio as its byte length."""
+    return FakeSTTAdapter(text=lambda audio: str(len(audio)))
+
+
+async def _chunk_stream(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestSTTStreaming:
+    """Test the default streaming transcription on STTAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_final_result_covers_all_chunks(self):
+        """The final result is produced from the concatenation of every chunk."""
+        adapter = length_adapter()
+        chunks = [b"x" * 10 for _ in range(25)]
+
+        events = [e async for e in adapter.transcribe_stream(_chunk_stream(chunks), partial_every=5)]
+
+        assert all(isinstance(e, STTStreamResult) for e in events)
+        assert events[-1].is_final
+        assert events[-1].result.text == "250"
+        assert not any(e.is_final for e in events[:-1])
+
+    @pytest.mark.asyncio
+    async def test_partial_disabled_transcribes_once(self):
+        """With partial_every=0 only the final transcription is requested."""
+        adapter = length_adapter()
+        chunks = [b"x" * 10 for _ in range(25)]
+
+        events = [e async for e in adapter.transcribe_stream(_chunk_stream(chunks), partial_every=0)]
+
+        assert len(events) == 1
+        assert adapter.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_partials_send_each_chunk_once(self):
+        """Partial requests carry only new audio (plus the header chunk), not the whole buffer."""
+        adapter = length_adapter()
+        chunks = [b"x" * 10 for _ in range(100)]
+
+        async def paced():
+            for chunk in chunks:
+                yield chunk
+                await asyncio.sleep(0)
+
+        events = [e async for e in adapter.transcribe_stream(paced(), partial_every=10)]
+
+        sent = [len(audio) for audio in adapter.audio]
+        partial_bytes = sum(sent[:-1])
+        assert sent[-1] == 1000
+        assert len(sent) > 2
+        # Each partial adds the 10-byte header chunk at most
+        assert partial_bytes <= 1000 + 10 * (len(sent) - 1)
+        assert any(not e.is_final for e in events)
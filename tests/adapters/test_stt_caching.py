@@ -0,0 +1,120 @@
+"""Tests for the STT result cache.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.4, 12.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.adapters.stt.base import STTResult, STTWord
+from src.adapters.stt.caching import CachingSTTAdapter, STTResultCache, _dump, _load, stt_cache_key
+from tests.conftest import FakeSTTAdapter
+
+
+def counting_adapter() -> FakeSTTAdapter:
+    """Adapter answering with word timings, counting provider calls."""
+    return FakeSTTAdapter(
+        "counting",
+        text="привет мир",
+        words=[STTWord("привет", 0.0, 0.4, 0.95), STTWord("мир", 0.5, 0.8, 0.85)],
+        latency_ms=700,
+    )
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class TestCacheKey:
+    """Keys depend on the audio and every transcription parameter."""
+
+    @given(audio=st.binary(min_size=1, max_size=64), hints=st.lists(st.text(max_size=5), max_size=4))
+    @settings(max_examples=100)
+    def test_hint_order_does_not_matter(self, audio, hints):
+        assert stt_cache_key(audio, "openai", "ru", hints) == stt_cache_key(
+            audio, "openai", "ru", list(reversed(hints))
+        )
+
+    def test_parameters_change_key(self):
+        base = stt_cache_key(b"audio", "openai", "ru")
+
+        assert base != stt_cache_key(b"audio!", "openai", "ru")
+        assert base != stt_cache_key(b"audio", "google", "ru")
+        assert base != stt_cache_key(b"audio", "openai", "kk")
+        assert base != stt_cache_key(b"audio", "openai", "ru", ["Алматы"])
+
+
+class TestCachingSTTAdapter:
+    """Repeated audio is answered without calling the provider."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_provider_and_keeps_words(self):
+        inner = counting_adapter()
+        adapter = CachingSTTAdapter(inner, STTResultCache(max_entries=8))
+
+        first = await adapter.transcribe(b"same bytes")
+        second = await adapter.transcribe(b"same bytes")
+
+        assert inner.calls == 1
+        assert not first.cached and second.cached
+        assert second.words == first.words
+        assert second.latency_ms == 700
+        assert adapter.cache.stats.to_dict() == {"hits": 1, "redis_hits": 0, "misses": 1, "hit_rate": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_caller_changes_do_not_leak_into_cache(self):
+        adapter = CachingSTTAdapter(counting_adapter(), STTResultCache(max_entries=8))
+
+        first = await adapter.transcribe(b"audio")
+        first.latency_ms = 1
+        first.words.clear()
+
+        second = await adapter.transcribe(b"audio")
+        assert second.latency_ms == 700
+        assert len(second.words) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_is_bounded(self):
+        inner = counting_adapter()
+        adapter = CachingSTTAdapter(inner, STTResultCache(max_entries=2))
+
+        for audio in (b"a", b"b", b"c", b"a"):
+            await adapter.transcribe(audio)
+
+        assert inner.calls == 4
+        assert len(adapter.cache._entries) == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_shared(self):
+        redis = FakeRedis()
+        caches = [STTResultCache(max_entries=8, redis_url="redis://test") for _ in range(2)]
+        for cache in caches:
+            cache._redis = redis
+        inner = counting_adapter()
+
+        await CachingSTTAdapter(inner, caches[0]).transcribe(b"audio", language="kk")
+        result = await CachingSTTAdapter(inner, caches[1]).transcribe(b"audio", language="kk")
+
+        assert inner.calls == 1
+        assert result.cached and result.language == "kk"
+        assert caches[1].stats.redis_hits == 1
+
+    def test_serialization_round_trip(self):
+        result = STTResult(text="да", confidence=0.5, words=[STTWord("да", 0.0, 0.2, 0.5)], latency_ms=10)
+
+        assert _load(_dump(result)) == result
@@ -0,0 +1,130 @@
+"""Tests for hedged STT requests.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.4, 12.1**
+"""
+
+import asyncio
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.adapters.stt.base import STTError, STTResult
+from src.adapters.stt.hedged import HedgedSTTAdapter
+from tests.conftest import FakeSTTAdapter
+
+
+def hedge(primary, secondary, **kwargs) -> HedgedSTTAdapter:
+    options = dict(initial_delay_ms=50, min_samples=3)
+    options.update(kwargs)
+    return HedgedSTTAdapter(primary, lambda allowed: secondary, **options)
+
+
+class TestHedgedSTTAdapter:
+    """The first acceptable answer wins and the other request is cancelled."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        secondary = FakeSTTAdapter("google", 0)
+        adapter = hedge(FakeSTTAdapter("openai", 0.001), secondary)
+
+        result = await adapter.transcribe(b"audio")
+
+        assert result.provider == "openai"
+        assert secondary.calls == 0
+        assert adapter.stats.to_dict()["hedge_rate"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_secondary(self):
+        primary = FakeSTTAdapter("openai", 1.0)
+        adapter = hedge(primary, FakeSTTAdapter("google", 0.01))
+
+        result = await adapter.transcribe(b"audio")
+        await asyncio.sleep(0)
+
+        assert result.text == "google" and result.provider == "google"
+        assert primary.cancelled == 1
+        assert adapter.stats.to_dict()["wins"] == {"google": 1}
+        assert adapter.stats.hedge_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_hedges_immediately(self):
+        adapter = hedge(FakeSTTAdapter("openai", 0, fail=True), FakeSTTAdapter("google", 0))
+
+        assert (await adapter.transcribe(b"audio")).provider == "google"
+
+    @pytest.mark.asyncio
+    async def test_no_eligible_secondary_waits_for_primary(self):
+        adapter = hedge(FakeSTTAdapter("openai", 0.1), None)
+
+        result = await adapter.transcribe(b"audio")
+
+        assert result.provider == "openai"
+        assert adapter.stats.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_result_keeps_waiting(self):
+        adapter = hedge(
+            FakeSTTAdapter("openai", 0.2),
+            FakeSTTAdapter("google", 0, confidence=0.1),
+            min_confidence=0.5,
+        )
+
+        result = await adapter.transcribe(b"audio")
+
+        assert result.provider == "openai"
+
+    @pytest.mark.asyncio
+    async def test_best_unsure_answer_when_nothing_is_acceptable(self):
+        adapter = hedge(
+            FakeSTTAdapter("openai", 0, confidence=0.3),
+            FakeSTTAdapter("google", 0, fail=True),
+            min_confidence=0.5,
+        )
+
+        assert (await adapter.transcribe(b"audio")).confidence == 0.3
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises_primary_error(self):
+        adapter = hedge(FakeSTTAdapter("openai", 0, fail=True), FakeSTTAdapter("google", 0, fail=True))
+
+        with pytest.raises(STTError, match="openai"):
+            await adapter.transcribe(b"audio")
+
+    @pytest.mark.asyncio
+    async def test_delay_tracks_primary_latency(self):
+        adapter = hedge(FakeSTTAdapter("openai", 0.005), FakeSTTAdapter("google", 1.0), quantile=0.9)
+        assert adapter.hedge_delay_ms() == 50
+
+        for _ in range(3):
+            await adapter.transcribe(b"audio")
+
+        assert 5 <= adapter.hedge_delay_ms() < 50
+
+    @pytest.mark.asyncio
+    async def test_cancelled_primary_counts_as_slow(self):
+        """A primary that lost to the hedge still feeds the p90, as a lower bound."""
+        adapter = hedge(FakeSTTAdapter("openai", 1.0), FakeSTTAdapter("google", 0.01), min_samples=1)
+
+        await adapter.transcribe(b"audio")
+        await asyncio.sleep(0)
+
+        assert adapter.hedge_delay_ms() >= 50
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_do_not_lower_the_delay(self):
+        class CachedSTTAdapter(FakeSTTAdapter):
+            async def transcribe(self, audio: bytes, language: str = "ru", hints=None) -> STTResult:
+                result = await super().transcribe(audio, language, hints)
+                return replace(result, cached=True)
+
+        adapter = hedge(CachedSTTAdapter("openai", 0), FakeSTTAdapter("google", 0), min_samples=1)
+
+        for _ in range(3):
+            await adapter.transcribe(b"audio")
+
+        assert adapter.hedge_delay_ms() == 50
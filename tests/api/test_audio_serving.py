@@ -0,0 +1,79 @@
+"""Tests for the audio file endpoint.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 5.1, 10.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from fastapi.testclient import TestClient
+
+KEY = "users/u/conversations/c/turns/t/output.wav"
+AUDIO = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    from src.api.main import app
+    from src.services import storage as storage_module
+
+    monkeypatch.setattr(storage_module, "LOCAL_STORAGE_DIR", tmp_path)
+    (tmp_path / KEY).parent.mkdir(parents=True)
+    (tmp_path / KEY).write_bytes(AUDIO)
+
+    storage = storage_module.StorageService(health_check_interval_seconds=0)
+    app.dependency_overrides[storage_module.get_storage] = lambda: storage
+    # No context manager: the lifespan (database, Redis) is not needed here
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestServeAudio:
+    """Audio is streamed with range and conditional request support."""
+
+    def test_full_file_is_cacheable(self, client):
+        response = client.get(f"/api/audio/{KEY}")
+
+        assert response.status_code == 200
+        assert response.content == AUDIO
+        assert response.headers["content-type"] == "audio/wav"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["etag"]
+        assert response.headers["last-modified"]
+
+    def test_range_request(self, client):
+        response = client.get(f"/api/audio/{KEY}", headers={"Range": "bytes=100-199"})
+
+        assert response.status_code == 206
+        assert response.content == AUDIO[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(AUDIO)}"
+
+    def test_if_none_match_returns_304(self, client):
+        etag = client.get(f"/api/audio/{KEY}").headers["etag"]
+
+        response = client.get(f"/api/audio/{KEY}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_if_modified_since_returns_304(self, client):
+        last_modified = client.get(f"/api/audio/{KEY}").headers["last-modified"]
+
+        response = client.get(f"/api/audio/{KEY}", headers={"If-Modified-Since": last_modified})
+
+        assert response.status_code == 304
+
+    def test_stale_etag_returns_file(self, client):
+        response = client.get(f"/api/audio/{KEY}", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("path", ["users/missing.wav", "..%2F..%2Fetc%2Fpasswd", "users"])
+    def test_missing_or_outside_storage(self, client, path):
+        assert client.get(f"/api/audio/{path}").status_code == 404
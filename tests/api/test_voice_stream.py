@@ -0,0 +1,126 @@
+"""Tests for the streaming transcription WebSocket.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 11.2, 11.3**
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import FakeSTTAdapter
+
+DEMO_USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.fixture
+def app_db(tmp_path, monkeypatch, fake_storage):
+    """The app's session maker, pointed at a SQLite file with two users."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from src.api.routers import voice
+    from src.models.database import Base
+    from src.models.entities import Conversation, User
+    from src.services.voice_session import AdapterFactory
+
+    # NullPool: connections are opened on whichever loop uses them
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ws.db'}", poolclass=NullPool)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def setup() -> dict:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_maker() as db:
+            demo = User(id=DEMO_USER_ID, name="demo", email="demo@example.com", hashed_password="x")
+            other = User(name="other", email="other@example.com", hashed_password="x")
+            db.add_all([demo, other])
+            await db.flush()
+            sessions = {
+                name: Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+                for name, user in (("own", demo), ("foreign", other))
+            }
+            db.add_all(sessions.values())
+            await db.commit()
+        return {name: conversation.id for name, conversation in sessions.items()}
+
+    ids = asyncio.run(setup())
+    monkeypatch.setattr(voice, "async_session_maker", session_maker)
+    echo = FakeSTTAdapter(text=lambda audio: f"{len(audio)} bytes")
+    monkeypatch.setattr(AdapterFactory, "get_stt_adapter", staticmethod(lambda provider, allowed=None: echo))
+    yield ids, session_maker
+
+
+@pytest.fixture
+def client():
+    from src.api.main import app
+
+    # No context manager: the lifespan (database, Redis) is not needed here
+    return TestClient(app)
+
+
+class TestStreamTranscribe:
+    """Streaming uploads produce one turn, for the session's owner only."""
+
+    def test_final_turn_is_recorded(self, app_db, client):
+        ids, session_maker = app_db
+
+        with client.websocket_connect(f"/api/voice/stream/{ids['own']}") as ws:
+            for _ in range(10):
+                ws.send_bytes(b"\x01" * 100)
+            ws.send_text("end")
+            # Skip partial results
+            while (message := ws.receive_json())["type"] != "final":
+                pass
+
+        assert message["raw_transcript"] == "1000 bytes"
+
+        async def turn_count() -> int:
+            from sqlalchemy import func, select
+
+            from src.models.entities import Turn
+
+            async with session_maker() as db:
+                return await db.scalar(select(func.count(Turn.id)))
+
+        assert asyncio.run(turn_count()) == 1
+
+    def test_foreign_session_is_not_found(self, app_db, client):
+        ids, _ = app_db
+
+        with client.websocket_connect(f"/api/voice/stream/{ids['foreign']}") as ws:
+            message = ws.receive_json()
+
+        assert message["type"] == "error"
+        assert "not found" in message["detail"]
+
+    def test_internal_error_is_reported(self, app_db, client, monkeypatch):
+        """A failure while recording the turn ends with an error frame and code 1011."""
+        from sqlalchemy.exc import OperationalError
+        from starlette.websockets import WebSocketDisconnect
+
+        from src.services.voice_session import VoiceSessionService
+
+        async def failing_process_audio(self, *args, **kwargs):
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+        monkeypatch.setattr(VoiceSessionService, "process_audio", failing_process_audio)
+        ids, _ = app_db
+
+        with client.websocket_connect(f"/api/voice/stream/{ids['own']}") as ws:
+            for _ in range(10):
+                ws.send_bytes(b"\x01" * 100)
+            ws.send_text("end")
+            while (message := ws.receive_json())["type"] == "partial":
+                pass
+            with pytest.raises(WebSocketDisconnect) as info:
+                ws.receive_json()
+
+        assert message == {"type": "error", "detail": "Internal error"}
+        assert info.value.code == 1011
@@ -0,0 +1,162 @@
+"""Shared fixtures and fakes for the test suite.
+
+**Feature: voice-assistant-pipeline**
+"""
+
+import asyncio
+import copy
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.adapters.stt.base import STTAdapter, STTError, STTResult
+from src.adapters.tts.base import TTSAdapter, TTSResult
+
+
+class FakeSTTAdapter(STTAdapter):
+    """Scriptable STT adapter.
+
+    Answers after delay seconds, raising the scripted errors first (or
+    always failing when fail is set). The transcript is text, text(audio)
+    if it is callable, or else the provider name; extra keyword arguments
+    are passed on to STTResult.
+    """
+
+    def __init__(
+        self,
+        name: str = "openai",
+        delay: float = 0,
+        confidence: float = 0.9,
+        text=None,
+        errors=(),
+        fail: bool = False,
+        **result,
+    ):
+        self.name = name
+        self.delay = delay
+        self.confidence = confidence
+        self.text = text
+        self.errors = list(errors)
+        self.fail = fail
+        self.result = result
+        self.calls = 0
+        self.cancelled = 0
+        self.audio: list[bytes] = []
+
+    async def transcribe(self, audio: bytes, language: str = "ru", hints=None) -> STTResult:
+        self.calls += 1
+        self.audio.append(audio)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.errors:
+            raise self.errors.pop(0)
+        if self.fail:
+            raise STTError("unavailable", provider=self.name)
+        if callable(self.text):
+            text = self.text(audio)
+        else:
+            text = self.name if self.text is None else self.text
+        return STTResult(text=text, confidence=self.confidence, language=language, **copy.deepcopy(self.result))
+
+    def get_provider_name(self) -> str:
+        return self.name
+
+
+class FakeTTSAdapter(TTSAdapter):
+    """TTS adapter "speaking" text as its bytes, delay_per_char seconds per character.
+
+    Tracks concurrency, so shorter sentences finishing first can be told apart
+    from ordering bugs.
+    """
+
+    def __init__(self, name: str = "openai", delay_per_char: float = 0, latency_ms: Optional[int] = None):
+        self.name = name
+        self.delay_per_char = delay_per_char
+        self.latency_ms = latency_ms
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls: list[str] = []
+
+    async def synthesize(self, text, language="ru", voice=None, speed=1.0) -> TTSResult:
+        self.calls.append(text)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(len(text) * self.delay_per_char)
+        finally:
+            self.in_flight -= 1
+        latency_ms = len(text) if self.latency_ms is None else self.latency_ms
+        return TTSResult(audio=text.encode(), format="mp3", duration_ms=100, latency_ms=latency_ms)
+
+    def get_provider_name(self) -> str:
+        return self.name
+
+
+class FakeStorage:
+    """In-memory stand-in for StorageService keeping uploaded audio."""
+
+    def __init__(self):
+        self.uploads: list[bytes] = []
+
+    def audio_key(self, user_id, conversation_id, turn_id, file_type):
+        return f"users/{user_id}/conversations/{conversation_id}/turns/{turn_id}/{file_type}"
+
+    async def upload_audio(self, audio, user_id, conversation_id, turn_id, file_type="input.wav", **kwargs):
+        self.uploads.append(audio)
+        return self.audio_key(user_id, conversation_id, turn_id, file_type)
+
+
+@pytest.fixture
+def fake_storage(monkeypatch):
+    """A FakeStorage, also returned by get_storage() in VoiceSessionService."""
+    fake = FakeStorage()
+    monkeypatch.setattr("src.services.voice_session.get_storage", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """A real StorageService writing local files under tmp_path."""
+    from src.services import storage as storage_module
+
+    monkeypatch.setattr(storage_module, "LOCAL_STORAGE_DIR", tmp_path)
+    return storage_module.StorageService(health_check_interval_seconds=0)
+
+
+@pytest.fixture
+async def db():
+    """Session on an in-memory SQLite database with the full schema."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from src.models.database import Base
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session_maker(tmp_path):
+    """Session maker on a SQLite file, for tests spanning several sessions."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from src.models.database import Base
+
+    # A file, not :memory:, so every session and background task sees the same database
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
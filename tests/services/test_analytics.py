@@ -14,7 +14,14 @@ from hypothesis import given, strategies as st, settings, assume
 from dataclasses import dataclass
 from typing import Optional
 
-from src.services.metrics import calculate_wer, calculate_cer
+from src.services.metrics import (
+    calculate_wer,
+    calculate_cer,
+    cer_breakdown,
+    edit_distance,
+    score_batch,
+    wer_breakdown,
+)
 
 
 # Strategies for text generation
@@ -277,3 +284,87 @@ class TestWERCERFormula:
         
         wer = calculate_wer(hypothesis, reference)
         assert wer == 0.0
+
+
+def _matrix_distance(a, b) -> int:
+    """Full-matrix Levenshtein distance used as the reference."""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+    return d[len(a)][len(b)]
+
+
+class TestEditDistanceEngine:
+    """The bit-parallel engine must score exactly like the matrix DP."""
+
+    @given(
+        a=st.text(alphabet="abcde", max_size=80),
+        b=st.text(alphabet="abcde", max_size=80),
+    )
+    @settings(max_examples=300)
+    def test_bit_parallel_matches_matrix(self, a: str, b: str):
+        """Hyyrö distance equals the full-matrix distance, including long patterns.
+        
+        **Validates: Requirements 9.5**
+        """
+        assert edit_distance(a, b) == _matrix_distance(a, b)
+
+    @given(hypothesis=st.text(alphabet="ab c", max_size=40), reference=st.text(alphabet="ab c", max_size=40))
+    @settings(max_examples=200)
+    def test_breakdown_rate_matches_scores(self, hypothesis: str, reference: str):
+        """S + D + I of the breakdown reproduces WER and CER.
+        
+        **Validates: Requirements 9.5**
+        """
+        assert wer_breakdown(hypothesis, reference).rate == calculate_wer(hypothesis, reference)
+        assert cer_breakdown(hypothesis, reference).rate == calculate_cer(hypothesis, reference)
+
+    def test_breakdown_counts(self):
+        """One substitution, one deletion and one insertion are told apart.
+        
+        **Validates: Requirements 9.5**
+        """
+        def counts(hypothesis: str, reference: str) -> tuple[int, int, int]:
+            b = wer_breakdown(hypothesis, reference)
+            return b.substitutions, b.deletions, b.insertions
+
+        assert counts("a x c", "a b c") == (1, 0, 0)
+        assert counts("a c", "a b c") == (0, 1, 0)
+        assert counts("a b x c", "a b c") == (0, 0, 1)
+        assert wer_breakdown("a c", "a b c").reference_length == 3
+
+
+class TestBatchScoring:
+    """Batch scoring returns the same scores as per-pair calls."""
+
+    @given(pairs=st.lists(st.tuples(sentence_strategy, sentence_strategy), max_size=30))
+    @settings(max_examples=50)
+    def test_batch_matches_single_calls(self, pairs: list[tuple[str, str]]):
+        """score_batch equals calculate_wer/calculate_cer pair by pair.
+        
+        **Validates: Requirements 9.5**
+        """
+        expected = [(calculate_wer(h, r), calculate_cer(h, r)) for h, r in pairs]
+        assert score_batch(pairs) == expected
+
+    def test_process_pool_preserves_order(self, monkeypatch):
+        """Chunks scored in worker processes come back in input order."""
+        import src.services.metrics as metrics
+
+        monkeypatch.setattr(metrics, "_scoring_pool", None)
+        monkeypatch.setattr(metrics, "BATCH_CHUNK_SIZE", 3)
+        pairs = [(f"a b {i}", f"a b {i % 4}") for i in range(10)]
+
+        pool = metrics.get_scoring_pool(2)
+        try:
+            assert pool is metrics.get_scoring_pool(2)
+            assert pool._mp_context.get_start_method() == "spawn"
+            assert score_batch(pairs, pool) == score_batch(pairs)
+        finally:
+            metrics.shutdown_scoring_pool()
@@ -0,0 +1,143 @@
+"""Tests for the shared normalization dictionary cache.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 4.1, 8.3**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.services.dictionary_cache import DictionaryCache
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeDB:
+    """Counts queries and serves a mutable list of approved terms."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return FakeResult(list(self.rows))
+
+
+class TestDictionaryCache:
+    """Snapshots are loaded once and reloaded only after invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_loaded_once(self):
+        cache = DictionaryCache(ttl_seconds=0)
+        db = FakeDB([("1", "Превет", "привет")])
+
+        first = await cache.get_snapshot(db, "ru")
+        second = await cache.get_snapshot(db, "ru")
+
+        assert first is second
+        assert db.queries == 1
+        assert first.entries == {"превет": {"correct_form": "привет", "id": "1"}}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads_only_that_language(self):
+        cache = DictionaryCache(ttl_seconds=0)
+        db = FakeDB([("1", "превет", "привет")])
+
+        await cache.get_snapshot(db, "ru")
+        await cache.get_snapshot(db, "kk")
+        db.rows.append(("2", "сдраствуйте", "здравствуйте"))
+        cache.invalidate("ru")
+
+        ru = await cache.get_snapshot(db, "ru")
+        await cache.get_snapshot(db, "kk")
+
+        assert "сдраствуйте" in ru.entries
+        assert ru.version == 1
+        assert db.queries == 3
+
+    @pytest.mark.asyncio
+    async def test_old_snapshot_is_not_mutated(self):
+        cache = DictionaryCache(ttl_seconds=0)
+        db = FakeDB([("1", "превет", "привет")])
+
+        old = await cache.get_snapshot(db, "ru")
+        db.rows.clear()
+        cache.invalidate("ru")
+        new = await cache.get_snapshot(db, "ru")
+
+        assert old.entries == {"превет": {"correct_form": "привет", "id": "1"}}
+        assert new.entries == {}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_indexes_are_built_on_load(self):
+        """Requests never build the fuzzy index inline on the event loop."""
+        from src.config import get_settings
+
+        settings = get_settings()
+        cache = DictionaryCache(ttl_seconds=0)
+        db = FakeDB([("1", "превет", "привет")])
+
+        snapshot = await cache.get_snapshot(db, "ru")
+
+        key = (settings.normalization_fuzzy_index, settings.normalization_fuzzy_max_distance)
+        assert key in snapshot._indexes
+        assert "phrases" in snapshot._indexes
+
+
+class TestInvalidateOnCommit:
+    """Invalidations wait for the outermost commit and die with a rollback."""
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates(self, db):
+        from sqlalchemy import text
+
+        cache = DictionaryCache(ttl_seconds=0)
+        await db.execute(text("SELECT 1"))
+        cache.invalidate_on_commit(db, "ru")
+        assert cache.version("ru") == 0
+
+        await db.commit()
+        await db.commit()
+
+        assert cache.version("ru") == 1
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards(self, db):
+        from sqlalchemy import text
+
+        cache = DictionaryCache(ttl_seconds=0)
+        await db.execute(text("SELECT 1"))
+        cache.invalidate_on_commit(db, "ru")
+        await db.rollback()
+
+        await db.execute(text("SELECT 1"))
+        cache.invalidate_on_commit(db, "kk")
+        await db.commit()
+
+        assert cache.version("ru") == 0
+        assert cache.version("kk") == 1
+
+    @pytest.mark.asyncio
+    async def test_savepoint_release_is_not_the_commit(self, db):
+        from sqlalchemy import text
+
+        cache = DictionaryCache(ttl_seconds=0)
+        await db.execute(text("SELECT 1"))
+        async with db.begin_nested():
+            cache.invalidate_on_commit(db, "ru")
+        assert cache.version("ru") == 0
+
+        await db.commit()
+
+        assert cache.version("ru") == 1
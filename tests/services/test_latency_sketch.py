@@ -0,0 +1,83 @@
+"""Property-based tests for the mergeable latency sketch.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 9.1**
+"""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from hypothesis import given, strategies as st, settings
+
+from src.services.latency_sketch import GAMMA, RELATIVE_ERROR, LatencySketch, latency_bucket
+
+latencies_strategy = st.lists(st.integers(min_value=2, max_value=600_000), min_size=1, max_size=300)
+
+
+def _exact_quantile(values: list[int], q: float) -> int:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+class TestLatencyBuckets:
+    """Log-scale buckets shared by the sketch and the rollup."""
+
+    @given(latency=st.integers(min_value=2, max_value=10_000_000))
+    @settings(max_examples=200)
+    def test_bucket_bounds_contain_latency(self, latency: int):
+        """Bucket i covers (GAMMA**(i-1), GAMMA**i]."""
+        i = latency_bucket(latency)
+        assert GAMMA ** (i - 1) < latency <= GAMMA ** i * (1 + 1e-9)
+
+    @given(a=st.integers(min_value=0, max_value=100_000), b=st.integers(min_value=0, max_value=100_000))
+    def test_buckets_are_monotonic(self, a: int, b: int):
+        if a <= b:
+            assert latency_bucket(a) <= latency_bucket(b)
+
+
+class TestLatencySketch:
+    """Quantiles are within the relative error bound and sketches merge."""
+
+    @given(values=latencies_strategy, q=st.sampled_from([0.5, 0.95, 0.99]))
+    @settings(max_examples=200)
+    def test_quantile_relative_error(self, values: list[int], q: float):
+        """Sketch quantiles are within RELATIVE_ERROR of the exact quantile.
+        
+        **Validates: Requirements 9.1**
+        """
+        sketch = LatencySketch()
+        for value in values:
+            sketch.add(value)
+
+        exact = _exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - exact) <= RELATIVE_ERROR * exact + 1e-9
+
+    @given(a=latencies_strategy, b=latencies_strategy)
+    @settings(max_examples=100)
+    def test_merge_equals_combined(self, a: list[int], b: list[int]):
+        """Merging two sketches equals sketching the combined values."""
+        left, right, combined = LatencySketch(), LatencySketch(), LatencySketch()
+        for value in a:
+            left.add(value)
+            combined.add(value)
+        for value in b:
+            right.add(value)
+            combined.add(value)
+
+        assert left.merge(right).buckets == combined.buckets
+
+    def test_json_round_trip(self):
+        sketch = LatencySketch()
+        for value in (120, 130, 900):
+            sketch.add(value)
+
+        restored = LatencySketch.from_json(sketch.to_json())
+
+        assert restored.buckets == sketch.buckets
+        assert restored.count == 3
+
+    def test_empty_sketch(self):
+        assert LatencySketch().quantile(0.5) is None
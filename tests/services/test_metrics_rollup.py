@@ -0,0 +1,156 @@
+"""Tests for the hourly provider metrics rollup.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 9.1, 9.3**
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+
+async def _seed(db, now: datetime):
+    from src.models.entities import Conversation, Turn, User
+
+    user = User(name="u", email="u@example.com", hashed_password="x", language="kk")
+    db.add(user)
+    await db.flush()
+    conversation = Conversation(user_id=user.id, stt_provider_used="google", tts_provider_used="openai")
+    db.add(conversation)
+    await db.flush()
+
+    for n, (age, latency, correction) in enumerate([
+        (timedelta(hours=5), 100, None),
+        (timedelta(hours=5, minutes=10), 300, "fix"),
+        (timedelta(minutes=30), 200, None),
+    ]):
+        db.add(Turn(
+            conversation_id=conversation.id,
+            turn_number=n + 1,
+            timestamp=now - age,
+            transcript_confidence=0.5,
+            stt_latency_ms=latency,
+            user_correction=correction,
+        ))
+    await db.flush()
+    return conversation
+
+
+class TestMetricsRollup:
+    """Compaction aggregates turns per hour and advances the watermark."""
+
+    @pytest.mark.asyncio
+    async def test_compact_aggregates_hours(self, db):
+        from sqlalchemy import select
+
+        from src.models.entities_ext import MetricsRollupState, ProviderMetricsHourly
+        from src.services.metrics_rollup import MetricsRollupService, floor_hour
+
+        now = datetime(2026, 3, 1, 12, 40)
+        await _seed(db, now)
+        service = MetricsRollupService(settle_hours=2, interval_seconds=0)
+
+        assert await service.compact(db, now=now) == 2
+
+        rows = (await db.execute(
+            select(ProviderMetricsHourly).order_by(ProviderMetricsHourly.hour)
+        )).scalars().all()
+        old, recent = rows
+        assert (old.stt_provider, old.tts_provider, old.language) == ("google", "openai", "kk")
+        assert old.turn_count == 2
+        assert old.correction_count == 1
+        assert old.stt_latency_sum == 400
+        assert sum(old.stt_latency_buckets.values()) == 2
+        assert recent.turn_count == 1
+
+        state = await db.get(MetricsRollupState, "provider_metrics_hourly")
+        assert state.watermark == floor_hour(now - timedelta(hours=2))
+
+    @pytest.mark.asyncio
+    async def test_recompaction_replaces_open_hours(self, db):
+        from sqlalchemy import func, select
+
+        from src.models.entities import Turn
+        from src.models.entities_ext import ProviderMetricsHourly
+        from src.services.metrics_rollup import MetricsRollupService
+
+        now = datetime(2026, 3, 1, 12, 40)
+        conversation = await _seed(db, now)
+        service = MetricsRollupService(settle_hours=2, interval_seconds=0)
+        await service.compact(db, now=now)
+
+        db.add(Turn(conversation_id=conversation.id, turn_number=4, timestamp=now, stt_latency_ms=50))
+        await db.flush()
+        await service.compact(db, now=now)
+
+        total = await db.scalar(select(func.sum(ProviderMetricsHourly.turn_count)))
+        rows = await db.scalar(select(func.count(ProviderMetricsHourly.id)))
+        assert total == 4
+        assert rows == 2
+
+    @pytest.mark.asyncio
+    async def test_provider_metrics_read_rollup(self, db):
+        from src.services.analytics import AnalyticsService
+        from src.services.metrics_rollup import MetricsRollupService
+
+        now = datetime.utcnow()
+        await _seed(db, now)
+        await MetricsRollupService(settle_hours=2, interval_seconds=0).compact(db, now=now)
+
+        (metrics,) = await AnalyticsService(db).get_provider_metrics(days=1)
+
+        assert metrics.provider == "google"
+        assert metrics.total_requests == 3
+        assert metrics.avg_stt_latency_ms == 200
+        assert metrics.correction_rate == pytest.approx(1 / 3)
+        assert metrics.wer is None
+
+    @pytest.mark.asyncio
+    async def test_latency_percentiles_merge_hours(self, db):
+        """Percentiles over a window merge the hourly sketches.
+        
+        **Validates: Requirements 9.1**
+        """
+        from src.services.analytics import AnalyticsService
+        from src.services.latency_sketch import RELATIVE_ERROR
+        from src.services.metrics_rollup import MetricsRollupService
+
+        now = datetime.utcnow()
+        await _seed(db, now)
+        await MetricsRollupService(settle_hours=2, interval_seconds=0).compact(db, now=now)
+        service = AnalyticsService(db)
+
+        (stt,) = await service.get_latency_percentiles(now - timedelta(days=1), now, stage="stt")
+        assert (stt.stage, stt.provider, stt.count) == ("stt", "google", 3)
+        assert abs(stt.p50 - 200) <= 200 * RELATIVE_ERROR
+        assert abs(stt.p99 - 300) <= 300 * RELATIVE_ERROR
+
+        # Only the recent hour falls in a one-hour window
+        (recent,) = await service.get_latency_percentiles(now - timedelta(hours=1), now, stage="stt")
+        assert recent.count == 1
+
+    @pytest.mark.asyncio
+    async def test_compaction_skipped_while_locked(self):
+        """On PostgreSQL a worker that misses the advisory lock leaves the rollup alone."""
+        from types import SimpleNamespace
+
+        from src.services.metrics_rollup import MetricsRollupService
+
+        class LockedSession:
+            def get_bind(self):
+                return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+            async def scalar(self, statement, params=None):
+                assert "pg_try_advisory_xact_lock" in str(statement)
+                return False
+
+            async def get(self, *args):
+                raise AssertionError("compacted without the lock")
+
+        rows = await MetricsRollupService(interval_seconds=0).compact(LockedSession())
+
+        assert rows == 0
@@ -280,6 +280,126 @@ class TestFuzzyMatching:
         assert "привет" not in result3.normalized_transcript
 
 
+class TestFuzzyIndex:
+    """Fuzzy indexes must agree with a linear scan."""
+
+    @given(
+        keys=st.lists(st.text(alphabet="абвгдеж ", min_size=1, max_size=8), max_size=40),
+        word=st.text(alphabet="абвгдеж", min_size=1, max_size=8),
+        max_distance=st.integers(min_value=0, max_value=3),
+    )
+    @settings(max_examples=200)
+    def test_indexes_match_linear_scan(self, keys: list[str], word: str, max_distance: int):
+        """BK-tree and SymSpell return the same key and distance as a linear scan.
+        
+        **Validates: Requirements 4.3**
+        """
+        from src.services.fuzzy_index import build_fuzzy_index
+
+        expected = build_fuzzy_index("linear", keys, max_distance).search(word, max_distance)
+        for kind in ("bktree", "symspell"):
+            index = build_fuzzy_index(kind, keys, max_distance)
+            assert index.search(word, max_distance) == expected
+
+    def test_ties_prefer_first_key(self):
+        """Equidistant keys resolve to the first one, like the linear scan.
+        
+        **Validates: Requirements 4.3**
+        """
+        from src.services.fuzzy_index import build_fuzzy_index
+
+        keys = ["кот", "код", "кит"]
+        for kind in ("linear", "bktree", "symspell"):
+            assert build_fuzzy_index(kind, keys, 2).search("кор", 2) == ("кот", 1)
+
+    def test_symspell_keeps_phrases_out_of_delete_table(self):
+        """Multi-word and long keys are searched in a BK-tree, not expanded.
+        
+        **Validates: Requirements 4.3**
+        """
+        from src.services.fuzzy_index import build_fuzzy_index
+
+        sentence = "включи свет на кухне и выключи в спальне пожалуйста " * 2
+        index = build_fuzzy_index("symspell", ["привет", sentence.strip()], 2)
+
+        assert len(index._deletes) == len(build_fuzzy_index("symspell", ["привет"], 2)._deletes)
+        assert index.search(sentence.strip()[:-1], 2) == (sentence.strip(), 1)
+        assert index.search("превет", 2) == ("привет", 1)
+
+    def test_symspell_rejects_larger_distance(self):
+        """SymSpell cannot answer queries beyond the distance it was built for."""
+        from src.services.fuzzy_index import build_fuzzy_index
+
+        index = build_fuzzy_index("symspell", ["привет"], 1)
+        with pytest.raises(ValueError):
+            index.search("превет", 2)
+
+
+class TestPhraseMatching:
+    """Multi-word heard variants are matched leftmost-longest."""
+
+    def _service(self, dictionary: dict[str, str]):
+        from src.services.normalization import NormalizationService
+
+        service = NormalizationService(db=None)
+        service._dictionary = {k.lower(): {"correct_form": v} for k, v in dictionary.items()}
+        service._dictionary_loaded = True
+        service._dictionary_language = "ru"
+        return service
+
+    def test_longest_phrase_wins(self):
+        """A longer phrase is preferred over a shorter one at the same start.
+        
+        **Validates: Requirements 4.1**
+        """
+        from src.services.phrase_matcher import PhraseMatcher
+
+        matcher = PhraseMatcher(["нур", "нур султан", "нур султан аэропорт", "султан"])
+        tokens = "нур султан нур султан аэропорт султан".split()
+
+        assert [(m.start, m.end, m.key) for m in matcher.find_all(tokens)] == [
+            (0, 2, "нур султан"),
+            (2, 5, "нур султан аэропорт"),
+            (5, 6, "султан"),
+        ]
+
+    def test_partial_phrase_does_not_match(self):
+        """A phrase prefix alone is not a match."""
+        from src.services.phrase_matcher import PhraseMatcher
+
+        matcher = PhraseMatcher(["алма ата"])
+        assert matcher.find_all(["алма", "арасан"]) == []
+
+    @pytest.mark.asyncio
+    async def test_normalize_replaces_phrases(self):
+        """Phrase corrections keep the original words and use rule_type exact.
+        
+        **Validates: Requirements 4.1**
+        """
+        service = self._service({"алма ата": "Алматы", "превет": "привет"})
+
+        result = await service.normalize("Превет из Алма Ата", language="ru")
+
+        assert result.normalized_transcript == "привет из Алматы"
+        assert [(c.original, c.corrected, c.rule_type) for c in result.corrections] == [
+            ("Превет", "привет", "exact"),
+            ("Алма Ата", "Алматы", "exact"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_confirmed_transcript_matches_whole(self):
+        """A confirmed transcript stored as a heard variant is applied as a whole.
+        
+        **Validates: Requirements 4.1, 4.4**
+        """
+        service = self._service({"какая сегодня пагода": "Какая сегодня погода"})
+
+        result = await service.normalize("какая сегодня пагода", language="ru")
+
+        assert result.normalized_transcript == "Какая сегодня погода"
+        assert len(result.corrections) == 1
+
+
 class TestCorrectionDataIntegrity:
     """Tests for correction data structure."""
 
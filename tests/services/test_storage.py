@@ -0,0 +1,74 @@
+"""Tests for the storage service.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 5.1, 10.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+
+class FlakyS3Client:
+    """S3 client whose bucket is reachable only while `up` is set."""
+
+    def __init__(self):
+        self.up = False
+        self.objects: dict[str, bytes] = {}
+
+    def head_bucket(self, Bucket):
+        if not self.up:
+            raise ConnectionError("connection refused")
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        if not self.up:
+            raise ConnectionError("connection refused")
+        self.objects[Key] = Body
+
+
+@pytest.fixture
+def storage(storage):
+    storage.client = FlakyS3Client()
+    return storage
+
+
+class TestStorageFailover:
+    """Health checks switch between S3 and local storage."""
+
+    @pytest.mark.asyncio
+    async def test_starts_local_until_s3_reachable(self, storage):
+        assert storage.use_local
+
+        storage.client.up = True
+        assert await storage.check_health()
+        assert not storage.use_local
+
+        key = await storage.upload_audio(b"s3", "u", "c", "t")
+        assert storage.client.objects[key] == b"s3"
+
+    @pytest.mark.asyncio
+    async def test_fails_over_to_local(self, storage):
+        storage.client.up = True
+        await storage.check_health()
+
+        storage.client.up = False
+        assert not await storage.check_health()
+        assert storage.use_local
+
+        key = await storage.upload_audio(b"local", "u", "c", "t")
+        assert await storage.get_local_file(key) == b"local"
+        assert storage.client.objects == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_put_falls_back_to_local(self, storage):
+        storage.client.up = True
+        await storage.check_health()
+
+        # S3 goes down between health checks
+        storage.client.up = False
+        key = await storage.upload_audio(b"late", "u", "c", "t")
+
+        assert await storage.get_local_file(key) == b"late"
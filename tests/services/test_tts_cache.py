@@ -0,0 +1,182 @@
+"""Tests for the content-addressed TTS cache.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.5, 5.3**
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.adapters.tts.base import TTSResult
+from src.services.tts_cache import TTS_CACHE_PREFIX, TTSCache, tts_cache_key
+from tests.conftest import FakeTTSAdapter
+
+
+async def no_references(keys: list[str]) -> set[str]:
+    return set()
+
+
+def make_cache(storage, **kwargs) -> TTSCache:
+    options = dict(
+        memory_entries=8, ttl_seconds=3600, max_bytes=10**6, evict_interval_seconds=0,
+        referenced=no_references,
+    )
+    options.update(kwargs)
+    return TTSCache(storage, **options)
+
+
+def speech(size: int = 100) -> TTSResult:
+    return TTSResult(audio=b"\x01" * size, format="mp3", duration_ms=1200, latency_ms=800)
+
+
+class TestCacheKey:
+    """Keys depend on every synthesis parameter but not on spacing."""
+
+    @given(
+        words=st.lists(st.text(alphabet="абвгд", min_size=1, max_size=6), min_size=1, max_size=5),
+        spaces=st.lists(st.sampled_from([" ", "  ", "\t", "\n "]), min_size=4, max_size=4),
+    )
+    @settings(max_examples=100)
+    def test_whitespace_insensitive(self, words, spaces):
+        text = " ".join(words)
+        messy = spaces[0] + spaces[1].join(words) + spaces[2]
+
+        assert tts_cache_key("openai", None, "ru", 1.0, text) == tts_cache_key("openai", None, "ru", 1.0, messy)
+
+    def test_parameters_change_key(self):
+        base = tts_cache_key("openai", None, "ru", 1.0, "Повторите, пожалуйста")
+
+        assert base != tts_cache_key("google", None, "ru", 1.0, "Повторите, пожалуйста")
+        assert base != tts_cache_key("openai", "nova", "ru", 1.0, "Повторите, пожалуйста")
+        assert base != tts_cache_key("openai", None, "kk", 1.0, "Повторите, пожалуйста")
+        assert base != tts_cache_key("openai", None, "ru", 1.25, "Повторите, пожалуйста")
+        assert base != tts_cache_key("openai", None, "ru", 1.0, "повторите, пожалуйста")
+
+
+class TestTTSCache:
+    """Memory and storage tiers, TTL and size eviction."""
+
+    @pytest.mark.asyncio
+    async def test_storage_tier_survives_restart(self, storage):
+        digest = tts_cache_key("openai", None, "ru", 1.0, "Здравствуйте")
+        stored = await make_cache(storage).put(digest, speech())
+
+        # A fresh instance (another worker, or after restart) has an empty LRU
+        entry = await make_cache(storage).get(digest)
+
+        assert entry == stored
+        assert entry.audio_key.startswith(TTS_CACHE_PREFIX)
+        assert await storage.get_object(entry.audio_key) == speech().audio
+
+    @pytest.mark.asyncio
+    async def test_miss_and_expiry(self, storage):
+        cache = make_cache(storage, ttl_seconds=0)
+        digest = tts_cache_key("openai", None, "ru", 1.0, "Да")
+
+        assert await cache.get(digest) is None
+        await cache.put(digest, speech())
+        assert await cache.get(digest) is None
+
+    @pytest.mark.asyncio
+    async def test_memory_lru_is_bounded(self, storage):
+        cache = make_cache(storage, memory_entries=2)
+        for text in ("a", "b", "c"):
+            await cache.put(tts_cache_key("openai", None, "ru", 1.0, text), speech())
+
+        assert len(cache._memory) == 2
+
+    @pytest.mark.asyncio
+    async def test_evict_over_budget_removes_oldest(self, storage):
+        cache = make_cache(storage, max_bytes=400)
+        digests = [tts_cache_key("openai", None, "ru", 1.0, text) for text in ("a", "b", "c")]
+        for digest in digests:
+            await cache.put(digest, speech(100))
+
+        # Blob plus sidecar is a bit over 100 bytes: only two entries fit
+        assert await cache.evict() == 1
+
+        assert await make_cache(storage).get(digests[0]) is None
+        assert await make_cache(storage).get(digests[2]) is not None
+
+    @pytest.mark.asyncio
+    async def test_evict_expired(self, storage):
+        cache = make_cache(storage)
+        digest = tts_cache_key("openai", None, "ru", 1.0, "a")
+        entry = await cache.put(digest, speech())
+        later = datetime.utcnow() + timedelta(hours=2)
+
+        # The first sweep only unpublishes the entry; the next removes the blob
+        assert await cache.evict(now=later) == 1
+        assert await make_cache(storage).get(digest) is None
+        assert [obj.key for obj in await storage.list_objects(TTS_CACHE_PREFIX)] == [entry.audio_key]
+
+        assert await cache.evict(now=later) == 0
+        assert await storage.list_objects(TTS_CACHE_PREFIX) == []
+
+    @pytest.mark.asyncio
+    async def test_evict_skips_blobs_referenced_by_turns(self, storage):
+        referenced: set[str] = set()
+
+        async def lookup(keys: list[str]) -> set[str]:
+            return referenced.intersection(keys)
+
+        cache = make_cache(storage, max_bytes=0, referenced=lookup)
+        entry = await cache.put(tts_cache_key("openai", None, "ru", 1.0, "a"), speech())
+        referenced.add(entry.audio_key)
+        later = datetime.utcnow() + timedelta(days=60)
+
+        # Expired and over budget, but a turn still plays it back
+        assert await cache.evict(now=later) == 0
+        assert await cache.evict(now=later) == 0
+        assert await storage.get_object(entry.audio_key) == speech().audio
+
+        # Retention cleared the turn's reference
+        referenced.clear()
+        assert await cache.evict(now=later) == 1
+        await cache.evict(now=later)
+        assert await storage.list_objects(TTS_CACHE_PREFIX) == []
+
+    @pytest.mark.asyncio
+    async def test_blob_without_sidecar_is_kept_during_put(self, storage):
+        cache = make_cache(storage)
+        await storage.put_object(f"{TTS_CACHE_PREFIX}ab/abcd.mp3", b"\x01", "audio/mpeg")
+
+        assert await cache.evict() == 0
+        assert len(await storage.list_objects(TTS_CACHE_PREFIX)) == 1
+
+
+class TestGenerateResponseCaching:
+    """A repeated reply skips the provider and reuses the stored audio."""
+
+    @pytest.mark.asyncio
+    async def test_second_reply_is_a_hit(self, db, storage, monkeypatch):
+        from src.models.entities import Conversation, Turn, User
+        from src.services.voice_session import AdapterFactory, VoiceSessionService
+
+        adapter = FakeTTSAdapter(latency_ms=800)
+        monkeypatch.setattr(AdapterFactory, "get_tts_adapter", staticmethod(lambda provider: adapter))
+
+        user = User(name="u", email="u@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+        db.add(conversation)
+        await db.flush()
+        turns = [Turn(conversation_id=conversation.id, turn_number=n) for n in (1, 2)]
+        db.add_all(turns)
+        await db.flush()
+
+        service = VoiceSessionService(db, storage=storage, tts_cache=make_cache(storage))
+        await service.generate_response(conversation.id, turns[0].id, "Повторите, пожалуйста")
+        await service.generate_response(conversation.id, turns[1].id, "Повторите,  пожалуйста ")
+
+        assert adapter.calls == ["Повторите, пожалуйста"]
+        assert turns[0].audio_output_url == turns[1].audio_output_url
+        assert turns[0].tts_latency_ms == 800
+        assert turns[1].tts_latency_ms is None
@@ -0,0 +1,160 @@
+"""Tests for sentence-chunked streaming synthesis.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.5, 11.4**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.services.tts_streaming import split_sentences, synthesize_sentences
+from tests.conftest import FakeTTSAdapter
+
+
+REPLY = "Здравствуйте! Ваш заказ уже в пути и приедет завтра утром. Что-нибудь ещё?"
+
+
+class TestSplitSentences:
+    """Sentences cover the text in order."""
+
+    @given(st.lists(st.text(alphabet="абв ", min_size=1, max_size=30), min_size=1, max_size=6))
+    @settings(max_examples=100)
+    def test_chunks_cover_text(self, parts):
+        text = ". ".join(parts)
+        chunks = split_sentences(text)
+
+        assert all(chunk for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_short_sentences_are_merged(self):
+        assert split_sentences(REPLY) == [
+            "Здравствуйте! Ваш заказ уже в пути и приедет завтра утром.",
+            "Что-нибудь ещё?",
+        ]
+
+
+class TestSynthesizeSentences:
+    """Results come back in order with bounded concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_in_order(self):
+        adapter = FakeTTSAdapter(delay_per_char=0.001)
+        sentences = ["a" * 50, "b" * 10, "c" * 30, "d"]
+
+        results = [r.audio async for r in synthesize_sentences(adapter, sentences, max_concurrency=2)]
+
+        assert results == [s.encode() for s in sentences]
+        assert adapter.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_cancels_remaining(self):
+        adapter = FakeTTSAdapter(delay_per_char=0.001)
+        stream = synthesize_sentences(adapter, ["a", "b" * 500, "c" * 500], max_concurrency=1)
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert adapter.in_flight == 0
+        assert "c" * 500 not in adapter.calls
+
+
+async def make_turns(session_maker, count: int):
+    from src.models.entities import Conversation, Turn, User
+
+    async with session_maker() as db:
+        user = User(name="u", email="u@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+        db.add(conversation)
+        await db.flush()
+        turns = [Turn(conversation_id=conversation.id, turn_number=n + 1) for n in range(count)]
+        db.add_all(turns)
+        await db.commit()
+    return conversation.id, [turn.id for turn in turns]
+
+
+async def load_turn(session_maker, turn_id):
+    from src.models.entities import Turn
+
+    async with session_maker() as db:
+        return await db.get(Turn, turn_id)
+
+
+async def stream_reply(service, session_maker, conversation_id, turn_id, text, take=None):
+    """Stream a reply in its own request session, like the endpoint does."""
+    async with session_maker() as db:
+        service.db = db
+        stream = await service.stream_response(conversation_id, turn_id, text)
+    chunks = []
+    iterator = aiter(stream)
+    async for chunk in iterator:
+        chunks.append(chunk)
+        if len(chunks) == take:
+            # Client disconnect: the response closes the iterator
+            await iterator.aclose()
+            break
+    await stream.task
+    return chunks
+
+
+class TestStreamResponse:
+    """Streamed replies are stored on the turn and cached."""
+
+    @pytest.mark.asyncio
+    async def test_stream_then_cache_hit(self, session_maker, storage, monkeypatch):
+        from src.services.tts_cache import TTSCache
+        from src.services.voice_session import AdapterFactory, VoiceSessionService
+
+        adapter = FakeTTSAdapter(delay_per_char=0.001)
+        monkeypatch.setattr(AdapterFactory, "get_tts_adapter", staticmethod(lambda provider: adapter))
+        conversation_id, turn_ids = await make_turns(session_maker, 2)
+
+        cache = TTSCache(storage, memory_entries=8, ttl_seconds=3600, max_bytes=10**6, evict_interval_seconds=0)
+        service = VoiceSessionService(None, storage=storage, tts_cache=cache, session_maker=session_maker)
+
+        first = await stream_reply(service, session_maker, conversation_id, turn_ids[0], REPLY)
+        second = await stream_reply(service, session_maker, conversation_id, turn_ids[1], REPLY)
+        turns = [await load_turn(session_maker, turn_id) for turn_id in turn_ids]
+
+        assert len(first) == 2
+        assert second == [b"".join(first)]
+        assert len(adapter.calls) == 2
+        assert await storage.get_object(turns[0].audio_output_url) == b"".join(first)
+        assert turns[0].audio_output_url == turns[1].audio_output_url
+        assert turns[0].audio_output_duration_ms == 200
+        assert turns[0].tts_latency_ms is not None
+        assert turns[1].tts_latency_ms is None
+
+    @pytest.mark.asyncio
+    async def test_disconnect_mid_stream_still_stores_reply(self, session_maker, storage, monkeypatch):
+        from src.services.voice_session import AdapterFactory, VoiceSessionService
+
+        adapter = FakeTTSAdapter(delay_per_char=0.001)
+        monkeypatch.setattr(AdapterFactory, "get_tts_adapter", staticmethod(lambda provider: adapter))
+        conversation_id, (turn_id,) = await make_turns(session_maker, 1)
+        service = VoiceSessionService(None, storage=storage, tts_cache=None, session_maker=session_maker)
+        service.settings = service.settings.model_copy(update={"tts_cache_enabled": False})
+
+        # The client goes away after the first sentence
+        received = await stream_reply(service, session_maker, conversation_id, turn_id, REPLY, take=1)
+        turn = await load_turn(session_maker, turn_id)
+
+        assert len(received) == 1
+        assert turn.audio_output_url is not None
+        assert await storage.get_object(turn.audio_output_url) == b"".join(
+            sentence.encode() for sentence in split_sentences(REPLY)
+        )
+        assert turn.assistant_text == REPLY
+
+    @pytest.mark.asyncio
+    async def test_missing_turn(self, db, storage):
+        from src.services.voice_session import VoiceSessionService
+
+        with pytest.raises(ValueError):
+            await VoiceSessionService(db, storage=storage).stream_response("missing", "missing", REPLY)
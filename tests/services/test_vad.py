@@ -0,0 +1,178 @@
+"""Tests for voice activity detection before STT.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.4, 5.1**
+"""
+
+import io
+import math
+import random
+import struct
+import sys
+import wave
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.services import vad
+from src.services.vad import NoSpeechError, trim_silence
+from tests.conftest import FakeSTTAdapter
+
+RATE = 16000
+
+
+def make_wav(segments: list[tuple[str, int]], channels: int = 1) -> bytes:
+    """WAV of ("speech" | "silence", duration ms) segments: a tone over faint noise."""
+    rng = random.Random(0)
+    samples = array("h")
+    for kind, ms in segments:
+        for i in range(RATE * ms // 1000):
+            value = rng.randint(-40, 40)
+            if kind == "speech":
+                value += int(8000 * math.sin(2 * math.pi * 220 * i / RATE))
+            samples.extend([value] * channels)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    out = io.BytesIO()
+    with wave.open(out, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(RATE)
+        writer.writeframes(samples.tobytes())
+    return out.getvalue()
+
+
+def make_client_wav(segments: list[tuple[str, int]]) -> bytes:
+    """The same recording as the web client uploads it (encodeWav in hooks/useAudioRecorder.ts)."""
+    rng = random.Random(0)
+    samples = []
+    for kind, ms in segments:
+        for i in range(RATE * ms // 1000):
+            value = rng.uniform(-0.001, 0.001)
+            if kind == "speech":
+                value += 0.25 * math.sin(2 * math.pi * 220 * i / RATE)
+            samples.append(max(-1.0, min(1.0, value)))
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(samples) * 2, b"WAVE", b"fmt ", 16, 1, 1, RATE, RATE * 2, 2, 16, b"data", len(samples) * 2,
+    )
+    # DataView.setInt16 truncates towards zero
+    pcm = struct.pack(f"<{len(samples)}h", *(int(x * 0x8000 if x < 0 else x * 0x7FFF) for x in samples))
+    return header + pcm
+
+
+def duration_ms(audio: bytes) -> int:
+    with wave.open(io.BytesIO(audio)) as reader:
+        return reader.getnframes() * 1000 // reader.getframerate()
+
+
+class TestTrimSilence:
+    """Silence is dropped around speech and long pauses are shortened."""
+
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_trims_edges_and_pauses(self, channels):
+        audio = make_wav(
+            [("silence", 2000), ("speech", 1000), ("silence", 3000), ("speech", 800), ("silence", 2500)],
+            channels=channels,
+        )
+
+        result = trim_silence(audio, padding_ms=200, max_pause_ms=500)
+
+        assert result.analysed
+        assert result.original_ms == 9300
+        assert 1700 <= result.speech_ms <= 1900
+        # Speech + padding + one capped pause, well under the original
+        assert duration_ms(result.audio) == result.kept_ms
+        assert 2500 <= result.kept_ms <= 3300
+
+    def test_pure_python_matches_numpy(self, monkeypatch):
+        pytest.importorskip("numpy")
+        audio = make_wav([("silence", 1000), ("speech", 500), ("silence", 1000)])
+        expected = trim_silence(audio)
+
+        monkeypatch.setattr(vad, "np", None)
+
+        assert trim_silence(audio) == expected
+
+    def test_silence_has_no_speech(self):
+        result = trim_silence(make_wav([("silence", 2000)]))
+
+        assert result.analysed and result.speech_ms == 0 and result.kept_ms == 0
+
+    def test_continuous_speech_is_kept(self):
+        result = trim_silence(make_wav([("speech", 1500)]))
+
+        assert result.kept_ms == result.original_ms
+
+    @given(st.binary(max_size=200))
+    @settings(max_examples=200)
+    def test_other_formats_pass_through(self, data):
+        result = trim_silence(data)
+
+        assert result.analysed or result.audio == data
+
+
+class TestProcessAudioVAD:
+    """STT gets trimmed audio; storage keeps the original."""
+
+    @pytest.fixture
+    async def session(self, db, monkeypatch):
+        from src.adapters.router import RoutingDecision
+        from src.models.entities import Conversation, User
+        from src.services.voice_session import AdapterFactory
+
+        stt = FakeSTTAdapter(text="привет")
+        monkeypatch.setattr(AdapterFactory, "get_stt_adapter", staticmethod(lambda provider, allowed=None: stt))
+        monkeypatch.setattr(
+            AdapterFactory,
+            "route",
+            staticmethod(lambda kind, preferred, allowed=None: RoutingDecision(kind, preferred, preferred, "preferred")),
+        )
+
+        user = User(name="u", email="u@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+        db.add(conversation)
+        await db.flush()
+        return user, conversation, stt.audio
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encode", [make_wav, make_client_wav])
+    async def test_stt_gets_trimmed_audio(self, db, session, fake_storage, encode):
+        from sqlalchemy import select
+
+        from src.models.entities import Turn
+        from src.services.voice_session import VoiceSessionService
+
+        user, conversation, transcribed = session
+        audio = encode([("silence", 3000), ("speech", 1000), ("silence", 3000)])
+
+        result = await VoiceSessionService(db, storage=fake_storage).process_audio(conversation.id, audio, user.id)
+        turn = await db.scalar(select(Turn).where(Turn.id == result.turn_id))
+
+        assert fake_storage.uploads == [audio]
+        assert duration_ms(transcribed[0]) < 2000
+        assert turn.audio_input_duration_ms == 7000
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encode", [make_wav, make_client_wav])
+    async def test_silent_upload_is_rejected(self, db, session, fake_storage, encode):
+        from sqlalchemy import func, select
+
+        from src.models.entities import Turn
+        from src.services.voice_session import VoiceSessionService
+
+        user, conversation, transcribed = session
+
+        with pytest.raises(NoSpeechError):
+            await VoiceSessionService(db, storage=fake_storage).process_audio(
+                conversation.id, encode([("silence", 3000)]), user.id
+            )
+
+        assert transcribed == [] and fake_storage.uploads == []
+        assert await db.scalar(select(func.count()).select_from(Turn)) == 0
@@ -414,3 +414,233 @@ class TestDataPersistence:
         assert turn.id is not None
         assert turn.conversation_id == conversation.id
         assert turn.turn_number >= 1
+
+
+@pytest.mark.usefixtures("fake_storage")
+class TestTurnNumberAllocation:
+    """Turn numbers come from an atomic per-conversation counter.
+    
+    **Validates: Requirements 5.1**
+    """
+
+    @pytest.mark.asyncio
+    async def test_numbers_are_sequential_across_sessions(self, session_maker):
+        from src.models.entities import Conversation, User
+        from src.services.voice_session import VoiceSessionService
+
+        async with session_maker() as db:
+            user = User(name="u", email="u@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+            db.add(conversation)
+            await db.commit()
+
+        numbers = []
+        for _ in range(4):
+            # Separate database sessions, as for separate upload requests
+            async with session_maker() as db:
+                numbers.append(await VoiceSessionService(db)._next_turn_number(conversation.id))
+                await db.commit()
+
+        async with session_maker() as db:
+            found, language, _, _ = await VoiceSessionService(db)._load_turn_context(conversation.id, user.id)
+
+        assert numbers == [1, 2, 3, 4]
+        assert found and language == "ru"
+
+    @pytest.mark.asyncio
+    async def test_unknown_session(self, session_maker):
+        from src.services.voice_session import VoiceSessionService
+
+        async with session_maker() as db:
+            service = VoiceSessionService(db)
+            assert await service._load_turn_context(str(uuid.uuid4()), str(uuid.uuid4())) == (False, None, None, None)
+            assert await service._next_turn_number(str(uuid.uuid4())) is None
+
+    @pytest.mark.asyncio
+    async def test_duplicate_turn_number_rejected(self, session_maker):
+        from sqlalchemy.exc import IntegrityError
+
+        from src.models.entities import Conversation, Turn, User
+
+        async with session_maker() as db:
+            user = User(name="u", email="u@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+            db.add(conversation)
+            await db.flush()
+            db.add_all([
+                Turn(conversation_id=conversation.id, turn_number=1),
+                Turn(conversation_id=conversation.id, turn_number=1),
+            ])
+            with pytest.raises(IntegrityError):
+                await db.flush()
+
+
+@pytest.mark.usefixtures("fake_storage")
+class TestProcessAudioPersistence:
+    """process_audio inserts one complete turn and upserts unknown terms.
+    
+    **Validates: Requirements 4.5, 5.1, 5.2**
+    """
+
+    @pytest.mark.asyncio
+    async def test_turn_and_pending_terms(self, session_maker):
+        from sqlalchemy import select
+
+        from src.adapters.stt.base import STTResult
+        from src.models.entities import Conversation, Turn, User
+        from src.models.entities_ext import UnknownTerm
+        from src.services.voice_session import VoiceSessionService
+
+        async with session_maker() as db:
+            user = User(name="u", email="u@example.com", hashed_password="x", language="kk")
+            db.add(user)
+            await db.flush()
+            conversation = Conversation(user_id=user.id, stt_provider_used="google", tts_provider_used="openai")
+            db.add(conversation)
+            await db.commit()
+
+        for _ in range(2):
+            async with session_maker() as db:
+                service = VoiceSessionService(db)
+                # Normalization flags unknown words only below the confidence threshold
+                result = await service.process_audio(
+                    conversation.id, b"RIFF", user.id, stt_result=STTResult(text="Zzyx zzyx", confidence=0.1)
+                )
+                await db.commit()
+
+        async with session_maker() as db:
+            turns = (await db.execute(select(Turn).order_by(Turn.turn_number))).scalars().all()
+            terms = (await db.execute(select(UnknownTerm))).scalars().all()
+
+        assert [t.turn_number for t in turns] == [1, 2]
+        assert turns[-1].id == result.turn_id
+        assert turns[-1].audio_input_url.endswith("input.wav")
+        assert turns[-1].low_confidence is True
+        assert [(t.heard_variant, t.language, t.occurrence_count) for t in terms] == [("zzyx", "kk", 4)]
+        assert terms[0].context_examples == ["Zzyx zzyx"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("upsert", [True, False])
+    async def test_pending_terms_collect_context(self, session_maker, monkeypatch, upsert):
+        """Existing terms get new context appended, with or without ON CONFLICT."""
+        from sqlalchemy import select
+
+        from src.models.entities_ext import UnknownTerm
+        from src.services import normalization
+        from src.services.normalization import NormalizationService
+
+        if not upsert:
+            monkeypatch.setattr(normalization, "_UPSERT_INSERTS", {})
+
+        for variants, context in ((["зикс"], "первый"), (["зикс", "зикс"], "второй"), (["зикс"], "первый")):
+            async with session_maker() as db:
+                await NormalizationService(db).record_pending_terms(variants, language="ru", context=context)
+                await db.commit()
+
+        async with session_maker() as db:
+            term = await db.scalar(select(UnknownTerm))
+
+        assert term.occurrence_count == 4
+        assert term.context_examples == ["первый", "второй"]
+
+    @pytest.mark.asyncio
+    async def test_degraded_provider_is_routed_around(self, session_maker, monkeypatch):
+        from sqlalchemy import select
+
+        from src.adapters.registry import AdapterRegistry
+        from src.adapters.stt.base import STTRateLimitError
+        from src.config import Settings
+        from src.models.entities import Conversation, Turn, User
+        from src.services import voice_session
+        from src.services.voice_session import AdapterFactory, VoiceSessionService
+        from tests.conftest import FakeSTTAdapter
+
+        registry = AdapterRegistry(Settings(openai_api_key="sk-test", provider_http2=False))
+        registry.router.record("stt", "openai", None, STTRateLimitError("429", provider="openai"))
+        monkeypatch.setattr(voice_session, "get_adapter_registry", lambda: registry)
+        monkeypatch.setattr(
+            AdapterFactory, "get_stt_adapter", staticmethod(lambda provider, allowed=None: FakeSTTAdapter(provider))
+        )
+
+        async with session_maker() as db:
+            user = User(name="u", email="u@example.com", hashed_password="x", stt_provider="openai")
+            db.add(user)
+            await db.flush()
+            conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+            db.add(conversation)
+            await db.flush()
+
+            result = await VoiceSessionService(db).process_audio(conversation.id, b"RIFF", user.id)
+            turn = await db.scalar(select(Turn).where(Turn.id == result.turn_id))
+
+        assert result.raw_transcript == "google"
+        assert turn.stt_provider == "google"
+        assert registry.router.reroutes == {"stt:openai->google": 1}
+
+    @pytest.mark.asyncio
+    async def test_counter_is_not_taken_during_stt(self, session_maker, monkeypatch):
+        """The conversation row is only locked after the provider call."""
+        from sqlalchemy import select
+
+        from src.adapters.stt.base import STTResult
+        from src.models.entities import Conversation, User
+        from src.services.voice_session import AdapterFactory, VoiceSessionService
+
+        counters = []
+
+        async with session_maker() as db:
+            user = User(name="u", email="u@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+            db.add(conversation)
+            await db.flush()
+
+            class PeekingSTT:
+                async def transcribe(self, audio, language="ru", hints=None):
+                    counters.append(await db.scalar(
+                        select(Conversation.next_turn_number).where(Conversation.id == conversation.id)
+                    ))
+                    return STTResult(text="hello", confidence=0.9)
+
+            monkeypatch.setattr(AdapterFactory, "get_stt_adapter", staticmethod(lambda provider, allowed=None: PeekingSTT()))
+
+            await VoiceSessionService(db).process_audio(conversation.id, b"RIFF", user.id)
+            counter = await db.scalar(
+                select(Conversation.next_turn_number).where(Conversation.id == conversation.id)
+            )
+
+        assert counters == [1]
+        assert counter == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_still_records_turn(self, session_maker, fake_storage, monkeypatch):
+        from sqlalchemy import select
+
+        from src.adapters.stt.base import STTResult
+        from src.models.entities import Conversation, Turn, User
+        from src.services.voice_session import VoiceSessionService
+
+        async def failing_upload(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(fake_storage, "upload_audio", failing_upload)
+
+        async with session_maker() as db:
+            user = User(name="u", email="u@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            conversation = Conversation(user_id=user.id, stt_provider_used="openai", tts_provider_used="openai")
+            db.add(conversation)
+            await db.flush()
+
+            result = await VoiceSessionService(db).process_audio(
+                conversation.id, b"RIFF", user.id, stt_result=STTResult(text="hello", confidence=0.9)
+            )
+            turn = await db.scalar(select(Turn).where(Turn.id == result.turn_id))
+
+        assert turn.audio_input_url.endswith(f"turns/{turn.id}/input.wav")
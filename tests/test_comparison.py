@@ -29,6 +29,14 @@ class MockSTTAdapter(STTAdapter):
         )
 
 
+def _mock_adapters():
+    adapters = {
+        "openai": MockSTTAdapter("openai", "openai text"),
+        "google": MockSTTAdapter("google", "google text"),
+    }
+    return lambda provider, hedged=True, cached=True: adapters[provider]
+
+
 @pytest.mark.asyncio
 async def test_comparison_service_process_audio():
     # Setup mocks
@@ -44,18 +52,10 @@ async def test_comparison_service_process_audio():
     mock_storage.generate_signed_url = MagicMock(return_value="http://url/audio.wav")
 
     # Patch adapters
-    with patch("src.services.comparison.get_openai_adapter") as mock_get_openai, \
-         patch("src.services.comparison.get_google_adapter") as mock_get_google:
-
-        # Configure mock adapters to return our MockSTTAdapter class
-        # Note: The service instantiates the class returned by get_adapter()
-        # So we need mock_get_adapter() -> returns Class -> Class() returns instance
+    with patch("src.services.comparison.get_adapter_registry") as mock_get_registry:
 
-        mock_openai_class = MagicMock(return_value=MockSTTAdapter("openai", "openai text"))
-        mock_google_class = MagicMock(return_value=MockSTTAdapter("google", "google text"))
-
-        mock_get_openai.return_value = mock_openai_class
-        mock_get_google.return_value = mock_google_class
+        # Configure the registry to hand out our MockSTTAdapter instances
+        mock_get_registry.return_value.get_stt_adapter.side_effect = _mock_adapters()
 
         # Initialize service
         service = ComparisonService(mock_db, mock_storage)
@@ -112,14 +112,9 @@ async def test_comparison_service_process_audio_kazakh():
     mock_storage.upload_research_audio = AsyncMock(return_value="path/to/audio.wav")
     mock_storage.generate_signed_url = MagicMock(return_value="http://url/audio.wav")
 
-    with patch("src.services.comparison.get_openai_adapter") as mock_get_openai, \
-         patch("src.services.comparison.get_google_adapter") as mock_get_google:
-
-        mock_openai_class = MagicMock(return_value=MockSTTAdapter("openai", "openai text"))
-        mock_google_class = MagicMock(return_value=MockSTTAdapter("google", "google text"))
+    with patch("src.services.comparison.get_adapter_registry") as mock_get_registry:
 
-        mock_get_openai.return_value = mock_openai_class
-        mock_get_google.return_value = mock_google_class
+        mock_get_registry.return_value.get_stt_adapter.side_effect = _mock_adapters()
 
         service = ComparisonService(mock_db, mock_storage)
 